@@ -1,27 +1,38 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file
+from flask import Flask, render_template, request, redirect, url_for, flash, session, send_file, jsonify
+from flask import Response, stream_with_context
 from flask_bcrypt import Bcrypt
-from models import db, User, Resume, Feedback
+from models import db, User, Resume, Feedback, ResumeAnalysis, ResumeBlob
 from werkzeug.utils import secure_filename
-from modules.parser import extract_text, analyze_resume
 from io import BytesIO
+import io
+import csv
+import tempfile
 from openpyxl import Workbook
 import os
 import traceback
-from datetime import datetime
-from sqlalchemy import func
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER
-from reportlab.platypus import Image as RLImage
-from reportlab.platypus import Image as RLImage, PageBreak
-from reportlab.lib.styles import ParagraphStyle
+from datetime import datetime, timedelta
+from sqlalchemy import UniqueConstraint, func, insert, inspect, update
+from sqlalchemy.exc import IntegrityError
 from models import Course
 import json
-from modules.parser import extract_text_bytes
-import re
+from modules.roles import RoleScorer
+from modules.analysis import ANALYZER_VERSION, build_analyses, content_hash, extract_and_analyze
+from modules.jobs import AnalysisQueue
+from modules import analytics, assets, metrics
+from modules.catalog import ROADMAPS, iter_courses
+from modules.assets import AVAILABLE_ROADMAPS, MISSING as MISSING_ROADMAPS
+from modules.storage import create_blob_store
+from modules.ingest import IngestReport, MAX_ENTRY_BYTES, count_zip_entries, iter_source, iter_zip, mime_for
+from modules.matcher import MatcherIndex
+from modules.report import (
+    REPORT_FIELDS, ReportCache, build_report_pdf, report_fields, report_filename, report_fingerprint,
+)
+from modules.report_batch import ReportBatchStore
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+import click
 
 
 app = Flask(__name__)
@@ -41,274 +52,15 @@ def apply_cors(response):
 
 bcrypt = Bcrypt(app)
 
-# ---------------- ROADMAP DATA ----------------
-ROADMAPS = {
+# Per-route latency, queries per request, stage timings; served on /metrics
+metrics.init_app(app, token=os.environ.get("METRICS_TOKEN"))
 
-
-    'Data Science': {
-        'title': 'Data Science Roadmap',
-        'steps': [
-            'Learn Python and Statistics Fundamentals',
-            'Master Data Wrangling and Visualization with Pandas & Matplotlib',
-            'Understand Machine Learning Algorithms',
-            'Practice with Real-World Datasets (Kaggle)',
-            'Build and Deploy End-to-End Data Science Projects'
-        ],
-        'image': 'static/roadmaps/data_science_roadmap.png'
-    },
-
-    'Web Development': {
-        'title': 'Web Development Roadmap',
-        'steps': [
-            'Learn HTML, CSS, and JavaScript Basics',
-            'Understand Frontend Frameworks like React or Angular',
-            'Master Backend with Node.js, Django, or Flask',
-            'Work with Databases like MySQL or MongoDB',
-            'Deploy Full Stack Applications on Cloud Platforms'
-        ],
-        'image': 'static/roadmaps/web_development_roadmap.png'
-    },
-
-    'Android Development': {
-        'title': 'Android Development Roadmap',
-        'steps': [
-            'Learn Java or Kotlin for Android',
-            'Understand Android Studio and XML Layouts',
-            'Learn Android Jetpack Components and APIs',
-            'Integrate SQLite and Firebase for Data Management',
-            'Publish Your First App on Google Play Store'
-        ],
-        'image': 'static/roadmaps/android_development_roadmap.png'
-    },
-
-    'iOS Development': {
-        'title': 'iOS Development Roadmap',
-        'steps': [
-            'Learn Swift and Xcode IDE',
-            'Understand UIKit and SwiftUI Frameworks',
-            'Implement Core Data and API Networking',
-            'Build UI/UX for iOS Devices',
-            'Publish Your First App on Apple App Store'
-        ],
-        'image': 'static/roadmaps/ios_development_roadmap.png'
-    },
-
-    'UI/UX Design': {
-        'title': 'UI/UX Design Roadmap',
-        'steps': [
-            'Understand Design Thinking Process',
-            'Learn Wireframing and Prototyping with Figma/Adobe XD',
-            'Master Visual Design Principles',
-            'Test and Iterate User Experience Flows',
-            'Build a Professional UI/UX Design Portfolio'
-        ],
-        'image': 'static/roadmaps/ui_ux_design_roadmap.png'
-    },
-
-    'Data Analyst': {
-        'title': 'Data Analyst Roadmap',
-        'steps': [
-            'Learn Excel, SQL, and Power BI/Tableau',
-            'Understand Data Cleaning and Transformation',
-            'Master Data Visualization Tools',
-            'Learn Statistics and Basic Python Analysis',
-            'Work on Business-Oriented Dashboards and Reports'
-        ],
-        'image': 'static/roadmaps/data_analyst_roadmap.png'
-    },
-
-    'Cloud & DevOps': {
-        'title': 'Cloud & DevOps Roadmap',
-        'steps': [
-            'Learn Linux, Networking, and Shell Scripting',
-            'Understand Cloud Platforms (AWS, Azure, GCP)',
-            'Work with Docker and Kubernetes',
-            'Implement CI/CD Pipelines and Infrastructure as Code',
-            'Monitor and Optimize Deployments'
-        ],
-        'image': 'static/roadmaps/cloud___devops_roadmap.png'
-    },
-
-    'Cybersecurity': {
-        'title': 'Cybersecurity Roadmap',
-        'steps': [
-            'Understand Networking and Operating Systems',
-            'Learn Ethical Hacking Tools (Nmap, Burp Suite)',
-            'Master Security Concepts: Firewalls, Encryption, SIEM',
-            'Explore Vulnerability Management and Incident Response',
-            'Pursue CEH or CompTIA Security+ Certification'
-        ],
-        'image': 'static/roadmaps/cybersecurity_roadmap.png'
-    },
-
-    'Quality Assurance': {
-        'title': 'Quality Assurance Roadmap',
-        'steps': [
-            'Understand Software Testing Fundamentals',
-            'Learn Manual and Automated Testing (Selenium/Postman)',
-            'Master API and UI Testing Frameworks',
-            'Integrate Testing into CI/CD Pipelines',
-            'Explore QA Tools like JIRA and TestNG'
-        ],
-        'image': 'static/roadmaps/quality_assurance_roadmap.png'
-    },
-
-    'Business Analyst': {
-        'title': 'Business Analyst Roadmap',
-        'steps': [
-            'Learn Requirement Gathering and Documentation',
-            'Understand Agile and Scrum Methodologies',
-            'Develop Analytical Thinking and Communication Skills',
-            'Use Tools like Excel, JIRA, Power BI',
-            'Collaborate on Project Reports and Stakeholder Analysis'
-        ],
-        'image': 'static/roadmaps/business_analyst_roadmap.png'
-    },
-
-    'Database Administrator': {
-        'title': 'Database Administrator Roadmap',
-        'steps': [
-            'Learn SQL Fundamentals and Normalization',
-            'Understand Database Design and Modeling',
-            'Manage Backups, Recovery, and Performance Tuning',
-            'Work with Oracle, PostgreSQL, or MySQL',
-            'Secure and Monitor Database Systems'
-        ],
-        'image': 'static/roadmaps/database_administrator_roadmap.png'
-    },
-
-    'AI / NLP Engineer': {
-        'title': 'AI / NLP Engineer Roadmap',
-        'steps': [
-            'Understand NLP Fundamentals and Text Processing',
-            'Learn Machine Learning and Deep Learning Basics',
-            'Work with Transformers, BERT, and GPT Models',
-            'Use Libraries like Hugging Face and SpaCy',
-            'Deploy NLP Models into Production Environments'
-        ],
-        'image': 'static/roadmaps/ai__nlp_engineer_roadmap.png'
-    },
-
-    'Product Manager': {
-        'title': 'Product Manager Roadmap',
-        'steps': [
-            'Understand Product Lifecycle and Market Research',
-            'Develop Communication and Leadership Skills',
-            'Learn Agile and Scrum Frameworks',
-            'Use Tools like JIRA, Notion, and Trello',
-            'Work on Real Product Strategy and Launch Projects'
-        ],
-        'image': 'static/roadmaps/product_manager_roadmap.png'
-    },
-
-    'Python Developer': {
-        'title': 'Python Developer Roadmap',
-        'steps': [
-            'Learn Core Python and OOP',
-            'Master Django or Flask Frameworks',
-            'Work with REST APIs and Databases',
-            'Learn Testing and Deployment',
-            'Build Real-World Python Applications'
-        ],
-        'image': 'static/roadmaps/python_developer_roadmap.png'
-    },
-
-    'Java Developer': {
-        'title': 'Java Developer Roadmap',
-        'steps': [
-            'Master Core Java and OOP',
-            'Learn Spring and Spring Boot',
-            'Work with Hibernate and Microservices',
-            'Build Secure REST APIs',
-            'Deploy Java Applications to Cloud'
-        ],
-        'image': 'static/roadmaps/java_developer_roadmap.png'
-    },
-
-    'C/C++ Developer': {
-        'title': 'C/C++ Developer Roadmap',
-        'steps': [
-            'Learn C/C++ Fundamentals',
-            'Master Memory Management and Pointers',
-            'Understand STL and OOP Concepts',
-            'Practice Linux & OS-Level Programming',
-            'Build High-Performance Applications'
-        ],
-        'image': 'static/roadmaps/c_c___developer_roadmap.png'
-    },
-
-    '.NET Developer': {
-        'title': '.NET Developer Roadmap',
-        'steps': [
-            'Learn C# and .NET Basics',
-            'Master ASP.NET Core and MVC',
-            'Work with Entity Framework and LINQ',
-            'Build REST APIs with .NET',
-            'Deploy .NET Applications to Cloud'
-        ],
-        'image': 'static/roadmaps/_net_developer_roadmap.png'
-    },
-
-    'PHP Developer': {
-        'title': 'PHP Developer Roadmap',
-        'steps': [
-            'Learn Core PHP and OOP',
-            'Master Laravel Framework',
-            'Work with MySQL and REST APIs',
-            'Learn Authentication & Security',
-            'Deploy Scalable PHP Applications'
-        ],
-        'image': 'static/roadmaps/php_developer_roadmap.png'
-    },
-
-    'JavaScript Developer': {
-        'title': 'JavaScript Developer Roadmap',
-        'steps': [
-            'Master Core JavaScript and DOM',
-            'Understand Async JS and Event Loop',
-            'Learn TypeScript and ES6+ Features',
-            'Build Real Projects with JavaScript',
-            'Deploy JS Applications'
-        ],
-        'image': 'static/roadmaps/javascript_developer_roadmap.png'
-    },
-
-    'Full Stack Developer': {
-        'title': 'Full Stack Developer Roadmap',
-        'steps': [
-            'Learn Frontend (HTML, CSS, JS, React)',
-            'Master Backend (Node.js, Django, PHP)',
-            'Understand Databases (SQL/NoSQL)',
-            'Learn Git, API Design, Testing',
-            'Deploy Full Stack Applications'
-        ],
-        'image': 'static/roadmaps/full_stack_developer_roadmap.png'
-    },
-
-    'Backend Developer': {
-        'title': 'Backend Developer Roadmap',
-        'steps': [
-            'Learn Server-Side Languages',
-            'Build REST APIs and Microservices',
-            'Use Databases (SQL + NoSQL)',
-            'Master Authentication & Caching',
-            'Deploy and Scale Backend Systems'
-        ],
-        'image': 'static/roadmaps/backend_developer_roadmap.png'
-    },
-
-    'Frontend Developer': {
-        'title': 'Frontend Developer Roadmap',
-        'steps': [
-            'Master HTML, CSS, JavaScript',
-            'Learn React, Vue, or Angular',
-            'Build Responsive UI with Tailwind',
-            'Understand Web Performance & Accessibility',
-            'Deploy Frontend Apps'
-        ],
-        'image': 'static/roadmaps/frontend_developer_roadmap.png'
-    }
-}
+# Role skills, courses and roadmaps come from modules/catalog.py
+for _role in MISSING_ROADMAPS:
+    app.logger.warning("Roadmap image for %s not found; it is left out of pages and reports", _role)
+# Scale the report images once here instead of in the first report requests
+# (shared with the workers when gunicorn preloads the app)
+assets.preload()
 
 
 # ---------------- APP SETUP ---------------- #
@@ -329,340 +81,161 @@ app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 db.init_app(app)
 
-@app.route('/add_courses')
-def add_courses():
-    from models import Course
-
-    courses_data = {
-
-# ================================================================
-#  ROLES 
-# ================================================================
-
-'Data Science': [
-    ['Machine Learning Crash Course – Google (FREE)', 'https://developers.google.com/machine-learning/crash-course'],
-    ['Machine Learning – Andrew Ng', 'https://www.coursera.org/learn/machine-learning'],
-    ['Data Science Roadmap – freeCodeCamp (FREE)', 'https://youtu.be/X3paOmcrTjQ'],
-    ['Deep Learning Specialization – Andrew Ng', 'https://www.coursera.org/specializations/deep-learning'],
-    ['Python for Data Science – Coursera', 'https://www.coursera.org/learn/python-for-data-science'],
-    ['Data Scientist with Python – DataCamp', 'https://www.datacamp.com/tracks/data-scientist-with-python'],
-    ['Data Science Bootcamp – Udemy', 'https://www.udemy.com/course/data-science-and-machine-learning-bootcamp-with-python/'],
-    ['Statistics for Data Science – Udemy', 'https://www.udemy.com/course/statistics-for-data-science-and-business-analysis/'],
-    ['Intro to Machine Learning – Kaggle (FREE)', 'https://www.kaggle.com/learn/intro-to-machine-learning'],
-    ['AI for Everyone – Andrew Ng', 'https://www.coursera.org/learn/ai-for-everyone']
-],
-
-'Web Development': [
-    ['The Odin Project (FREE Full Stack)', 'https://www.theodinproject.com'],
-    ['HTML & CSS Crash Course – freeCodeCamp (FREE)', 'https://www.freecodecamp.org/learn/responsive-web-design/'],
-    ['JavaScript Full Course – freeCodeCamp (FREE)', 'https://youtu.be/jS4aFq5-91M'],
-    ['React – Codecademy', 'https://www.codecademy.com/learn/react-101'],
-    ['Node.js Crash Course – freeCodeCamp (FREE)', 'https://youtu.be/Oe421EPjeBE'],
-    ['Full Stack Web Dev – Udacity', 'https://www.udacity.com/course/full-stack-web-developer-nanodegree--nd0044'],
-    ['Django for Everyone – Coursera', 'https://www.coursera.org/specializations/django'],
-    ['Complete Web Dev Bootcamp – Udemy', 'https://www.udemy.com/course/the-complete-web-development-bootcamp/'],
-    ['Next.js Full Tutorial – freeCodeCamp (FREE)', 'https://youtu.be/Y6KDk5iyrYE'],
-    ['Frontend Developer Roadmap – Roadmap.sh (FREE)', 'https://roadmap.sh/frontend']
-],
-
-'Android Development': [
-    ['Android Basics by Google (FREE)', 'https://www.udacity.com/course/android-basics--nd803'],
-    ['Android Kotlin Developer – Udacity', 'https://www.udacity.com/course/android-kotlin-developer-nanodegree--nd940'],
-    ['Android Studio Masterclass – Udemy', 'https://www.udemy.com/course/android-oreo-kotlin-app-masterclass/'],
-    ['Kotlin Bootcamp – Google (FREE)', 'https://developer.android.com/courses/android-basics-kotlin/course'],
-    ['Flutter Full Course – freeCodeCamp (FREE)', 'https://youtu.be/VPvVD8t02U8'],
-    ['Jetpack Compose Tutorial – Google', 'https://developer.android.com/jetpack/compose'],
-    ['Android App Development Specialization – Coursera', 'https://www.coursera.org/specializations/android-app-development'],
-    ['Flutter & Dart Bootcamp – Udemy', 'https://www.udemy.com/course/flutter-dart-the-complete-flutter-app-development-course/'],
-    ['Kotlin Essentials – JetBrains (FREE)', 'https://play.kotlinlang.org/koans/overview'],
-    ['Android Clean Architecture Course', 'https://youtu.be/EOfCEhWq8sg']
-],
-
-'iOS Development': [
-    ['Swift Full Course – freeCodeCamp (FREE)', 'https://youtu.be/comQ1-x2a1Q'],
-    ['SwiftUI Essentials – Apple', 'https://developer.apple.com/tutorials/swiftui'],
-    ['iOS & Swift Bootcamp – Udemy', 'https://www.udemy.com/course/ios-13-app-development-bootcamp/'],
-    ['Become an iOS Developer – Udacity', 'https://www.udacity.com/course/ios-developer-nanodegree--nd003'],
-    ['Swift Programming – Codecademy', 'https://www.codecademy.com/learn/learn-swift'],
-    ['Swift Specialization – Coursera', 'https://www.coursera.org/specializations/app-development'],
-    ['Objective-C Crash Course – Udemy', 'https://www.udemy.com/course/objectivec/'],
-    ['iOS App Architecture – Udemy', 'https://www.udemy.com/course/ios-architecture/'],
-    ['SwiftUI Masterclass', 'https://www.udemy.com/course/swiftui-masterclass-course-ios-development-with-swift/'],
-    ['Intro to iOS App Development – LinkedIn', 'https://www.linkedin.com/learning/topics/ios']
-],
-
-'UI/UX Design': [
-    ['Google UX Design Certificate', 'https://www.coursera.org/professional-certificates/google-ux-design'],
-    ['Figma Full Course – FreeCodeCamp (FREE)', 'https://youtu.be/jwCt4DCa2Ek'],
-    ['UI/UX Specialization – Coursera', 'https://www.coursera.org/specializations/ui-ux-design'],
-    ['Adobe XD Full Course – Free (YouTube)', 'https://youtu.be/68w2VwalD5w'],
-    ['UX Design for Beginners – Udemy', 'https://www.udemy.com/course/ux-design-fundamentals/'],
-    ['Design Thinking – Coursera', 'https://www.coursera.org/learn/uva-darden-design-thinking-innovation'],
-    ['UI Design Principles – Udemy', 'https://www.udemy.com/course/design-rules/'],
-    ['UX Research at Scale – Coursera', 'https://www.coursera.org/learn/ux-research-at-scale'],
-    ['Interaction Design Foundation Courses', 'https://www.interaction-design.org/courses'],
-    ['Become a UX Designer – Udacity', 'https://www.udacity.com/course/ux-designer-nanodegree--nd578']
-],
-
-'Data Analyst': [
-    ['Google Data Analytics Certificate', 'https://www.coursera.org/professional-certificates/google-data-analytics'],
-    ['Excel to MySQL – Coursera', 'https://www.coursera.org/specializations/excel-mysql'],
-    ['Data Analyst with Python – DataCamp', 'https://www.datacamp.com/tracks/data-analyst-with-python'],
-    ['Power BI Full Course – freeCodeCamp (FREE)', 'https://youtu.be/0tAzpi3fXw4'],
-    ['Tableau Training – Udemy', 'https://www.udemy.com/course/tableau10/'],
-    ['Statistics for Data Analysis – Udemy', 'https://www.udemy.com/course/statistics-for-data-science-and-business-analysis/'],
-    ['Pandas Tutorial – freeCodeCamp (FREE)', 'https://youtu.be/vmEHCJofslg'],
-    ['SQL for Data Analysis – Coursera', 'https://www.coursera.org/specializations/data-analysis-sql'],
-    ['Excel Essential Training – LinkedIn', 'https://www.linkedin.com/learning/excel-essential-training-2019'],
-    ['Data Analytics Bootcamp – Udemy', 'https://www.udemy.com/course/data-analytics-real-world-projects/']
-],
-
-'Cloud & DevOps': [
-    ['AWS Cloud Practitioner (FREE)', 'https://www.aws.training/Details/eLearning?id=60697'],
-    ['Docker + Kubernetes – Udemy', 'https://www.udemy.com/course/docker-and-kubernetes-the-complete-guide/'],
-    ['Terraform for Beginners', 'https://learn.hashicorp.com/collections/terraform/aws-get-started'],
-    ['Azure DevOps Tutorial – Microsoft', 'https://learn.microsoft.com/en-us/training/modules/introduction-to-devops/'],
-    ['DevOps Foundations – LinkedIn', 'https://www.linkedin.com/learning/devops-foundations'],
-    ['Linux Administration – Udemy', 'https://www.udemy.com/course/linux-admin-bootcamp/'],
-    ['GCP Associate Cloud Engineer – Coursera', 'https://www.coursera.org/professional-certificates/gcp-cloud-engineering'],
-    ['Kubernetes Bootcamp – FreeCodeCamp (FREE)', 'https://youtu.be/X48VuDVv0do'],
-    ['Jenkins Full Course – Udemy', 'https://www.udemy.com/course/jenkins-from-zero-to-hero/'],
-    ['Ansible for Beginners – Udemy', 'https://www.udemy.com/course/ansible-for-the-absolute-beginner/']
-],
-
-'Cybersecurity': [
-    ['Intro to Cybersecurity – Cisco', 'https://www.netacad.com/courses/cybersecurity/introduction-cybersecurity'],
-    ['Google Cybersecurity Certificate', 'https://www.coursera.org/professional-certificates/google-cybersecurity'],
-    ['Ethical Hacking – CEH Prep', 'https://www.eccouncil.org/train-certify/certified-ethical-hacker-ceh/'],
-    ['Cybersecurity Full Course – FreeCodeCamp (FREE)', 'https://youtu.be/3Kq1MIfTWCE'],
-    ['Kali Linux Beginner Course', 'https://www.udemy.com/course/ethical-hacking-beginners/'],
-    ['Network Security – LinkedIn', 'https://www.linkedin.com/learning/topics/network-security'],
-    ['Burp Suite Course – Udemy', 'https://www.udemy.com/course/burp-suite-mastering-bug-bounty/'],
-    ['Pentesting with Nmap – Udemy', 'https://www.udemy.com/course/nmap-complete-guide/'],
-    ['Intro to Cryptography – Coursera', 'https://www.coursera.org/learn/cryptography'],
-    ['Malware Analysis – Udemy', 'https://www.udemy.com/course/malware-analysis/']
-],
-
-'Quality Assurance': [
-    ['Manual Testing Complete Course – Udemy', 'https://www.udemy.com/course/manual-testing-with-tutorial/'],
-    ['Selenium with Python – Udemy', 'https://www.udemy.com/course/selenium-webdriver-with-python/'],
-    ['Cypress Automation Course – Udemy', 'https://www.udemy.com/course/cypress-tutorial/'],
-    ['API Testing with Postman – Udemy', 'https://www.udemy.com/course/postman-the-complete-guide/'],
-    ['QA Testing Full Course – freeCodeCamp (FREE)', 'https://youtu.be/XkW6OVv1kwA'],
-    ['JIRA Crash Course – LinkedIn', 'https://www.linkedin.com/learning/jira-service-management'],
-    ['Automation Testing Bootcamp – Coursera', 'https://www.coursera.org/specializations/automated-software-testing'],
-    ['Unit Testing in Python – Udemy', 'https://www.udemy.com/course/python-unit-testing-automation/'],
-    ['Test Automation University (FREE)', 'https://testautomationu.applitools.com/'],
-    ['Bug Tracking & Reporting Course', 'https://www.udemy.com/course/bug-reporting/']
-],
-
-'Business Analyst': [
-    ['BA Fundamentals – Udemy', 'https://www.udemy.com/course/business-analysis-fundamentals/'],
-    ['Agile Business Analysis – Coursera', 'https://www.coursera.org/learn/agile-business-analyst'],
-    ['Business Analytics Specialization – Coursera', 'https://www.coursera.org/specializations/business-analytics'],
-    ['Excel for Business Analysts – Coursera', 'https://www.coursera.org/learn/excel-data-analysis'],
-    ['JIRA for Business Analysts – Udemy', 'https://www.udemy.com/course/jira-agile-project-management/'],
-    ['Project Management Essentials – LinkedIn', 'https://www.linkedin.com/learning/project-management-foundations'],
-    ['Requirement Engineering – Udemy', 'https://www.udemy.com/course/requirements-engineering/'],
-    ['Business Communication – Coursera', 'https://www.coursera.org/specializations/business-communication'],
-    ['Data Analytics for Business – Udemy', 'https://www.udemy.com/course/business-data-science/'],
-    ['SDLC Complete Guide – Udemy', 'https://www.udemy.com/course/software-development-life-cycle/']
-],
-
-'Database Administrator': [
-    ['PostgreSQL Masterclass – Udemy', 'https://www.udemy.com/course/postgresql-database-administration/'],
-    ['SQL for Data Engineering – Coursera', 'https://www.coursera.org/learn/data-eng-sql'],
-    ['MySQL Complete Course – freeCodeCamp (FREE)', 'https://youtu.be/7S_tz1z_5bA'],
-    ['Oracle SQL Admin – Udemy', 'https://www.udemy.com/course/oracle-sql-database-administration/'],
-    ['DBMS Full Course – Gate Smashers (FREE)', 'https://youtu.be/4xCynWHbn8w'],
-    ['PL/SQL Bootcamp – Udemy', 'https://www.udemy.com/course/oracle-plsql-programming/'],
-    ['Database Design Course – Coursera', 'https://www.coursera.org/learn/database-design'],
-    ['SQL Server Training – LinkedIn', 'https://www.linkedin.com/learning/learning-sql-server'],
-    ['Normalization & DB Design – Udemy', 'https://www.udemy.com/course/database-design-and-management/'],
-    ['NoSQL Essentials – Coursera', 'https://www.coursera.org/learn/nosql-databases']
-],
-
-'AI / NLP Engineer': [
-    ['NLP Specialization – Coursera', 'https://www.coursera.org/specializations/nlp'],
-    ['HuggingFace Transformers Course (FREE)', 'https://huggingface.co/course/chapter1'],
-    ['Deep Learning for NLP – Udemy', 'https://www.udemy.com/course/nlp-natural-language-processing-with-python/'],
-    ['BERT & GPT Hands-on – Udemy', 'https://www.udemy.com/course/bert-transformers-nlp/'],
-    ['Speech Recognition – Coursera', 'https://www.coursera.org/learn/audio-processing'],
-    ['Intro to NLP – freeCodeCamp (FREE)', 'https://youtu.be/fNxaJsNG3-s'],
-    ['Natural Language Processing – Stanford', 'http://web.stanford.edu/class/cs224n/'],
-    ['Transformers in Python – YouTube', 'https://youtu.be/tiuPHWB1gkA'],
-    ['AI for Everyone – Coursera', 'https://www.coursera.org/learn/ai-for-everyone'],
-    ['Neural Networks – Coursera', 'https://www.coursera.org/learn/neural-networks-deep-learning']
-],
-
-'Product Manager': [
-    ['Digital Product Management – Coursera', 'https://www.coursera.org/learn/uva-darden-digital-product-management'],
-    ['Product Management 101 – Udemy', 'https://www.udemy.com/course/product-management-101/'],
-    ['Agile Product Owner Role – LinkedIn', 'https://www.linkedin.com/learning/agile-product-owner-role'],
-    ['Product Strategy – Coursera', 'https://www.coursera.org/learn/product-strategy'],
-    ['Product Management Crash Course (FREE)', 'https://youtu.be/sJ14cWjrNzs'],
-    ['Roadmapping for PMs – Udemy', 'https://www.udemy.com/course/product-roadmaps/'],
-    ['Business Strategy – Coursera', 'https://www.coursera.org/specializations/business-strategy'],
-    ['User Story Writing – Udemy', 'https://www.udemy.com/course/user-story/'],
-    ['Notion for Productivity – YouTube', 'https://youtu.be/pvJScuVF4TU'],
-    ['PM Interview Prep – Udemy', 'https://www.udemy.com/course/product-management-interview-crash-course/']
-],
-
-
-'Python Developer': [
-    ['Python for Everybody – Coursera', 'https://www.coursera.org/specializations/python'],
-    ['Automate the Boring Stuff (FREE)', 'https://automatetheboringstuff.com/'],
-    ['Django Full Course – freeCodeCamp (FREE)', 'https://youtu.be/F5mRW0jo-U4'],
-    ['FastAPI Full Course (FREE)', 'https://youtu.be/0sOvCWFmrtA'],
-    ['Python OOP – Udemy', 'https://www.udemy.com/course/python-object-oriented-programming/'],
-    ['Python Bootcamp – Udemy', 'https://www.udemy.com/course/complete-python-bootcamp/'],
-    ['Flask Web Development – Udemy', 'https://www.udemy.com/course/python-and-flask-bootcamp/'],
-    ['Data Structures in Python – Udemy', 'https://www.udemy.com/course/python-data-structures-and-algorithms/'],
-    ['Asyncio in Python – YouTube', 'https://youtu.be/3mbFky5M6dM'],
-    ['Build APIs with Django – Coursera', 'https://www.coursera.org/projects/django-rest-framework']
-],
-
-'Java Developer': [
-    ['Java Programming Masterclass – Udemy', 'https://www.udemy.com/course/java-the-complete-java-developer-course/'],
-    ['Java Full Course – freeCodeCamp (FREE)', 'https://youtu.be/A74TOX803D0'],
-    ['Spring Boot Full Course – Amigoscode (FREE)', 'https://youtu.be/9SGDpanrc8U'],
-    ['Hibernate Tutorial – Udemy', 'https://www.udemy.com/course/hibernate-course/'],
-    ['Java OOP Mastery – Udemy', 'https://www.udemy.com/course/java-object-oriented-programming/'],
-    ['Spring Security – Udemy', 'https://www.udemy.com/course/spring-security-core-beginner-to-guru/'],
-    ['Java Servlets & JSP – Udemy', 'https://www.udemy.com/course/jsp-servlet-free-course/'],
-    ['Microservices with Spring – Udemy', 'https://www.udemy.com/course/microservices-with-spring-boot/'],
-    ['DSA in Java – Coding Ninjas', 'https://www.codingninjas.com/courses/data-structures-and-algorithms-java'],
-    ['Java Multithreading – YouTube', 'https://youtu.be/h-T7XmyIHDE']
-],
-
-'C/C++ Developer': [
-    ['C Programming Full Course – freeCodeCamp (FREE)', 'https://youtu.be/KJgsSFOSQv0'],
-    ['C++ Full Course – freeCodeCamp (FREE)', 'https://youtu.be/8jLOx1hD3_o'],
-    ['Mastering Data Structures in C++ – Udemy', 'https://www.udemy.com/course/datastructurescncpp/'],
-    ['Advanced C++ – Udemy', 'https://www.udemy.com/course/advanced-c-programming/'],
-    ['Linux System Programming – Udemy', 'https://www.udemy.com/course/linux-system-programming-techniques/'],
-    ['Pointers in C – Udemy', 'https://www.udemy.com/course/c-pointers/'],
-    ['Competitive Programming in C++ – Codeforces', 'https://codeforces.com/edu'],
-    ['STL in C++ – YouTube', 'https://youtu.be/PwS4LlQ2kZQ'],
-    ['Operating Systems – Neso Academy (FREE)', 'https://youtu.be/_TpOHMCODXo'],
-    ['C++ OOP Course – Udemy', 'https://www.udemy.com/course/cpp-classes/']
-],
-
-'.NET Developer': [
-    ['C# Basics Tutorial – freeCodeCamp (FREE)', 'https://youtu.be/GhQdlIFylQ8'],
-    ['ASP.NET Core MVC Full Course – YouTube', 'https://youtu.be/BfEjDD8mWYg'],
-    ['Entity Framework Core – Pluralsight', 'https://www.pluralsight.com/courses/entity-framework-core-getting-started'],
-    ['C# Masterclass – Udemy', 'https://www.udemy.com/course/csharp-tutorial-for-beginners/'],
-    ['.NET API Development – Udemy', 'https://www.udemy.com/course/build-restful-apis-with-aspnet-core/'],
-    ['LINQ Tutorial – Microsoft', 'https://learn.microsoft.com/en-us/dotnet/csharp/programming-guide/concepts/linq/'],
-    ['Microservices with .NET – Udemy', 'https://www.udemy.com/course/microservices-architecture-and-implementation-on-dotnet/'],
-    ['Blazor WebAssembly Course', 'https://learn.microsoft.com/en-us/aspnet/core/blazor'],
-    ['ASP.NET Razor Pages – Udemy', 'https://www.udemy.com/course/aspnet-core-razor-pages/'],
-    ['Clean Architecture in .NET – YouTube', 'https://youtu.be/fJjKQla-PgM']
-],
-
-'PHP Developer': [
-    ['PHP Full Course – freeCodeCamp (FREE)', 'https://youtu.be/OK_JCtrrv-c'],
-    ['Laravel From Scratch – Laracasts', 'https://laracasts.com/series/laravel-8-from-scratch'],
-    ['PHP with MySQL – Udemy', 'https://www.udemy.com/course/php-for-complete-beginners-includes-msql-object-oriented/'],
-    ['Object-Oriented PHP – Udemy', 'https://www.udemy.com/course/php-oop-object-oriented-programming/'],
-    ['Laravel REST API Course – YouTube', 'https://youtu.be/MT-GJQIY3EU'],
-    ['PHP Security Crash Course', 'https://www.udemy.com/course/php-security/'],
-    ['PHP MVC Framework Course', 'https://youtu.be/6ERdu4k62wI'],
-    ['PHP Deployment – Udemy', 'https://www.udemy.com/course/deploy-php-app/'],
-    ['MySQL Masterclass – Udemy', 'https://www.udemy.com/course/the-complete-sql-bootcamp/'],
-    ['Laravel Livewire Course', 'https://laravel-livewire.com/docs/2.x/quickstart']
-],
-
-'JavaScript Developer': [
-    ['JavaScript Full Course – freeCodeCamp (FREE)', 'https://youtu.be/HD13eq_Pmp8'],
-    ['Async JavaScript Mastery – Udemy', 'https://www.udemy.com/course/asynchronous-javascript/'],
-    ['JavaScript DOM Mastery – YouTube', 'https://youtu.be/0ik6X4DJKCc'],
-    ['JavaScript Algorithms – freeCodeCamp (FREE)', 'https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/'],
-    ['TypeScript Full Course – freeCodeCamp (FREE)', 'https://youtu.be/30LWjhZzg50'],
-    ['Modern JavaScript Bootcamp – Udemy', 'https://www.udemy.com/course/javascript-beginners-complete-tutorial/'],
-    ['JavaScript Design Patterns – Udemy', 'https://www.udemy.com/course/learn-javascript-design-patterns/'],
-    ['ES6+ Modern JavaScript – Udemy', 'https://www.udemy.com/course/understand-javascript/'],
-    ['Event Loop & Async Deep Dive – YouTube', 'https://youtu.be/8aGhZQkoFbQ'],
-    ['Promises & Async/Await – MDN', 'https://developer.mozilla.org/en-US/docs/Learn/JavaScript/Asynchronous']
-],
-
-'Full Stack Developer': [
-    ['Full Stack Web Dev – Coursera', 'https://www.coursera.org/specializations/full-stack-mobile-app-development'],
-    ['MERN Stack Full Course – freeCodeCamp (FREE)', 'https://youtu.be/7CqJlxBYj-M'],
-    ['MEAN Stack Bootcamp – Udemy', 'https://www.udemy.com/course/full-stack-web-development-mega-pack/'],
-    ['System Design for Beginners – YouTube', 'https://youtu.be/l5zn6mP5uY8'],
-    ['Git & GitHub Bootcamp – Udemy', 'https://www.udemy.com/course/git-complete/'],
-    ['Backend Roadmap – Roadmap.sh (FREE)', 'https://roadmap.sh/backend'],
-    ['Frontend Roadmap – Roadmap.sh (FREE)', 'https://roadmap.sh/frontend'],
-    ['Docker for Developers – Udemy', 'https://www.udemy.com/course/docker-mastery/'],
-    ['APIs for Developers – LinkedIn', 'https://www.linkedin.com/learning/apis-for-developers'],
-    ['Full Stack Project Bootcamp – Udemy', 'https://www.udemy.com/course/100-days-of-web-development/']
-],
-
-'Software Engineer': [
-    ['DSA Specialization – Coursera', 'https://www.coursera.org/specializations/data-structures-algorithms'],
-    ['Cracking the Coding Interview Prep – Udemy', 'https://www.udemy.com/course/cracking-the-coding-interview/'],
-    ['Clean Code – Udemy', 'https://www.udemy.com/course/clean-code/'],
-    ['System Design Primer – freeCodeCamp (FREE)', 'https://youtu.be/UzLMhqg3_Wc'],
-    ['Object-Oriented Design – Coursera', 'https://www.coursera.org/learn/object-oriented-design'],
-    ['Design Patterns – Udemy', 'https://www.udemy.com/course/design-patterns-python/'],
-    ['Algorithms – MIT OpenCourseWare (FREE)', 'https://ocw.mit.edu/courses/6-006-introduction-to-algorithms-fall-2011/'],
-    ['Competitive Programming – CodeChef', 'https://www.codechef.com/learn/dsa'],
-    ['Problem Solving – HackerRank (FREE)', 'https://www.hackerrank.com/domains/algorithms'],
-    ['Software Engineering Essentials – Coursera', 'https://www.coursera.org/specializations/software-engineering']
-],
-
-'ML Engineer': [
-    ['MLOps Specialization – Coursera', 'https://www.coursera.org/specializations/mlops'],
-    ['TensorFlow in Practice – Coursera', 'https://www.coursera.org/specializations/tensorflow-in-practice'],
-    ['Feature Engineering – Coursera', 'https://www.coursera.org/learn/feature-engineering'],
-    ['ML Engineer Nanodegree – Udacity', 'https://www.udacity.com/course/machine-learning-engineer-nanodegree--nd009t'],
-    ['MLOps Bootcamp – Udemy', 'https://www.udemy.com/course/mlops-bootcamp/'],
-    ['Model Deployment Tutorial – YouTube', 'https://youtu.be/ay2C1hRPD00'],
-    ['ML System Design – YouTube', 'https://youtu.be/bP7mB6X1RZk'],
-    ['Kubeflow for MLOps – Coursera', 'https://www.coursera.org/projects/kubeflow-pipelines'],
-    ['Machine Learning with TensorFlow – Udemy', 'https://www.udemy.com/course/machinelearning/'],
-    ['Deep Learning Specialization', 'https://www.coursera.org/specializations/deep-learning']
-],
-
-'Backend Developer': [
-    ['Backend Development Roadmap – Roadmap.sh (FREE)', 'https://roadmap.sh/backend'],
-    ['REST API Crash Course – freeCodeCamp (FREE)', 'https://youtu.be/Q-BpqyOT3a8'],
-    ['Redis Crash Course – YouTube', 'https://youtu.be/Hbt56gFj998'],
-    ['Authentication & JWT – Net Ninja', 'https://youtu.be/7Q17ubqLfaM'],
-    ['Microservices Architecture – Udemy', 'https://www.udemy.com/course/microservices-with-node-js-and-react/'],
-    ['Node.js Backend Masterclass – Udemy', 'https://www.udemy.com/course/nodejs-the-complete-guide/'],
-    ['PostgreSQL Full Course – freeCodeCamp (FREE)', 'https://youtu.be/qw--VYLpxG4'],
-    ['API Rate Limiting & Caching – YouTube', 'https://youtu.be/jKdCmhVxD0E'],
-    ['Backend System Design – YouTube', 'https://youtu.be/hhAo4ZD3ou8'],
-    ['NGINX Essentials – Udemy', 'https://www.udemy.com/course/nginx-crash-course/']
-],
-
-'Frontend Developer': [
-    ['Frontend Development Roadmap – Roadmap.sh (FREE)', 'https://roadmap.sh/frontend'],
-    ['HTML/CSS Full Course – freeCodeCamp (FREE)', 'https://youtu.be/kUMe1FH4CHE'],
-    ['JavaScript Full Course – freeCodeCamp (FREE)', 'https://youtu.be/HD13eq_Pmp8'],
-    ['ReactJS Full Course – freeCodeCamp (FREE)', 'https://youtu.be/bMknfKXIFA8'],
-    ['Tailwind CSS Mastery – YouTube', 'https://youtu.be/pfaSUYaSgRo'],
-    ['CSS Flexbox & Grid – Scrimba (FREE)', 'https://scrimba.com/learn/flexbox'],
-    ['Vue.js Crash Course – YouTube', 'https://youtu.be/FXpIoQ_rT_c'],
-    ['Frontend Nanodegree – Udacity', 'https://www.udacity.com/course/front-end-web-developer-nanodegree--nd0011'],
-    ['Web Accessibility Course – Udacity', 'https://www.udacity.com/course/web-accessibility--ud891'],
-    ['UI Design for Developers – Udemy', 'https://www.udemy.com/course/ui-design-for-developers/']
-]
-
-}
-
+# ---------------- SCHEMA UPGRADE ---------------- #
+def upgrade_schema():
+    """
+    Bring an existing database up to models.py without a migration tool:
+    create missing tables, ADD COLUMN for missing columns (added nullable,
+    like every column introduced since the first release), and create missing
+    indexes and unique constraints, dropping duplicate rows a new unique
+    constraint would reject. Safe to run repeatedly; returns the statements run.
+    """
+    db.create_all()
+    preparer = db.engine.dialect.identifier_preparer
+    inspector = inspect(db.engine)
+    statements = []
+
+    def run(conn, sql):
+        conn.exec_driver_sql(sql)
+        statements.append(sql)
+
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            name = preparer.quote(table.name)
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=db.engine.dialect)
+                    run(conn, f"ALTER TABLE {name} ADD COLUMN {preparer.quote(column.name)} {column_type}")
+            if table.name == 'resume' and 'blob_hash' in existing:
+                # resume.blob_hash (the blob key before content_hash took that role) is
+                # no longer written; move its values over and clear its foreign key
+                if conn.exec_driver_sql("SELECT 1 FROM resume WHERE blob_hash IS NOT NULL LIMIT 1").first():
+                    run(conn, "UPDATE resume SET content_hash = blob_hash, blob_hash = NULL "
+                              "WHERE blob_hash IS NOT NULL")
+
+            indexed = {index['name'] for index in inspector.get_indexes(table.name)}
+            indexed |= {constraint['name'] for constraint in inspector.get_unique_constraints(table.name)}
+            wanted = [(index.name, index.unique, index.columns) for index in table.indexes]
+            wanted += [
+                (constraint.name, True, constraint.columns)
+                for constraint in table.constraints
+                if isinstance(constraint, UniqueConstraint) and constraint.name
+            ]
+            for index_name, unique, columns in wanted:
+                if index_name in indexed:
+                    continue
+                column_list = ", ".join(preparer.quote(column.name) for column in columns)
+                if unique and 'id' in table.c:
+                    run(conn, f"DELETE FROM {name} WHERE id NOT IN "
+                              f"(SELECT MIN(id) FROM {name} GROUP BY {column_list})")
+                run(conn, f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS "
+                          f"{preparer.quote(index_name)} ON {name} ({column_list})")
+    return statements
+
+
+@app.cli.command('upgrade-schema')
+def upgrade_schema_command():
+    """Add the tables, columns and indexes an older database is missing."""
+    statements = upgrade_schema()
+    for sql in statements:
+        click.echo(sql)
+    click.echo(f"Ran {len(statements)} statement(s)." if statements else "Schema is up to date.")
+
+
+# ---------------- BACKGROUND ANALYSIS ---------------- #
+# ANALYSIS_ASYNC=0 analyzes inside the upload request (old behaviour)
+app.config['ANALYSIS_ASYNC'] = os.environ.get("ANALYSIS_ASYNC", "1") == "1"
+ANALYSIS_QUEUE = AnalysisQueue(
+    threads=int(os.environ.get("ANALYSIS_THREADS", 2)),
+    processes=int(os.environ.get("ANALYSIS_PROCESSES", 2)),
+    initializer=assets.preload,   # batch reports render in the pool too
+)
+# Pending jobs older than this with no live worker are queued again
+ANALYSIS_STALE_SECONDS = 300
+
+# ---------------- COURSE SEEDING ---------------- #
+def _insert_ignoring_duplicates(model):
+    """INSERT that skips rows hitting a unique constraint, where the dialect supports it."""
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert(model).on_conflict_do_nothing()
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(model).on_conflict_do_nothing()
+    return insert(model)
+
+
+def seed_courses():
+    """
+    Idempotently insert every catalog course missing from the courses table.
+    One SELECT of existing (category, name) pairs, one batched INSERT.
+    Returns the number of courses inserted.
+    """
+    existing = set(db.session.query(Course.category, Course.name).all())
+    missing = [
+        {'category': category, 'name': name, 'url': url}
+        for category, name, url in iter_courses()
+        if (category, name) not in existing
+    ]
+    if missing:
+        db.session.execute(_insert_ignoring_duplicates(Course), missing)
+    db.session.commit()
+    return len(missing)
+
+
+@app.cli.command('seed-courses')
+def seed_courses_command():
+    """Seed the courses table from data/role_catalog.json."""
+    db.create_all()
+    click.echo(f"Inserted {seed_courses()} course(s).")
+
+
+@app.cli.command('migrate-resume-files')
+def migrate_resume_files_command():
+    """Move file bytes out of the database (ResumeBlob.data, legacy Resume.file_data) into BLOB_STORE."""
+    db.create_all()
+    blobs = 0
+    while True:
+        batch = (
+            ResumeBlob.query
+            .filter(ResumeBlob.data.isnot(None))
+            .options(db.undefer(ResumeBlob.data))
+            .limit(200)
+            .all()
+        )
+        if not batch:
+            break
+        for blob in batch:
+            BLOB_STORE.put(blob.content_hash, blob.data)
+            blob.data = None
+        db.session.commit()
+        blobs += len(batch)
+
+    moved = 0
+    while True:
+        batch = (
+            Resume.query
+            .filter(Resume.file_data.isnot(None))
+            .options(db.undefer(Resume.file_data))
+            .limit(200)
+            .all()
+        )
+        if not batch:
+            break
+        for resume in batch:
+            resume.content_hash = store_blob(resume.file_data, resume.file_mime)
+            resume.file_data = None
+        db.session.commit()
+        moved += len(batch)
+    click.echo(f"Moved {blobs} blob(s) and {moved} inline resume file(s) into the blob store.")
 
-    # Insert into DB
-    for category, course_list in courses_data.items():
-        for course_name, course_url in course_list:
-            if not Course.query.filter_by(name=course_name).first():
-                db.session.add(Course(category=category, name=course_name, url=course_url))
 
-    db.session.commit()
-    return "✅ Courses added successfully!"
+@app.route('/add_courses')
+def add_courses():
+    added = seed_courses()
+    return f"✅ Courses added successfully! ({added} new)"
 
 @app.route("/download_sample_resume")
 def download_sample_resume():
@@ -675,6 +248,21 @@ UPLOAD_FOLDER = os.path.join(os.getcwd(), 'uploads')
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+# Resume file bytes live in the blob store, keyed by sha256.
+# BLOB_STORE=s3 uses S3_BUCKET / S3_ENDPOINT_URL (needs boto3); default is UPLOAD_FOLDER on disk
+BLOB_STORE = create_blob_store(
+    os.environ.get("BLOB_STORE", "local"),
+    root=UPLOAD_FOLDER,
+    bucket=os.environ.get("S3_BUCKET"),
+    endpoint_url=os.environ.get("S3_ENDPOINT_URL"),
+)
+
+# Rendered analysis PDFs, LRU-capped at REPORT_CACHE_MB
+REPORT_CACHE = ReportCache(
+    os.environ.get("REPORT_CACHE_DIR", os.path.join(os.getcwd(), 'report_cache')),
+    max_bytes=int(os.environ.get("REPORT_CACHE_MB", 256)) * 1024 * 1024,
+)
+
 # ===============================================================
 #                       JOB KEYWORDS
 # ===============================================================
@@ -777,6 +365,582 @@ JOB_KEYWORDS = {
     }
 }
 
+# ===============================================================
+#                   ANALYSIS PIPELINE
+# ===============================================================
+
+ROLE_SCORER = RoleScorer(JOB_KEYWORDS)
+
+
+# ---------------- BLOB STORE ---------------- #
+def _add_blob_ref(digest, delta):
+    return (
+        ResumeBlob.query
+        .filter_by(content_hash=digest)
+        .update({ResumeBlob.ref_count: ResumeBlob.ref_count + delta}, synchronize_session=False)
+    )
+
+
+def store_blob(file_bytes, mime_type, written=None):
+    """
+    Add one reference to the blob holding these bytes, writing them to
+    BLOB_STORE only the first time they are seen. Returns the sha256;
+    the caller commits. Digests written to the store are appended to
+    `written`, so a caller that rolls back can remove_orphaned_blob them.
+    """
+    digest = content_hash(file_bytes)
+    if _add_blob_ref(digest, 1):
+        return digest
+
+    BLOB_STORE.put(digest, file_bytes)
+    if written is not None:
+        written.append(digest)
+    try:
+        with db.session.begin_nested():
+            db.session.add(ResumeBlob(
+                content_hash=digest, mime=mime_type,
+                size=len(file_bytes), ref_count=1
+            ))
+    except IntegrityError:
+        # Same bytes stored concurrently by another request
+        _add_blob_ref(digest, 1)
+    return digest
+
+
+def release_blob(digest):
+    """
+    Drop one reference; once nothing points at the blob, delete its row and
+    the analyses stored for those bytes. Returns True when the row went, so
+    the caller calls remove_orphaned_blob after committing.
+    """
+    if not digest:
+        return False
+    _add_blob_ref(digest, -1)
+    orphaned = bool(ResumeBlob.query.filter(
+        ResumeBlob.content_hash == digest, ResumeBlob.ref_count <= 0
+    ).delete(synchronize_session=False))
+    if orphaned:
+        ResumeAnalysis.query.filter_by(content_hash=digest).delete(synchronize_session=False)
+    return orphaned
+
+
+def remove_orphaned_blob(digest):
+    """
+    Delete a released blob's stored file (after the release committed),
+    unless an upload of the same bytes has re-created its row since.
+    """
+    if db.session.query(ResumeBlob.content_hash).filter_by(content_hash=digest).first() is None:
+        BLOB_STORE.delete(digest)
+
+
+def holds_blob_ref(resume):
+    """Legacy rows that still keep their bytes inline (file_data) hold no blob reference."""
+    return bool(resume.content_hash) and not (
+        db.session.query(Resume.file_data.isnot(None)).filter(Resume.id == resume.id).scalar()
+    )
+
+
+def resume_file_source(resume):
+    """
+    (sha256, source) for a resume's uploaded file. On a local store the
+    source is a path (served with sendfile, mmapped by the parsers);
+    otherwise it's the bytes, including blobs not yet moved out of the
+    database and legacy inline rows. Source is None if the file is gone.
+    """
+    digest = resume.content_hash
+    if digest:
+        path = BLOB_STORE.local_path(digest)
+        if path:
+            return digest, path
+        if BLOB_STORE.exists(digest):
+            return digest, BLOB_STORE.read(digest)
+        blob = db.session.get(ResumeBlob, digest, options=[db.undefer(ResumeBlob.data)])
+        if blob is not None and blob.data is not None:
+            return digest, blob.data
+    file_data = resume.file_data
+    return digest or content_hash(file_data), file_data
+
+
+def find_analysis(digest):
+    return ResumeAnalysis.query.filter_by(
+        content_hash=digest, analyzer_version=ANALYZER_VERSION
+    ).first()
+
+
+def get_or_create_analysis(digest, source, mime_type):
+    """
+    Return the stored analysis for the file with this sha256 under the
+    current ANALYZER_VERSION, extracting and analyzing `source` (bytes or
+    a path) only on a cache miss.
+    The new artifact is added to the session; the caller commits.
+    """
+    artifact = find_analysis(digest)
+    if artifact:
+        return artifact
+
+    # CPU-heavy part runs in the analysis process pool when one is configured;
+    # paths are passed instead of bytes so workers mmap the file themselves
+    text, results = ANALYSIS_QUEUE.run_cpu(extract_and_analyze, source, mime_type, ROLE_SCORER)
+    return save_analysis(digest, text, results)
+
+
+def save_analysis(digest, text, results):
+    """Add a freshly computed analysis, or return the one a concurrent request just saved."""
+    metrics.observe_analysis(results)
+    artifact = ResumeAnalysis(
+        content_hash=digest,
+        analyzer_version=ANALYZER_VERSION,
+        full_text=text,
+        results=json.dumps(results),
+    )
+    try:
+        with db.session.begin_nested():
+            db.session.add(artifact)
+    except IntegrityError:
+        # Same bytes analyzed concurrently by another request
+        artifact = find_analysis(digest)
+    return artifact
+
+
+def analysis_columns(results):
+    """Resume column values for an analysis result (candidate_name is None when not found)."""
+    return {
+        "candidate_name": results.get("candidate_name"),
+        "parsed_text": results.get("summary", ""),
+        "skills": ", ".join(results.get("skills", [])),
+        "experience": str(results.get("experience", "")),
+        "predicted_role": results.get("predicted_role"),
+        "recommended_skills": ", ".join(results.get("recommended_skills", [])),
+        "resume_score": results.get("resume_score"),
+        "tips": "\n".join(results.get("tips", [])),
+        "courses": json.dumps([c["name"] for c in results.get("courses", [])]),
+        "course_links": json.dumps([c["link"] for c in results.get("courses", [])]),
+    }
+
+
+def apply_analysis(resume, artifact, fallback_name=None):
+    """Copy a stored analysis onto the Resume columns the views read."""
+    columns = analysis_columns(json.loads(artifact.results))
+    columns["candidate_name"] = columns["candidate_name"] or fallback_name or "Unknown"
+
+    resume.content_hash = artifact.content_hash
+    resume.analyzer_version = artifact.analyzer_version
+    for name, value in columns.items():
+        setattr(resume, name, value)
+    set_status(resume, 'done')
+
+
+def set_status(resume, status, error=None):
+    resume.status = status
+    resume.analysis_error = error
+    resume.status_changed_at = datetime.utcnow()
+
+
+def process_resume(resume_id):
+    """Background job: analyze one stored resume and record the outcome."""
+    resume = db.session.get(Resume, resume_id)
+    if resume is None:
+        return
+
+    set_status(resume, 'processing')
+    db.session.commit()
+
+    try:
+        candidate = db.session.get(User, resume.user_id)
+        digest, source = resume_file_source(resume)
+        artifact = get_or_create_analysis(digest, source, resume.file_mime)
+        apply_analysis(resume, artifact, fallback_name=candidate.name if candidate else None)
+        db.session.commit()
+        analytics.invalidate()
+        index_resume(resume.id, artifact.full_text)
+    except Exception as e:
+        db.session.rollback()
+        traceback.print_exc()
+        set_status(resume, 'failed', str(e)[:500])
+        # The version that failed: a newer analyzer gets another attempt
+        resume.analyzer_version = ANALYZER_VERSION
+        db.session.commit()
+
+
+def queue_analysis(resume):
+    """Mark a resume pending and hand it to the background queue (caller commits first)."""
+    set_status(resume, 'pending')
+    db.session.commit()
+    ANALYSIS_QUEUE.submit(resume.id)
+
+
+def requeue_if_stalled(resume):
+    """Re-submit a pending job whose worker is gone (e.g. after a restart)."""
+    if ANALYSIS_QUEUE.is_queued(resume.id):
+        return
+    changed = resume.status_changed_at or resume.uploaded_at
+    if changed and datetime.utcnow() - changed > timedelta(seconds=ANALYSIS_STALE_SECONDS):
+        queue_analysis(resume)
+
+
+ANALYSIS_QUEUE.init_app(app, process_resume)
+
+
+# ---------------- JOB DESCRIPTION MATCHING ---------------- #
+# TF-IDF index over stored ResumeAnalysis.full_text, fitted once per process
+# by a background thread started with the first request. After that it is
+# kept current incrementally: this process adds/removes its own uploads and
+# deletes, and each search first adds resumes other workers finished
+# analyzing (by status_changed_at). The IDF is refitted, again in the
+# background while the current index keeps serving, only once MATCHER.stale.
+MATCHER = MatcherIndex()
+MATCHER_PREBUILD = os.environ.get("MATCHER_PREBUILD", "1") == "1"
+# Re-check this far back on every sync: rows committed late still get picked up
+MATCHER_SYNC_OVERLAP = timedelta(seconds=60)
+_matcher_lock = threading.Lock()
+_matcher_built = False
+_matcher_building = False
+_matcher_synced_at = None
+
+
+def _matcher_corpus(*criteria):
+    rows = (
+        db.session.query(Resume.id, ResumeAnalysis.full_text)
+        .join(ResumeAnalysis, db.and_(
+            ResumeAnalysis.content_hash == Resume.content_hash,
+            ResumeAnalysis.analyzer_version == Resume.analyzer_version,
+        ))
+        .filter(Resume.status.is_(None) | (Resume.status == 'done'), *criteria)
+        .execution_options(yield_per=1000)
+    )
+    for resume_id, full_text in rows:
+        yield resume_id, full_text
+
+
+def _build_matcher():
+    """Fit a fresh index over every analyzed resume and swap it in."""
+    global MATCHER, _matcher_built, _matcher_building, _matcher_synced_at
+    try:
+        with app.app_context():
+            started = datetime.utcnow()
+            fresh = MatcherIndex().fit(_matcher_corpus())
+            db.session.remove()
+        with _matcher_lock:
+            MATCHER = fresh
+            _matcher_built = True
+            # Resumes finished while fitting are added by the next sync
+            _matcher_synced_at = started
+    except Exception:
+        traceback.print_exc()
+    finally:
+        _matcher_building = False
+
+
+def start_matcher_build():
+    """Start a background (re)build unless one is already running."""
+    global _matcher_building
+    with _matcher_lock:
+        if _matcher_building:
+            return
+        _matcher_building = True
+    threading.Thread(target=_build_matcher, name="matcher-build", daemon=True).start()
+
+
+@app.before_request
+def _prebuild_matcher():
+    if MATCHER_PREBUILD and not _matcher_built and not _matcher_building:
+        start_matcher_build()
+
+
+def _sync_matcher():
+    """Add resumes that finished analysis (in any worker) since the last sync."""
+    global _matcher_synced_at
+    now = datetime.utcnow()
+    since = _matcher_synced_at - MATCHER_SYNC_OVERLAP
+    ids = [
+        resume_id for (resume_id,) in db.session.query(Resume.id).filter(
+            Resume.status == 'done', Resume.status_changed_at >= since
+        )
+        if resume_id not in MATCHER
+    ]
+    if ids:
+        if not MATCHER.fitted:
+            start_matcher_build()   # built over an empty corpus: fit now that there is text
+        else:
+            for resume_id, full_text in _matcher_corpus(Resume.id.in_(ids)):
+                MATCHER.add(resume_id, full_text)
+    _matcher_synced_at = now
+
+
+def get_matcher():
+    """
+    The JD matcher, or None while the first build is still running (the
+    call starts it if needed). Refitted in the background once stale.
+    """
+    if not _matcher_built:
+        start_matcher_build()
+        return None
+    _sync_matcher()
+    if MATCHER.stale:
+        start_matcher_build()
+    return MATCHER
+
+
+def index_resume(resume_id, full_text):
+    """Add a freshly analyzed resume to the matcher (once it is committed)."""
+    if MATCHER.fitted:
+        MATCHER.add(resume_id, full_text)
+
+
+# ---------------- BULK INGESTION ---------------- #
+INGEST_BATCH_SIZE = 50
+
+
+def ingest_resumes(entries, owner, batch_size=INGEST_BATCH_SIZE, on_batch=None):
+    """
+    Store, analyze and insert a Resume owned by `owner` for every
+    (name, bytes) entry. Entries are consumed in batches: one analysis
+    lookup, one pass through the process pool and one commit per batch;
+    on_batch(report), if given, is called after each one.
+    Returns an IngestReport with a line per file.
+    """
+    report = IngestReport()
+    batch = []
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            _ingest_batch(batch, owner, report)
+            batch = []
+            if on_batch:
+                on_batch(report)
+    if batch:
+        _ingest_batch(batch, owner, report)
+    report.finish()
+    analytics.invalidate()
+    return report
+
+
+def _ingest_batch(entries, owner, report):
+    errors = {}   # entry index -> message
+    files = []    # (index, file_name, mime, data, digest)
+    for i, (name, data) in enumerate(entries):
+        mime = mime_for(name)
+        if mime is None:
+            errors[i] = "unsupported file type"
+        elif data is None:
+            errors[i] = f"larger than {MAX_ENTRY_BYTES // (1024 * 1024)} MB"
+        elif not data:
+            errors[i] = "empty file"
+        else:
+            file_name = secure_filename(os.path.basename(name)) or "resume"
+            files.append((i, file_name, mime, data, content_hash(data)))
+
+    # Reuse stored analyses; parse each new distinct file once, in parallel
+    artifacts = {}
+    if files:
+        artifacts = {
+            a.content_hash: a
+            for a in ResumeAnalysis.query.filter(
+                ResumeAnalysis.content_hash.in_({f[4] for f in files}),
+                ResumeAnalysis.analyzer_version == ANALYZER_VERSION,
+            )
+        }
+    pending = {}
+    for _, _, mime, data, digest in files:
+        if digest not in artifacts:
+            pending.setdefault(digest, (data, mime, ROLE_SCORER))
+    parse_errors = {}
+    outcomes = ANALYSIS_QUEUE.map_cpu(extract_and_analyze, pending.values())
+    for digest, (result, error) in zip(pending, outcomes):
+        if error is not None:
+            parse_errors[digest] = f"analysis failed: {error}"[:200]
+        else:
+            artifacts[digest] = save_analysis(digest, *result)
+
+    added = {}
+    written = []
+    try:
+        for i, file_name, mime, data, digest in files:
+            if digest in parse_errors:
+                errors[i] = parse_errors[digest]
+                continue
+            if not (artifacts[digest].full_text or "").strip():
+                errors[i] = "no text could be extracted (scanned or empty document?)"
+                continue
+            resume = Resume(
+                user_id=owner.id, file_name=file_name, file_mime=mime,
+                content_hash=store_blob(data, mime, written),
+            )
+            apply_analysis(resume, artifacts[digest])
+            db.session.add(resume)
+            added[i] = resume
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        traceback.print_exc()
+        # Files first written by this batch now have no blob row
+        for digest in written:
+            remove_orphaned_blob(digest)
+        for i in added:
+            errors[i] = f"database error: {e}"[:200]
+        added = {}
+
+    for i, _, _, _, digest in files:
+        if i in added:
+            index_resume(added[i].id, artifacts[digest].full_text)
+
+    for i, (name, _) in enumerate(entries):
+        if i in added:
+            report.add(name, resume_id=added[i].id)
+        else:
+            report.add(name, error=errors.get(i, "not imported"))
+
+
+@app.cli.command('ingest-resumes')
+@click.argument('source', type=click.Path(exists=True))
+@click.option('--email', required=True, help='Account that will own the imported resumes.')
+@click.option('--batch-size', default=INGEST_BATCH_SIZE, show_default=True)
+def ingest_resumes_command(source, email, batch_size):
+    """Bulk-import resumes from a directory or a .zip archive."""
+    db.create_all()
+    owner = User.query.filter_by(email=email).first()
+    if owner is None:
+        raise click.ClickException(f"No user with email {email}")
+
+    report = ingest_resumes(iter_source(source), owner, batch_size)
+    for item in report.results:
+        if item['ok']:
+            click.echo(f"OK    {item['file']} -> resume {item['resume_id']}")
+        else:
+            click.echo(f"FAIL  {item['file']}: {item['error']}")
+    click.echo(report.summary())
+
+
+# ---------------- BATCH RE-SCORING ---------------- #
+RESCORE_CHUNK_SIZE = 500
+
+
+def _latest_analysis_ids():
+    """Newest stored analysis per file hash (older analyzer versions included)."""
+    return (
+        db.session.query(func.max(ResumeAnalysis.id).label("id"))
+        .filter(ResumeAnalysis.full_text.isnot(None))
+        .group_by(ResumeAnalysis.content_hash)
+        .subquery()
+    )
+
+
+def rescore_chunk(artifacts):
+    """
+    Re-run skills / role scoring / recommendations for a chunk of stored
+    analyses from their saved text (no file re-extraction), save them as
+    ANALYZER_VERSION and bulk-update every Resume that shares their file hash.
+    Returns the number of resumes updated.
+    """
+    results = build_analyses([a.full_text for a in artifacts], ROLE_SCORER)
+    by_hash = {}
+    for artifact, fresh in zip(artifacts, results):
+        previous = json.loads(artifact.results or "{}")
+        if "extraction" in previous:
+            fresh["extraction"] = previous["extraction"]
+        by_hash[artifact.content_hash] = (artifact.full_text, fresh)
+
+    current = dict(
+        db.session.query(ResumeAnalysis.content_hash, ResumeAnalysis.id)
+        .filter(
+            ResumeAnalysis.content_hash.in_(by_hash),
+            ResumeAnalysis.analyzer_version == ANALYZER_VERSION,
+        )
+    )
+    updates, inserts = [], []
+    for digest, (text, fresh) in by_hash.items():
+        if digest in current:
+            updates.append({"id": current[digest], "results": json.dumps(fresh)})
+        else:
+            inserts.append({
+                "content_hash": digest,
+                "analyzer_version": ANALYZER_VERSION,
+                "full_text": text,
+                "results": json.dumps(fresh),
+                "created_at": datetime.utcnow(),
+            })
+    if updates:
+        db.session.execute(update(ResumeAnalysis), updates)
+    if inserts:
+        db.session.execute(insert(ResumeAnalysis), inserts)
+
+    now = datetime.utcnow()
+    resume_rows = []
+    for resume_id, digest in (
+        db.session.query(Resume.id, Resume.content_hash)
+        .filter(Resume.content_hash.in_(by_hash))
+    ):
+        row = analysis_columns(by_hash[digest][1])
+        if row["candidate_name"] is None:
+            del row["candidate_name"]   # keep the name we already have
+        row.update(
+            id=resume_id,
+            analyzer_version=ANALYZER_VERSION,
+            status='done',
+            analysis_error=None,
+            status_changed_at=now,
+        )
+        resume_rows.append(row)
+    if resume_rows:
+        # Group by key set: bulk UPDATE by primary key needs uniform rows
+        for keys in {frozenset(r) for r in resume_rows}:
+            db.session.execute(update(Resume), [r for r in resume_rows if frozenset(r) == keys])
+    db.session.commit()
+    return len(resume_rows)
+
+
+@app.cli.command('rescore-resumes')
+@click.option('--chunk-size', default=RESCORE_CHUNK_SIZE, show_default=True)
+def rescore_resumes_command(chunk_size):
+    """
+    Re-score every stored resume after the skill bank or role keywords change.
+    Resumes with no stored analysis (legacy rows, failures under an older
+    analyzer) are extracted and analyzed again from their files.
+    """
+    db.create_all()
+    started = time.perf_counter()
+    latest = _latest_analysis_ids()
+    # Rows this run inserts land above the ceiling and are not revisited
+    ceiling = db.session.query(func.max(ResumeAnalysis.id)).scalar() or 0
+    last_id, analyses, resumes = 0, 0, 0
+    while True:
+        chunk = (
+            ResumeAnalysis.query
+            .join(latest, ResumeAnalysis.id == latest.c.id)
+            .filter(ResumeAnalysis.id > last_id, ResumeAnalysis.id <= ceiling)
+            .order_by(ResumeAnalysis.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not chunk:
+            break
+        last_id = chunk[-1].id
+        resumes += rescore_chunk(chunk)
+        analyses += len(chunk)
+        db.session.expunge_all()
+
+    # Whatever is still not on this version had no stored analysis to
+    # re-score (legacy rows from before analyses were stored, failures):
+    # extract it again from the file
+    stale_ids = [rid for (rid,) in db.session.query(Resume.id).filter(
+        Resume.analyzer_version.is_(None) | (Resume.analyzer_version != ANALYZER_VERSION),
+    ).order_by(Resume.id)]
+    reanalyzed = 0
+    for resume_id in stale_ids:
+        process_resume(resume_id)
+        reanalyzed += db.session.get(Resume, resume_id).status == 'done'
+        db.session.expunge_all()
+
+    analytics.invalidate()
+    elapsed = time.perf_counter() - started
+    click.echo(
+        f"Re-scored {analyses} analysis(es) and {resumes} resume(s), "
+        f"re-analyzed {reanalyzed} of {len(stale_ids)} resume(s) without one in {elapsed:.1f}s."
+    )
+    if reanalyzed < len(stale_ids):
+        click.echo(f"{len(stale_ids) - reanalyzed} resume(s) failed; see their analysis_error.")
+
+
 # ---------------- HOME ---------------- #
 @app.route('/')
 def home():
@@ -816,6 +980,7 @@ def register():
 
         db.session.add(new_user)
         db.session.commit()
+        analytics.invalidate()
 
         flash("Registration successful! Please login.", "success")
         return redirect(url_for('login'))
@@ -921,33 +1086,45 @@ def upload_resume():
     user = User.query.get(session['user_id'])
 
     try:
-        # -------------------------------
-        # Extract TEXT directly from BYTES
-        # -------------------------------
-        from modules.parser import extract_text_bytes
-        text = extract_text_bytes(file_bytes, mime_type)
-
-        analysis = analyze_resume(text)
+        # Bytes are stored once per content hash and shared across uploads
+        digest = store_blob(file_bytes, mime_type)
 
         # Save resume in database
         new_resume = Resume(
             user_id=user.id,
             file_name=filename,
-            file_data=file_bytes,          # Store binary file
+            content_hash=digest,
             file_mime=mime_type,           # Store mime for parsing later
-            parsed_text=analysis.get('summary', ''),
-            skills=', '.join(analysis.get('skills_found', [])),
-            experience=str(analysis.get('experience', '')),
-            suggested_roles=analysis.get('suggested_roles', '')
         )
 
+        # -------------------------------
+        # Analyze once, reuse for every view:
+        # known bytes reuse the stored analysis, new ones go to the queue
+        # -------------------------------
+        artifact = find_analysis(digest)
+        if artifact is None and not app.config['ANALYSIS_ASYNC']:
+            artifact = get_or_create_analysis(digest, file_bytes, mime_type)
+
+        if artifact is not None:
+            apply_analysis(new_resume, artifact, fallback_name=user.name)
+        else:
+            set_status(new_resume, 'pending')
+
         db.session.add(new_resume)
         db.session.commit()
+        analytics.invalidate()
+        if artifact is not None:
+            index_resume(new_resume.id, artifact.full_text)
 
-        flash("Resume uploaded & analyzed successfully!", "success")
+        if new_resume.status == 'pending':
+            ANALYSIS_QUEUE.submit(new_resume.id)
+            flash("Resume uploaded! Analysis is in progress.", "info")
+        else:
+            flash("Resume uploaded & analyzed successfully!", "success")
         return redirect(url_for('view_resume', resume_id=new_resume.id))
 
     except Exception as e:
+        db.session.rollback()
         traceback.print_exc()
         flash(f"Error analyzing resume: {str(e)}", "danger")
         return redirect(url_for('candidate_dashboard'))
@@ -967,511 +1144,37 @@ def view_resume(resume_id):
         flash("You do not have permission to view this resume.", "danger")
         return redirect(url_for('candidate_dashboard'))
 
-    candidate = User.query.get(resume.user_id)
-
     # -----------------------------------
-    # ALWAYS INITIALIZE skills_cleaned
+    # Analysis still running -> progress page that polls /resume_status
     # -----------------------------------
-    skills_cleaned = []
-
-    try:
-        # Read text from database-stored file bytes
-        from modules.parser import extract_text_bytes, extract_name
-        file_bytes = resume.file_data
-        mime_type = resume.file_mime
-
-        text = extract_text_bytes(file_bytes, mime_type)
-
-        # ---------- Extract Candidate Name ----------
-        extracted_name = extract_name(text)
-        resume.candidate_name = extracted_name if extracted_name else (candidate.name if candidate else "Unknown")
-        db.session.commit()
-
-        # ---------- Analyze Resume ----------
-        analysis = analyze_resume(text)
-
-        # SKILLS
-        skills_list = analysis.get("skills_found", [])
-        skills_cleaned = [s.lower().strip() for s in skills_list]
-        resume.skills = ", ".join(skills_cleaned)
-
-        # ---------- Role Prediction ----------
-        rt_lower = text.lower()
-        role_scores = {}
-
-        for role, keywords in JOB_KEYWORDS.items():
-            score = sum(5 for kw in keywords if kw.lower() in skills_cleaned)
-            role_scores[role] = score
-
-        predicted_role = max(role_scores, key=role_scores.get)
-        predicted_role = predicted_role if role_scores[predicted_role] > 0 else None
-        resume.predicted_role = predicted_role
-
-
+    if resume.status in ('pending', 'processing'):
+        requeue_if_stalled(resume)
+        return render_template('resume_status.html', resume=resume)
 
-        # ---------- ROLE DATA ----------- #
-        ROLE_DATA = {
+    if resume.status == 'failed' and resume.analyzer_version == ANALYZER_VERSION:
+        flash(f"Error analyzing resume: {resume.analysis_error or 'unknown error'}", "danger")
 
-    # =========================================================
-    # 1) DATA SCIENCE
-    # =========================================================
-    "Data Science": {
-        "skills": ['tensorflow', 'keras', 'pytorch', 'scikit-learn', 'machine learning',
-                   'deep learning', 'streamlit', 'opencv', 'ai', 'nlp'],
-        "courses": [
-            ("Machine Learning Crash Course – Google (FREE)", "https://developers.google.com/machine-learning/crash-course"),
-            ("Machine Learning – Andrew Ng", "https://www.coursera.org/learn/machine-learning"),
-            ("Data Science Roadmap – freeCodeCamp (FREE)", "https://youtu.be/X3paOmcrTjQ"),
-            ("Deep Learning Specialization – Andrew Ng", "https://www.coursera.org/specializations/deep-learning"),
-            ("Python for Data Science – Coursera", "https://www.coursera.org/learn/python-for-data-science"),
-            ("Data Scientist with Python – DataCamp", "https://www.datacamp.com/tracks/data-scientist-with-python"),
-            ("Data Science Bootcamp – Udemy", "https://www.udemy.com/course/data-science-and-machine-learning-bootcamp-with-python/"),
-            ("Statistics for Data Science – Udemy", "https://www.udemy.com/course/statistics-for-data-science-and-business-analysis/"),
-            ("Intro to Machine Learning – Kaggle (FREE)", "https://www.kaggle.com/learn/intro-to-machine-learning"),
-            ("AI for Everyone – Andrew Ng", "https://www.coursera.org/learn/ai-for-everyone")
-        ]
-    },
-
-    # =========================================================
-    # 2) WEB DEVELOPMENT
-    # =========================================================
-    "Web Development": {
-        "skills": ['php', 'wordpress', 'magento', 'laravel', 'express',
-                   'rest api', 'mongodb', 'frontend', 'backend'],
-        "courses": [
-            ("The Odin Project (FREE Full Stack)", "https://www.theodinproject.com"),
-            ("HTML & CSS Crash Course – freeCodeCamp (FREE)", "https://www.freecodecamp.org/learn/responsive-web-design/"),
-            ("JavaScript Full Course – freeCodeCamp (FREE)", "https://youtu.be/jS4aFq5-91M"),
-            ("React – Codecademy", "https://www.codecademy.com/learn/react-101"),
-            ("Node.js Crash Course – freeCodeCamp", "https://youtu.be/Oe421EPjeBE"),
-            ("Full Stack Web Dev – Udacity", "https://www.udacity.com/course/full-stack-web-developer-nanodegree--nd0044"),
-            ("Django for Everyone – Coursera", "https://www.coursera.org/specializations/django"),
-            ("Complete Web Dev Bootcamp – Udemy", "https://www.udemy.com/course/the-complete-web-development-bootcamp/"),
-            ("Next.js Full Tutorial – freeCodeCamp", "https://youtu.be/Y6KDk5iyrYE"),
-            ("Frontend Developer Roadmap – Roadmap.sh (FREE)", "https://roadmap.sh/frontend")
-        ]
-    },
-
-    # =========================================================
-    # 3) ANDROID DEVELOPMENT
-    # =========================================================
-    "Android Development": {
-        "skills": ['android', 'kotlin', 'jetpack compose', 'android studio', 'firebase', 'kivy'],
-        "courses": [
-            ("Android Basics by Google (FREE)", "https://www.udacity.com/course/android-basics--nd803"),
-            ("Android Kotlin Developer – Udacity", "https://www.udacity.com/course/android-kotlin-developer-nanodegree--nd940"),
-            ("Android Studio Masterclass – Udemy", "https://www.udemy.com/course/android-oreo-kotlin-app-masterclass/"),
-            ("Kotlin Bootcamp – Google", "https://developer.android.com/courses/android-basics-kotlin/course"),
-            ("Flutter Full Course – freeCodeCamp", "https://youtu.be/VPvVD8t02U8"),
-            ("Jetpack Compose Tutorial – Google", "https://developer.android.com/jetpack/compose"),
-            ("Android Specialization – Coursera", "https://www.coursera.org/specializations/android-app-development"),
-            ("Flutter & Dart Bootcamp – Udemy", "https://www.udemy.com/course/flutter-dart-the-complete-flutter-app-development-course/"),
-            ("Kotlin Essentials – JetBrains", "https://play.kotlinlang.org/koans/overview"),
-            ("Android Clean Architecture Course", "https://youtu.be/EOfCEhWq8sg")
-        ]
-    },
-
-    # =========================================================
-    # 4) iOS DEVELOPMENT
-    # =========================================================
-    "iOS Development": {
-        "skills": ['ios', 'swift', 'swiftui', 'objective-c', 'xcode', 'uikit', 'cocoa'],
-        "courses": [
-            ("Swift Full Course – freeCodeCamp", "https://youtu.be/comQ1-x2a1Q"),
-            ("SwiftUI Essentials – Apple", "https://developer.apple.com/tutorials/swiftui"),
-            ("iOS & Swift Bootcamp – Udemy", "https://www.udemy.com/course/ios-13-app-development-bootcamp/"),
-            ("Become an iOS Developer – Udacity", "https://www.udacity.com/course/ios-developer-nanodegree--nd003"),
-            ("Swift Programming – Codecademy", "https://www.codecademy.com/learn/learn-swift"),
-            ("iOS App Development Specialization – Coursera", "https://www.coursera.org/specializations/app-development"),
-            ("Objective-C Crash Course – Udemy", "https://www.udemy.com/course/objectivec/"),
-            ("iOS Architecture – Udemy", "https://www.udemy.com/course/ios-architecture/"),
-            ("SwiftUI Masterclass – Udemy", "https://www.udemy.com/course/swiftui-masterclass-course-ios-development-with-swift/"),
-            ("Intro to iOS – LinkedIn", "https://www.linkedin.com/learning/topics/ios")
-        ]
-    },
-
-    # =========================================================
-    # 5) UI/UX DESIGN
-    # =========================================================
-    "UI/UX Design": {
-        "skills": ['figma', 'adobe xd', 'balsamiq', 'prototyping', 'wireframes',
-                   'mockups', 'usability testing', 'user interface', 'user experience'],
-        "courses": [
-            ("Google UX Design Certificate", "https://www.coursera.org/professional-certificates/google-ux-design"),
-            ("Figma Full Course – freeCodeCamp", "https://youtu.be/jwCt4DCa2Ek"),
-            ("UI/UX Specialization – Coursera", "https://www.coursera.org/specializations/ui-ux-design"),
-            ("Adobe XD Full Course – YouTube", "https://youtu.be/68w2VwalD5w"),
-            ("UX Fundamentals – Udemy", "https://www.udemy.com/course/ux-design-fundamentals/"),
-            ("Design Thinking – Coursera", "https://www.coursera.org/learn/uva-darden-design-thinking-innovation"),
-            ("UI Design Principles – Udemy", "https://www.udemy.com/course/design-rules/"),
-            ("UX Research at Scale – Coursera", "https://www.coursera.org/learn/ux-research-at-scale"),
-            ("Interaction Design Foundation Courses", "https://www.interaction-design.org/courses"),
-            ("Become a UX Designer – Udacity", "https://www.udacity.com/course/ux-designer-nanodegree--nd578")
-        ]
-    },
-
-    # =========================================================
-    # 6) DATA ANALYST
-    # =========================================================
-    "Data Analyst": {
-        "skills": ['excel', 'power bi', 'tableau', 'data cleaning', 'analytics'],
-        "courses": [
-            ("Google Data Analytics Certificate", "https://www.coursera.org/professional-certificates/google-data-analytics"),
-            ("Excel to MySQL – Coursera", "https://www.coursera.org/specializations/excel-mysql"),
-            ("Data Analyst with Python – DataCamp", "https://www.datacamp.com/tracks/data-analyst-with-python"),
-            ("Power BI Full Course – freeCodeCamp", "https://youtu.be/0tAzpi3fXw4"),
-            ("Tableau Training – Udemy", "https://www.udemy.com/course/tableau10/"),
-            ("Statistics for Data Analysis – Udemy", "https://www.udemy.com/course/statistics-for-data-science-and-business-analysis/"),
-            ("Pandas Tutorial – freeCodeCamp", "https://youtu.be/vmEHCJofslg"),
-            ("SQL for Data Analysis – Coursera", "https://www.coursera.org/specializations/data-analysis-sql"),
-            ("Excel Essential Training – LinkedIn", "https://www.linkedin.com/learning/excel-essential-training-2019"),
-            ("Data Analytics Bootcamp – Udemy", "https://www.udemy.com/course/data-analytics-real-world-projects/")
-        ]
-    },
-
-    # =========================================================
-    # 7) CLOUD & DEVOPS
-    # =========================================================
-    "Cloud & DevOps": {
-        "skills": ['aws', 'gcp', 'docker', 'kubernetes', 'terraform',
-                   'jenkins', 'ci/cd', 'ansible', 'infrastructure'],
-        "courses": [
-            ("AWS Cloud Practitioner", "https://www.aws.training/Details/eLearning?id=60697"),
-            ("Docker + Kubernetes – Udemy", "https://www.udemy.com/course/docker-and-kubernetes-the-complete-guide/"),
-            ("Terraform for Beginners", "https://learn.hashicorp.com/collections/terraform/aws-get-started"),
-            ("Azure DevOps Tutorial – Microsoft", "https://learn.microsoft.com/en-us/training/modules/introduction-to-devops/"),
-            ("DevOps Foundations – LinkedIn", "https://www.linkedin.com/learning/devops-foundations"),
-            ("Linux Administration – Udemy", "https://www.udemy.com/course/linux-admin-bootcamp/"),
-            ("GCP Cloud Engineer – Coursera", "https://www.coursera.org/professional-certificates/gcp-cloud-engineering"),
-            ("Kubernetes Bootcamp – freeCodeCamp", "https://youtu.be/X48VuDVv0do"),
-            ("Jenkins From Zero to Hero – Udemy", "https://www.udemy.com/course/jenkins-from-zero-to-hero/"),
-            ("Ansible for Beginners – Udemy", "https://www.udemy.com/course/ansible-for-the-absolute-beginner/")
-        ]
-    },
-
-    # =========================================================
-    # 8) CYBERSECURITY
-    # =========================================================
-    "Cybersecurity": {
-        "skills": ['cybersecurity', 'ethical hacking', 'penetration testing',
-                   'network security', 'firewall', 'siem', 'burp suite',
-                   'kali linux', 'vulnerability assessment'],
-        "courses": [
-            ("Intro to Cybersecurity – Cisco", "https://www.netacad.com/courses/cybersecurity/introduction-cybersecurity"),
-            ("Google Cybersecurity Certificate", "https://www.coursera.org/professional-certificates/google-cybersecurity"),
-            ("Certified Ethical Hacker (CEH)", "https://www.eccouncil.org/train-certify/certified-ethical-hacker-ceh/"),
-            ("Cybersecurity Full Course – freeCodeCamp", "https://youtu.be/3Kq1MIfTWCE"),
-            ("Kali Linux for Hackers – Udemy", "https://www.udemy.com/course/ethical-hacking-beginners/"),
-            ("Network Security – LinkedIn", "https://www.linkedin.com/learning/topics/network-security"),
-            ("Burp Suite Masterclass – Udemy", "https://www.udemy.com/course/burp-suite-mastering-bug-bounty/"),
-            ("Pentesting with Nmap – Udemy", "https://www.udemy.com/course/nmap-complete-guide/"),
-            ("Cryptography – Coursera", "https://www.coursera.org/learn/cryptography"),
-            ("Malware Analysis – Udemy", "https://www.udemy.com/course/malware-analysis/")
-        ]
-    },
-
-    # =========================================================
-    # 9) QUALITY ASSURANCE (QA)
-    # =========================================================
-    "Quality Assurance": {
-        "skills": ['automation testing', 'selenium', 'cypress', 'api testing',
-                   'bug tracking', 'pytest', 'quality assurance'],
-        "courses": [
-            ("Manual Testing – Udemy", "https://www.udemy.com/course/manual-testing-with-tutorial/"),
-            ("Selenium with Python – Udemy", "https://www.udemy.com/course/selenium-webdriver-with-python/"),
-            ("Cypress Automation – Udemy", "https://www.udemy.com/course/cypress-tutorial/"),
-            ("API Testing with Postman – Udemy", "https://www.udemy.com/course/postman-the-complete-guide/"),
-            ("QA Testing Full Course – freeCodeCamp", "https://youtu.be/XkW6OVv1kwA"),
-            ("JIRA Crash Course – LinkedIn", "https://www.linkedin.com/learning/jira-service-management"),
-            ("Automated Testing Specialization – Coursera", "https://www.coursera.org/specializations/automated-software-testing"),
-            ("Unit Testing in Python – Udemy", "https://www.udemy.com/course/python-unit-testing-automation/"),
-            ("Test Automation University (FREE)", "https://testautomationu.applitools.com/"),
-            ("Bug Tracking & Reporting – Udemy", "https://www.udemy.com/course/bug-reporting/")
-        ]
-    },
-
-    # =========================================================
-    # 10) BUSINESS ANALYST
-    # =========================================================
-    "Business Analyst": {
-        "skills": ['business analysis', 'requirement gathering', 'documentation',
-                   'stakeholder', 'project management'],
-        "courses": [
-            ("BA Fundamentals – Udemy", "https://www.udemy.com/course/business-analysis-fundamentals/"),
-            ("Agile Business Analyst – Coursera", "https://www.coursera.org/learn/agile-business-analyst"),
-            ("Business Analytics – Coursera", "https://www.coursera.org/specializations/business-analytics"),
-            ("Excel for Analysts – Coursera", "https://www.coursera.org/learn/excel-data-analysis"),
-            ("JIRA for BA – Udemy", "https://www.udemy.com/course/jira-agile-project-management/"),
-            ("Project Management Foundations – LinkedIn", "https://www.linkedin.com/learning/project-management-foundations"),
-            ("Requirement Engineering – Udemy", "https://www.udemy.com/course/requirements-engineering/"),
-            ("Business Communication – Coursera", "https://www.coursera.org/specializations/business-communication"),
-            ("Business Data Analytics – Udemy", "https://www.udemy.com/course/business-data-science/"),
-            ("SDLC Complete Guide – Udemy", "https://www.udemy.com/course/software-development-life-cycle/")
-        ]
-    },
-
-    # =========================================================
-    # 11) DATABASE ADMINISTRATOR (DBA)
-    # =========================================================
-    "Database Administrator": {
-        "skills": ['pl/sql', 'oracle', 'postgresql', 'normalization',
-                   'backup', 'performance tuning', 'rds'],
-        "courses": [
-            ("PostgreSQL Masterclass – Udemy", "https://www.udemy.com/course/postgresql-database-administration/"),
-            ("SQL for Data Engineering – Coursera", "https://www.coursera.org/learn/data-eng-sql"),
-            ("MySQL Full Course – freeCodeCamp", "https://youtu.be/7S_tz1z_5bA"),
-            ("Oracle SQL Admin – Udemy", "https://www.udemy.com/course/oracle-sql-database-administration/"),
-            ("DBMS Full Course – Gate Smashers", "https://youtu.be/4xCynWHbn8w"),
-            ("PL/SQL Bootcamp – Udemy", "https://www.udemy.com/course/oracle-plsql-programming/"),
-            ("Database Design – Coursera", "https://www.coursera.org/learn/database-design"),
-            ("SQL Server – LinkedIn", "https://www.linkedin.com/learning/learning-sql-server"),
-            ("Normalization & DB Design – Udemy", "https://www.udemy.com/course/database-design-and-management/"),
-            ("NoSQL Essentials – Coursera", "https://www.coursera.org/learn/nosql-databases")
-        ]
-    },
-
-    # =========================================================
-    # 12) AI / NLP ENGINEER
-    # =========================================================
-    "AI / NLP Engineer": {
-        "skills": ['transformers', 'huggingface', 'bert', 'gpt',
-                   'text classification', 'language model', 'speech recognition'],
-        "courses": [
-            ("NLP Specialization – Coursera", "https://www.coursera.org/specializations/nlp"),
-            ("HuggingFace Transformers Course – FREE", "https://huggingface.co/course/chapter1"),
-            ("Deep Learning for NLP – Udemy", "https://www.udemy.com/course/nlp-natural-language-processing-with-python/"),
-            ("BERT & GPT Hands-on – Udemy", "https://www.udemy.com/course/bert-transformers-nlp/"),
-            ("Speech Recognition – Coursera", "https://www.coursera.org/learn/audio-processing"),
-            ("Intro to NLP – freeCodeCamp", "https://youtu.be/fNxaJsNG3-s"),
-            ("Stanford NLP – CS224N", "http://web.stanford.edu/class/cs224n/"),
-            ("Transformers in Python – YouTube", "https://youtu.be/tiuPHWB1gkA"),
-            ("AI for Everyone – Coursera", "https://www.coursera.org/learn/ai-for-everyone"),
-            ("Neural Networks – Coursera", "https://www.coursera.org/learn/neural-networks-deep-learning")
-        ]
-    },
-
-    # =========================================================
-    # 13) PRODUCT MANAGER
-    # =========================================================
-    "Product Manager": {
-        "skills": ['product management', 'roadmap', 'market research',
-                   'data-driven', 'leadership', 'notion'],
-        "courses": [
-            ("Digital Product Management – Coursera", "https://www.coursera.org/learn/uva-darden-digital-product-management"),
-            ("Product Management 101 – Udemy", "https://www.udemy.com/course/product-management-101/"),
-            ("Agile Product Owner Role – LinkedIn", "https://www.linkedin.com/learning/agile-product-owner-role"),
-            ("Product Strategy – Coursera", "https://www.coursera.org/learn/product-strategy"),
-            ("Product Management Crash Course", "https://youtu.be/sJ14cWjrNzs"),
-            ("Roadmapping for PMs – Udemy", "https://www.udemy.com/course/product-roadmaps/"),
-            ("Business Strategy – Coursera", "https://www.coursera.org/specializations/business-strategy"),
-            ("User Story Writing – Udemy", "https://www.udemy.com/course/user-story/"),
-            ("Notion Productivity Course – YouTube", "https://youtu.be/pvJScuVF4TU"),
-            ("PM Interview Prep – Udemy", "https://www.udemy.com/course/product-management-interview-crash-course/")
-        ]
-    },
-
-    # =========================================================
-    # 14) PYTHON DEVELOPER
-    # =========================================================
-    "Python Developer": {
-        "skills": ['python', 'django', 'fastapi', 'tkinter', 'scripting',
-                   'automation', 'flask'],
-        "courses": [
-            ("Python for Everybody – Coursera", "https://www.coursera.org/specializations/python"),
-            ("Automate the Boring Stuff (FREE)", "https://automatetheboringstuff.com/"),
-            ("Django Full Course – freeCodeCamp", "https://youtu.be/F5mRW0jo-U4"),
-            ("FastAPI Full Course – YouTube", "https://youtu.be/0sOvCWFmrtA"),
-            ("Python OOP – Udemy", "https://www.udemy.com/course/python-object-oriented-programming/"),
-            ("Python Bootcamp – Udemy", "https://www.udemy.com/course/complete-python-bootcamp/"),
-            ("Flask Web Development – Udemy", "https://www.udemy.com/course/python-and-flask-bootcamp/"),
-            ("Python DSA – Udemy", "https://www.udemy.com/course/python-data-structures-and-algorithms/"),
-            ("Asyncio in Python – YouTube", "https://youtu.be/3mbFky5M6dM"),
-            ("Django REST API – Coursera", "https://www.coursera.org/projects/django-rest-framework")
-        ]
-    },
-
-    # =========================================================
-    # 15) JAVA DEVELOPER
-    # =========================================================
-    "Java Developer": {
-        "skills": ['java', 'j2ee', 'spring', 'spring boot',
-                   'hibernate', 'servlets', 'microservices'],
-        "courses": [
-            ("Java Masterclass – Udemy", "https://www.udemy.com/course/java-the-complete-java-developer-course/"),
-            ("Java Full Course – freeCodeCamp", "https://youtu.be/A74TOX803D0"),
-            ("Spring Boot Full Course – YouTube", "https://youtu.be/9SGDpanrc8U"),
-            ("Hibernate Tutorial – Udemy", "https://www.udemy.com/course/hibernate-course/"),
-            ("Java OOP – Udemy", "https://www.udemy.com/course/java-object-oriented-programming/"),
-            ("Spring Security – Udemy", "https://www.udemy.com/course/spring-security-core-beginner-to-guru/"),
-            ("Java Servlets & JSP – Udemy", "https://www.udemy.com/course/jsp-servlet-free-course/"),
-            ("Spring Microservices – Udemy", "https://www.udemy.com/course/microservices-with-spring-boot/"),
-            ("DSA in Java – Coding Ninjas", "https://www.codingninjas.com/courses/data-structures-and-algorithms-java"),
-            ("Java Multithreading – YouTube", "https://youtu.be/h-T7XmyIHDE")
-        ]
-    },
-
-    # =========================================================
-    # 16) C/C++ DEVELOPER
-    # =========================================================
-    "C/C++ Developer": {
-        "skills": ['c', 'c++', 'stl', 'memory management', 'linux programming'],
-        "courses": [
-            ("C Programming Full Course – freeCodeCamp", "https://youtu.be/KJgsSFOSQv0"),
-            ("C++ Full Course – freeCodeCamp", "https://youtu.be/8jLOx1hD3_o"),
-            ("DSA in C++ – Udemy", "https://www.udemy.com/course/datastructurescncpp/"),
-            ("Advanced C++ – Udemy", "https://www.udemy.com/course/advanced-c-programming/"),
-            ("Linux System Programming – Udemy", "https://www.udemy.com/course/linux-system-programming-techniques/"),
-            ("Pointers in C – Udemy", "https://www.udemy.com/course/c-pointers/"),
-            ("Competitive Programming – Codeforces", "https://codeforces.com/edu"),
-            ("STL in C++ – YouTube", "https://youtu.be/PwS4LlQ2kZQ"),
-            ("Operating Systems – Neso Academy", "https://youtu.be/_TpOHMCODXo"),
-            ("C++ OOP Masterclass – Udemy", "https://www.udemy.com/course/cpp-classes/")
-        ]
-    },
-
-    # =========================================================
-    # 17) .NET DEVELOPER
-    # =========================================================
-    ".NET Developer": {
-        "skills": ['c#', '.net', 'asp.net', 'entity framework', 'mvc', 'linq'],
-        "courses": [
-            ("C# Basics – freeCodeCamp", "https://youtu.be/GhQdlIFylQ8"),
-            ("ASP.NET Core MVC – YouTube", "https://youtu.be/BfEjDD8mWYg"),
-            ("Entity Framework Core – Pluralsight", "https://www.pluralsight.com/courses/entity-framework-core-getting-started"),
-            ("C# Masterclass – Udemy", "https://www.udemy.com/course/csharp-tutorial-for-beginners/"),
-            (".NET API Development – Udemy", "https://www.udemy.com/course/build-restful-apis-with-aspnet-core/"),
-            ("LINQ Tutorial – Microsoft", "https://learn.microsoft.com/en-us/dotnet/csharp/programming-guide/concepts/linq/"),
-            ("Microservices in .NET – Udemy", "https://www.udemy.com/course/microservices-architecture-and-implementation-on-dotnet/"),
-            ("Blazor WebAssembly Course", "https://learn.microsoft.com/en-us/aspnet/core/blazor"),
-            ("ASP.NET Razor Pages – Udemy", "https://www.udemy.com/course/aspnet-core-razor-pages/"),
-            ("Clean Architecture in .NET – YouTube", "https://youtu.be/fJjKQla-PgM")
-        ]
-    },
-
-
-    # =========================================================
-    # 19) JAVASCRIPT DEVELOPER
-    # =========================================================
-    "JavaScript Developer": {
-        "skills": ['ecmascript', 'dom', 'event loop', 'callbacks',
-                   'promises', 'async', 'await'],
-        "courses": [
-            ("JavaScript Full Course – freeCodeCamp", "https://youtu.be/HD13eq_Pmp8"),
-            ("Async JS Mastery – Udemy", "https://www.udemy.com/course/asynchronous-javascript/"),
-            ("JavaScript DOM – YouTube", "https://youtu.be/0ik6X4DJKCc"),
-            ("JavaScript Algorithms – freeCodeCamp", "https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/"),
-            ("TypeScript Full Course – freeCodeCamp", "https://youtu.be/30LWjhZzg50"),
-            ("Modern JS Bootcamp – Udemy", "https://www.udemy.com/course/javascript-beginners-complete-tutorial/"),
-            ("JavaScript Design Patterns – Udemy", "https://www.udemy.com/course/learn-javascript-design-patterns/"),
-            ("ES6+ Mastery – Udemy", "https://www.udemy.com/course/understand-javascript/"),
-            ("Event Loop Deep Dive – YouTube", "https://youtu.be/8aGhZQkoFbQ"),
-            ("Async/Await Guide – MDN", "https://developer.mozilla.org/en-US/docs/Learn/JavaScript/Asynchronous")
-        ]
-    },
-
-    # =========================================================
-    # 20) FULL STACK DEVELOPER
-    # =========================================================
-    "Full Stack Developer": {
-        "skills": ['full stack', 'system design', 'version control', 'git'],
-        "courses": [
-            ("Full Stack Web Dev – Coursera", "https://www.coursera.org/specializations/full-stack-mobile-app-development"),
-            ("MERN Stack Full Course – freeCodeCamp", "https://youtu.be/7CqJlxBYj-M"),
-            ("MEAN Stack Bootcamp – Udemy", "https://www.udemy.com/course/full-stack-web-development-mega-pack/"),
-            ("System Design for Beginners – YouTube", "https://youtu.be/l5zn6mP5uY8"),
-            ("Git & GitHub Bootcamp – Udemy", "https://www.udemy.com/course/git-complete/"),
-            ("Backend Roadmap – Roadmap.sh", "https://roadmap.sh/backend"),
-            ("Frontend Roadmap – Roadmap.sh", "https://roadmap.sh/frontend"),
-            ("Docker for Developers – Udemy", "https://www.udemy.com/course/docker-mastery/"),
-            ("APIs for Developers – LinkedIn", "https://www.linkedin.com/learning/apis-for-developers"),
-            ("Full Stack Project Bootcamp – Udemy", "https://www.udemy.com/course/100-days-of-web-development/")
-        ]
-    },
-
-    # =========================================================
-    # 21) BACKEND DEVELOPER
-    # =========================================================
-    "Backend Developer": {
-        "skills": ['authentication', 'authorization', 'redis'],
-        "courses": [
-            ("Backend Roadmap – Roadmap.sh", "https://roadmap.sh/backend"),
-            ("REST API Crash Course – freeCodeCamp", "https://youtu.be/Q-BpqyOT3a8"),
-            ("Redis Crash Course – YouTube", "https://youtu.be/Hbt56gFj998"),
-            ("JWT Authentication – Net Ninja", "https://youtu.be/7Q17ubqLfaM"),
-            ("Microservices Architecture – Udemy", "https://www.udemy.com/course/microservices-with-node-js-and-react/"),
-            ("Node.js Backend Masterclass – Udemy", "https://www.udemy.com/course/nodejs-the-complete-guide/"),
-            ("PostgreSQL Full Course – freeCodeCamp", "https://youtu.be/qw--VYLpxG4"),
-            ("API Rate Limiting & Caching – YouTube", "https://youtu.be/jKdCmhVxD0E"),
-            ("Backend System Design – YouTube", "https://youtu.be/hhAo4ZD3ou8"),
-            ("NGINX Essentials – Udemy", "https://www.udemy.com/course/nginx-crash-course/")
-        ]
-    },
-
-    # =========================================================
-    # 22) FRONTEND DEVELOPER
-    # =========================================================
-    "Frontend Developer": {
-        "skills": ['responsive design', 'ui design'],
-        "courses": [
-            ("Frontend Roadmap – Roadmap.sh", "https://roadmap.sh/frontend"),
-            ("HTML/CSS Full Course – freeCodeCamp", "https://youtu.be/kUMe1FH4CHE"),
-            ("JavaScript Full Course – freeCodeCamp", "https://youtu.be/HD13eq_Pmp8"),
-            ("React Full Course – freeCodeCamp", "https://youtu.be/bMknfKXIFA8"),
-            ("Tailwind CSS Mastery – YouTube", "https://youtu.be/pfaSUYaSgRo"),
-            ("CSS Flexbox & Grid – Scrimba", "https://scrimba.com/learn/flexbox"),
-            ("Vue.js Crash Course – YouTube", "https://youtu.be/FXpIoQ_rT_c"),
-            ("Frontend Nanodegree – Udacity", "https://www.udacity.com/course/front-end-web-developer-nanodegree--nd0011"),
-            ("Web Accessibility – Udacity", "https://www.udacity.com/course/web-accessibility--ud891"),
-            ("UI Design for Developers – Udemy", "https://www.udemy.com/course/ui-design-for-developers/")
-        ]
-    }
-}
-
-
-        # ---------- BUILD RECOMMENDATIONS ----------
-        recommended_skills = []
-        courses = []
-
-        if predicted_role and predicted_role in ROLE_DATA:
-            recommended_skills = ROLE_DATA[predicted_role]["skills"]
-            courses = [{"name": n, "link": l} for n, l in ROLE_DATA[predicted_role]["courses"]]
-
-        # ---------- Resume Score ----------
-        sections = {
-            "objective": (['objective', 'summary'], 6),
-            "education": (['education', 'degree', 'college'], 12),
-            "experience": (['experience', 'internship'], 16),
-            "skills": (['skills'], 7),
-            "projects": (['project'], 19),
-            "certifications": (['certificate'], 12),
-            "achievements": (['achievement'], 13),
-            "hobbies": (['hobbies'], 4),
-            "interests": (['interests'], 5),
-        }
-
-        resume_score = 0
-        tips = []
-
-        for key, (words, points) in sections.items():
-            if any(w in rt_lower for w in words):
-                resume_score += points
-                tips.append(f"[+] Great! You included your {key} section.")
-            else:
-                tips.append(f"[-] Please add your {key} section to improve your resume.")
-
-        resume_score = min(resume_score, 100)
-
-        # ---------- Save to DB ----------
-        resume.resume_score = resume_score
-        resume.tips = "\n".join(tips)
-        resume.recommended_skills = ", ".join(recommended_skills)
-        resume.courses = json.dumps([c["name"] for c in courses])
-        resume.course_links = json.dumps([c["link"] for c in courses])
-        db.session.commit()
-
-    except Exception as e:
-        traceback.print_exc()
-        flash(f"Error analyzing resume: {str(e)}", "danger")
+    # -----------------------------------
+    # Re-analyze only for legacy rows or when the analyzer changed (this
+    # includes failures under an older analyzer); otherwise a pure read.
+    # -----------------------------------
+    elif resume.analyzer_version != ANALYZER_VERSION:
+        if app.config['ANALYSIS_ASYNC']:
+            queue_analysis(resume)
+            return render_template('resume_status.html', resume=resume)
+        try:
+            candidate = User.query.get(resume.user_id)
+            artifact = get_or_create_analysis(*resume_file_source(resume), resume.file_mime)
+            apply_analysis(resume, artifact, fallback_name=candidate.name if candidate else None)
+            db.session.commit()
+            analytics.invalidate()
+            index_resume(resume.id, artifact.full_text)
+        except Exception as e:
+            db.session.rollback()
+            traceback.print_exc()
+            flash(f"Error analyzing resume: {str(e)}", "danger")
+
+    skills_cleaned = [s.strip() for s in (resume.skills or "").split(",") if s.strip()]
 
     # ---------- Load Courses ----------
     courses = []
@@ -1527,308 +1230,721 @@ def view_resume(resume_id):
 
 
 
-@app.route('/download_resume_pdf/<int:resume_id>')
-def download_resume_pdf(resume_id):
+# ---------------- DELETE RESUME ---------------- #
+@app.route('/delete_resume/<int:resume_id>', methods=['POST'])
+def delete_resume(resume_id):
+    if 'user_id' not in session:
+        flash("Please login to manage resumes.", "warning")
+        return redirect(url_for('login'))
+
     resume = Resume.query.get_or_404(resume_id)
+    if session.get('role') != 'admin' and resume.user_id != session.get('user_id'):
+        flash("You do not have permission to delete this resume.", "danger")
+        return redirect(url_for('candidate_dashboard'))
 
-    # Create an in-memory PDF
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=35,
-        leftMargin=35,
-        topMargin=40,
-        bottomMargin=40
-    )
-    styles = getSampleStyleSheet()
-    content = []
-
-    # ------------------- CANDIDATE NAME (Extracted or fallback) -------------------
-    candidate_name = resume.candidate_name or "Unknown"
-
-
-    # ------------------- UPDATED TITLE -------------------
-    title_style = styles['Title']
-    title_style.alignment = TA_CENTER
-    content.append(Paragraph(f"{candidate_name} - Resume Analysis Report", title_style))
-    content.append(Spacer(1, 0.2 * inch))
-
-    # ------------------- ONLY SHOW CANDIDATE NAME -------------------
-    info_style = ParagraphStyle('info', parent=styles["Normal"], spaceAfter=3)
-    content.append(Paragraph(f"<b>Candidate Name:</b> {candidate_name}", info_style))
-    content.append(Spacer(1, 0.15 * inch))
-
-    # ------------------- ANALYSIS SUMMARY -------------------
-    content.append(Paragraph("<b>Analysis Summary:</b>", styles["Heading3"]))
-    summary_text = resume.parsed_text or "No summary available."
-    content.append(Paragraph(summary_text, styles["Normal"]))
-    content.append(Spacer(1, 0.15 * inch))
-
-    # ------------------- CURRENT SKILLS -------------------
-    content.append(Paragraph("<b>Current Skills:</b>", styles["Heading3"]))
-    if resume.skills:
-        if isinstance(resume.skills, str):
-            skills_text = resume.skills
-        else:
-            skills_text = ", ".join(json.loads(resume.skills))
-        content.append(Paragraph(skills_text, styles["Normal"]))
-    else:
-        content.append(Paragraph("No skills found.", styles["Normal"]))
-    content.append(Spacer(1, 0.15 * inch))
-
-    # ------------------- PREDICTED ROLE -------------------
-    content.append(Paragraph("<b>Predicted Job Role:</b>", styles["Heading3"]))
-    content.append(Paragraph(resume.predicted_role or "Not available.", styles["Normal"]))
-    content.append(Spacer(1, 0.15 * inch))
-
-    # ------------------- RECOMMENDED SKILLS -------------------
-    content.append(Paragraph("<b>Recommended Skills:</b>", styles["Heading3"]))
-    if resume.recommended_skills:
-        if isinstance(resume.recommended_skills, str):
-            recommended_skills = [s.strip() for s in resume.recommended_skills.split(",")]
-        else:
-            recommended_skills = resume.recommended_skills
-        for skill in recommended_skills:
-            content.append(Paragraph(f"• {skill}", styles["Normal"]))
-    else:
-        content.append(Paragraph("No recommendations available.", styles["Normal"]))
-    content.append(Spacer(1, 0.15 * inch))
-
-    # ------------------- COURSES -------------------
-    content.append(Paragraph("<b>Courses & Certifications:</b>", styles["Heading3"]))
-    if resume.courses:
-        try:
-            course_names = json.loads(resume.courses)
-            course_links = json.loads(resume.course_links or "[]")
-            for name, link in zip(course_names, course_links):
-                content.append(Paragraph(f"• <a href='{link}'>{name}</a>", styles["Normal"]))
-        except:
-            content.append(Paragraph(resume.courses, styles["Normal"]))
-    else:
-        content.append(Paragraph("No course recommendations available.", styles["Normal"]))
-    content.append(Spacer(1, 0.2 * inch))
-
-    # ------------------- ROADMAP IMAGE (IF AVAILABLE) -------------------
-    if resume.predicted_role and resume.predicted_role in ROADMAPS:
-        roadmap_info = ROADMAPS[resume.predicted_role]
-        roadmap_title = roadmap_info.get('title', '')
-        roadmap_image = roadmap_info.get('image', '')
-
-        if roadmap_image and os.path.exists(roadmap_image):
-            try:
-                roadmap_title_style = ParagraphStyle(
-                    'roadmap_title',
-                    parent=styles["Heading3"],
-                    alignment=TA_CENTER,
-                    spaceAfter=6,
-                    fontSize=12,
-                    textColor=colors.HexColor('#0d47a1')
-                )
-                content.append(Paragraph(roadmap_title, roadmap_title_style))
-                content.append(Spacer(1, 0.1 * inch))
-
-                img = RLImage(roadmap_image)
-                max_width = 5.6 * inch
-                if img.drawWidth > max_width:
-                    scale = max_width / float(img.drawWidth)
-                    img.drawWidth *= scale
-                    img.drawHeight *= scale
-
-                img.hAlign = 'CENTER'
-                content.append(img)
-                content.append(Spacer(1, 0.15 * inch))
-            except:
-                content.append(Paragraph("⚠️ Roadmap image error", styles["Normal"]))
-        else:
-            content.append(Paragraph("Roadmap image not found.", styles["Normal"]))
-    else:
-        content.append(Paragraph("No roadmap available for this role.", styles["Normal"]))
-
-    content.append(Spacer(1, 0.15 * inch))
-
-    # ------------------- TIPS -------------------
-    content.append(Paragraph("<b>Resume Tips:</b>", styles["Heading3"]))
-    if resume.tips:
-        tips_list = [t.strip() for t in resume.tips.split("\n")]
-        for tip in tips_list:
-            color = "green" if tip.startswith("[+]") else "red"
-            content.append(Paragraph(f'<font color="{color}">{tip}</font>', styles["Normal"]))
-    else:
-        content.append(Paragraph("No tips available.", styles["Normal"]))
-    content.append(Spacer(1, 0.15 * inch))
-
-    # ------------------- SCORE -------------------
-    content.append(Paragraph("<b>Overall Resume Score:</b>", styles["Heading3"]))
-    content.append(Paragraph(f"<b>{resume.resume_score or 'N/A'} / 100</b>", styles["Normal"]))
-
-    # ------------------- FOOTER -------------------
-    footer_style = ParagraphStyle(
-        'footer',
-        parent=styles["Normal"],
-        alignment=TA_CENTER,
-        textColor=colors.grey,
-        fontSize=8,
-        spaceBefore=15
-    )
+    digest = resume.content_hash if holds_blob_ref(resume) else None
+    orphaned = release_blob(digest)
+    db.session.delete(resume)
+    db.session.commit()
+    if orphaned:
+        remove_orphaned_blob(digest)
+    analytics.invalidate()
+    MATCHER.remove(resume_id)
+    REPORT_CACHE.discard(resume_id)
+
+    flash("Resume deleted.", "info")
+    if session.get('role') == 'admin':
+        return redirect(url_for('admin_dashboard'))
+    return redirect(url_for('candidate_dashboard'))
+
+
+# ---------------- ORIGINAL FILE DOWNLOAD ---------------- #
+@app.route('/resume_file/<int:resume_id>')
+def download_resume_file(resume_id):
+    if 'user_id' not in session:
+        flash("Please login to download resumes.", "warning")
+        return redirect(url_for('login'))
 
-    content.append(Spacer(1, 0.1 * inch))
-    content.append(Paragraph("Generated by AI Resume Analyzer", footer_style))
+    resume = Resume.query.get_or_404(resume_id)
+    if session.get('role') == 'candidate' and resume.user_id != session.get('user_id'):
+        flash("You do not have permission to download this resume.", "danger")
+        return redirect(url_for('candidate_dashboard'))
 
-    doc.build(content)
-    buffer.seek(0)
+    digest, source = resume_file_source(resume)
+    if source is None:
+        flash("The original file for this resume is no longer available.", "warning")
+        return redirect(url_for('view_resume', resume_id=resume.id))
 
+    # A path goes out through the WSGI file wrapper (sendfile) without being read here
     return send_file(
-        buffer,
+        source if isinstance(source, str) else BytesIO(source),
+        mimetype=resume.file_mime or "application/octet-stream",
         as_attachment=True,
-        download_name=f"{candidate_name.replace(' ', '_')}_Resume_Analysis.pdf",
-        mimetype="application/pdf"
+        download_name=resume.file_name or f"resume_{resume.id}",
+        etag=digest,
+        conditional=True,
     )
 
 
+# ---------------- ANALYSIS STATUS ---------------- #
+@app.route('/resume_status/<int:resume_id>')
+def resume_status(resume_id):
+    if 'user_id' not in session:
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    resume = Resume.query.get_or_404(resume_id)
+    if session.get('role') == 'candidate' and resume.user_id != session.get('user_id'):
+        return jsonify({'error': 'Forbidden'}), 403
+
+    if resume.status in ('pending', 'processing'):
+        requeue_if_stalled(resume)
+
+    return jsonify({
+        'id': resume.id,
+        'status': resume.status or 'done',
+        'error': resume.analysis_error,
+    })
+
+
+@app.route('/download_resume_pdf/<int:resume_id>')
+def download_resume_pdf(resume_id):
+    if 'user_id' not in session:
+        flash("Please login to download resumes.", "warning")
+        return redirect(url_for('login'))
+
+    resume = Resume.query.get_or_404(resume_id)
+    if session.get('role') == 'candidate' and resume.user_id != session.get('user_id'):
+        flash("You do not have permission to download this report.", "danger")
+        return redirect(url_for('candidate_dashboard'))
+
+    fields = report_fields(resume)
+    fingerprint = report_fingerprint(fields)
+
+    # Rendering is the slow part; repeat downloads come from the cache (or a 304)
+    cached = REPORT_CACHE.open(resume.id, fingerprint)
+    if cached is None:
+        with metrics.stage('pdf_build'):
+            pdf = build_report_pdf(fields)
+        REPORT_CACHE.put(resume.id, fingerprint, pdf)
+        cached = BytesIO(pdf)
+
+    return send_file(
+        cached,
+        as_attachment=True,
+        download_name=report_filename(fields),
+        mimetype="application/pdf",
+        etag=fingerprint,
+        conditional=True,
+    )
 
 
 # ---------------- ADMIN DASHBOARD ---------------- #
+def format_timestamp(ts):
+    return ts.strftime("%Y-%m-%d %H:%M:%S") if isinstance(ts, datetime) else (str(ts) if ts else "-")
+
+
+def resume_listing_query():
+    """
+    One joined query for the admin resume table and Excel export:
+    only the listed columns, newest first, no per-row User lookup.
+    """
+    return (
+        db.session.query(
+            Resume.id,
+            Resume.file_name,
+            Resume.predicted_role,
+            Resume.uploaded_at,
+            Resume.candidate_name,
+            User.name.label('user_name'),
+            User.email.label('email'),
+            User.role.label('user_role'),
+        )
+        .outerjoin(User, Resume.user_id == User.id)
+        .order_by(Resume.id.desc())
+    )
+
+
+ADMIN_PAGE_SIZE = 50
+ADMIN_MAX_PAGE_SIZE = 500
+
+
+def _parse_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
+
+def _page_limit(args):
+    limit = args.get('limit', ADMIN_PAGE_SIZE, type=int)
+    return max(1, min(limit, ADMIN_MAX_PAGE_SIZE))
+
+
+def _email_filter(column, email):
+    # Full addresses hit the index; fragments fall back to a substring match
+    if '@' in email:
+        return column == email
+    return column.ilike(f"%{_like_escape(email)}%", escape="\\")
+
+
+def _like_escape(value):
+    """Make %, _ and the escape character match literally in a LIKE pattern."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def filter_resumes(query, args):
+    """
+    Apply the admin resume filters to a query that joins User:
+    role, min_score, max_score, date_from, date_to (YYYY-MM-DD), email.
+    """
+    role = (args.get('role') or '').strip()
+    if role == 'Not Analyzed':
+        query = query.filter(Resume.predicted_role.is_(None))
+    elif role:
+        query = query.filter(Resume.predicted_role == role)
+
+    min_score = _parse_float(args.get('min_score'))
+    if min_score is not None:
+        query = query.filter(Resume.resume_score >= min_score)
+    max_score = _parse_float(args.get('max_score'))
+    if max_score is not None:
+        query = query.filter(Resume.resume_score <= max_score)
+
+    date_from = _parse_date(args.get('date_from'))
+    if date_from:
+        query = query.filter(Resume.uploaded_at >= date_from)
+    date_to = _parse_date(args.get('date_to'))
+    if date_to:
+        query = query.filter(Resume.uploaded_at < date_to + timedelta(days=1))
+
+    email = (args.get('email') or '').strip()
+    if email:
+        query = query.filter(_email_filter(User.email, email))
+    return query
+
+
+def resume_page(args):
+    """
+    One keyset page of the admin resume table (filters: see filter_resumes).
+    Paging: `after` is the last Resume.id already shown; ids descend.
+    Returns (rows, next_after) where next_after is None on the last page.
+    """
+    query = filter_resumes(resume_listing_query(), args)
+
+    after = args.get('after', type=int)
+    if after:
+        query = query.filter(Resume.id < after)
+
+    limit = _page_limit(args)
+    rows = query.limit(limit + 1).all()
+    next_after = rows[limit - 1].id if len(rows) > limit else None
+
+    return [
+        {
+            'id': row.id,
+            'user_name': row.user_name or row.candidate_name or '-',
+            'email': row.email or '-',
+            'role': row.user_role or '-',
+            'file_name': row.file_name or '-',
+            'predicted_role': row.predicted_role or "Not Analyzed",
+            'uploaded_at': format_timestamp(row.uploaded_at),
+        }
+        for row in rows[:limit]
+    ], next_after
+
+
+def feedback_page(args):
+    """
+    One keyset page of the admin feedback table.
+    Filters: fb_rating, fb_email (prefixed so they don't collide with the
+    resume table's filters on the same page). Paging: `fb_after` is the
+    last Feedback.id shown.
+    """
+    query = db.session.query(
+        Feedback.id, Feedback.name, Feedback.email, Feedback.rating,
+        Feedback.comments, Feedback.submitted_at,
+    ).order_by(Feedback.id.desc())
+
+    rating = (args.get('fb_rating') or '').strip()
+    if rating:
+        query = query.filter(Feedback.rating == rating)
+
+    email = (args.get('fb_email') or '').strip()
+    if email:
+        query = query.filter(_email_filter(Feedback.email, email))
+
+    after = args.get('fb_after', type=int)
+    if after:
+        query = query.filter(Feedback.id < after)
+
+    limit = _page_limit(args)
+    rows = query.limit(limit + 1).all()
+    next_after = rows[limit - 1].id if len(rows) > limit else None
+
+    return [
+        {
+            'id': f.id,
+            'name': f.name or '',
+            'email': f.email or '',
+            'rating': f.rating or '',
+            'comments': f.comments or '',
+            'created_at': format_timestamp(f.submitted_at),
+        }
+        for f in rows[:limit]
+    ], next_after
+
+
 @app.route('/admin')
 def admin_dashboard():
     if 'user_id' not in session or session.get('role') != 'admin':
         flash("Please login as Admin to access this page.", "warning")
         return redirect(url_for('login'))
 
-    total_users = User.query.count()
-
-    # Build a safe list of resume rows for template (dictionary objects)
-    resumes_rows = []
-    all_resumes = Resume.query.order_by(Resume.id.desc()).all()
-    for r in all_resumes:
-        user = User.query.get(r.user_id) if r.user_id else None
-        # handle possible timestamp fields
-        uploaded_ts = None
-        for attr in ('created_at', 'uploaded_at', 'timestamp'):
-            if hasattr(r, attr):
-                uploaded_ts = getattr(r, attr)
-                break
-        # format timestamp if datetime-like
-        uploaded_str = uploaded_ts.strftime("%Y-%m-%d %H:%M:%S") if isinstance(uploaded_ts, datetime) else (str(uploaded_ts) if uploaded_ts else "-")
-
-        resumes_rows.append({
-            'id': getattr(r, 'id', None),
-            'user_name': user.name if user else getattr(r, 'candidate_name', '-') or '-',
-            'email': user.email if user else '-',
-            'role': user.role if user else '-',
-            'file_name': getattr(r, 'file_name', '-') or '-',
-            'predicted_role': getattr(r, 'predicted_role', None) or "Not Analyzed",
-            'uploaded_at': uploaded_str,
-        })
+    # First keyset page of each table; the rest is fetched via /admin/api/*
+    resumes_rows, resume_next = resume_page(request.args)
+    feedback_rows, feedback_next = feedback_page(request.args)
 
-    # Fetch feedback list for template
-    feedback_rows = []
-    all_feedbacks = Feedback.query.order_by(getattr(Feedback, 'id', Feedback.__table__.c.keys()[0]).desc()).all() if Feedback.query.count() > 0 else []
-    for f in all_feedbacks:
-        # handle possible timestamp fields
-        fb_ts = None
-        for attr in ('created_at', 'submitted_at', 'timestamp'):
-            if hasattr(f, attr):
-                fb_ts = getattr(f, attr)
-                break
-        fb_str = fb_ts.strftime("%Y-%m-%d %H:%M:%S") if isinstance(fb_ts, datetime) else (str(fb_ts) if fb_ts else "-")
-        feedback_rows.append({
-            'id': getattr(f, 'id', None),
-            'name': getattr(f, 'name', '') or '',
-            'email': getattr(f, 'email', '') or '',
-            'rating': getattr(f, 'rating', '') or '',
-            'comments': getattr(f, 'comments', '') or '',
-            'created_at': fb_str
-        })
-
-    # -----------------------
-  # Ratings chart
-    rating_counts_query = db.session.query(Feedback.rating, func.count(Feedback.id)).group_by(Feedback.rating).all()
-    rating_labels = [str(rating or "No Rating") for rating, _ in rating_counts_query]
-    rating_counts = [cnt for _, cnt in rating_counts_query]
-
-    if not rating_labels:
-        rating_labels, rating_counts = ['No Rating'], [0]
-
-    # Predicted roles chart
-    predicted_query = db.session.query(Resume.predicted_role, func.count(Resume.id)).group_by(Resume.predicted_role).all()
-    predicted_labels = [role or 'Not Analyzed' for role, _ in predicted_query]
-    predicted_counts = [cnt for _, cnt in predicted_query]
-    if not predicted_labels:
-        predicted_labels, predicted_counts = ['Not Analyzed'], [0]
-
-    # Score distribution
-    score_buckets = {'0-40': 0, '41-60': 0, '61-80': 0, '81-100': 0}
-    for (score,) in db.session.query(Resume.resume_score).all():
-        if score is None:
-            continue
-        if score <= 40:
-            score_buckets['0-40'] += 1
-        elif score <= 60:
-            score_buckets['41-60'] += 1
-        elif score <= 80:
-            score_buckets['61-80'] += 1
-        else:
-            score_buckets['81-100'] += 1
-
-    score_labels = list(score_buckets.keys())
-    score_counts = list(score_buckets.values())
+    # Chart numbers (cached, see modules/analytics.py)
+    stats = analytics.get_dashboard_stats()
 
     return render_template(
         'admin.html',
-        total_users=total_users,
+        total_users=stats['total_users'],
         resumes=resumes_rows,
         feedbacks=feedback_rows,
-        rating_labels=rating_labels,
-        rating_counts=rating_counts,
-        predicted_labels=predicted_labels,
-        predicted_counts=predicted_counts,
-        score_labels=score_labels,
-        score_counts=score_counts
+        resume_next=resume_next,
+        feedback_next=feedback_next,
+        filters=request.args,
+        role_options=list(JOB_KEYWORDS.keys()),
+        rating_labels=stats['rating_labels'],
+        rating_counts=stats['rating_counts'],
+        predicted_labels=stats['predicted_labels'],
+        predicted_counts=stats['predicted_counts'],
+        score_labels=stats['score_labels'],
+        score_counts=stats['score_counts']
     )
 
-# ---------------- EXPORT ALL USERS ---------------- #
-@app.route('/export_excel')
-def export_excel():
+# ---------------- ADMIN LISTING API ---------------- #
+@app.route('/admin/api/resumes')
+def admin_api_resumes():
     if 'user_id' not in session or session.get('role') != 'admin':
-        flash("Unauthorized access!", "danger")
+        return jsonify({'error': 'Unauthorized'}), 403
+    rows, next_after = resume_page(request.args)
+    return jsonify({'items': rows, 'next_after': next_after})
+
+
+@app.route('/admin/api/feedback')
+def admin_api_feedback():
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    rows, next_after = feedback_page(request.args)
+    return jsonify({'items': rows, 'next_after': next_after})
+
+# Uploaded archives are imported by a background thread; the admin page
+# polls the job's progress and report.
+INGEST_JOBS = ReportBatchStore(
+    os.environ.get("INGEST_JOB_DIR", os.path.join(os.getcwd(), 'ingest_jobs')),
+    ttl=int(os.environ.get("INGEST_JOB_TTL", 24 * 3600)),
+    stale_after=ANALYSIS_STALE_SECONDS,
+)
+# One archive is imported at a time per web process; later ones wait as "queued"
+_ingest_slot = threading.Semaphore(1)
+
+
+@contextmanager
+def _job_slot(slot, store, state):
+    """Hold a job slot; while waiting for it, keep re-saving the queued state so it isn't taken for stalled."""
+    while not slot.acquire(timeout=store.stale_after / 3):
+        store.save(state)
+    try:
+        yield
+    finally:
+        slot.release()
+
+
+def run_ingest_job(state):
+    """Background job: import a job's uploaded archive, saving the report after every batch."""
+    archive = INGEST_JOBS.zip_path(state['id'])
+    with _job_slot(_ingest_slot, INGEST_JOBS, state), app.app_context():
+        INGEST_JOBS.update(state, status='running')
+        try:
+            owner = db.session.get(User, state['owner_id'])
+            report = ingest_resumes(
+                iter_zip(archive), owner,
+                on_batch=lambda report: INGEST_JOBS.update(state, done=report.succeeded, **report.as_dict()),
+            )
+            INGEST_JOBS.update(state, status='done', finished_at=time.time(),
+                               done=report.succeeded, **report.as_dict())
+        except Exception as e:
+            traceback.print_exc()
+            INGEST_JOBS.update(state, status='failed', finished_at=time.time(),
+                               errors=state['errors'] + [{'error': str(e)}])
+        finally:
+            if os.path.exists(archive):
+                os.remove(archive)
+            db.session.remove()
+
+
+def _ingest_status(state):
+    body = {key: state.get(key) for key in (
+        'id', 'status', 'total', 'done', 'failed', 'errors', 'files', 'seconds', 'docs_per_sec',
+    )}
+    body['progress'] = round(100 * (state['done'] + state['failed']) / state['total'], 1) if state['total'] else 100
+    body['status_url'] = url_for('admin_api_ingest_job', job_id=state['id'])
+    return body
+
+
+@app.route('/admin/ingest', methods=['POST'])
+def admin_ingest():
+    """Bulk upload: a .zip of resumes, imported under the admin's account by a background job."""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    archive = request.files.get('archive')
+    if not archive or not archive.filename.lower().endswith('.zip'):
+        return jsonify({'error': 'Upload a .zip archive of PDF/DOCX resumes.'}), 400
+    try:
+        total = count_zip_entries(archive.stream)
+    except zipfile.BadZipFile:
+        return jsonify({'error': 'Not a valid .zip archive.'}), 400
+
+    INGEST_JOBS.cleanup()
+    state = INGEST_JOBS.create({}, total, owner_id=session['user_id'])
+    archive.stream.seek(0)
+    archive.save(INGEST_JOBS.zip_path(state['id']))
+    threading.Thread(target=run_ingest_job, args=(state,), name="ingest", daemon=True).start()
+    return jsonify(_ingest_status(state)), 202
+
+
+@app.route('/admin/api/ingest/<job_id>')
+def admin_api_ingest_job(job_id):
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    state = INGEST_JOBS.get(job_id)
+    if state is None:
+        return jsonify({'error': 'Unknown import.'}), 404
+    return jsonify(_ingest_status(state))
+
+
+# ---------------- JOB DESCRIPTION RANKING ---------------- #
+MATCH_DEFAULT_K = 20
+MATCH_MAX_K = 200
+
+
+def _match_k(value):
+    try:
+        k = int(value)
+    except (TypeError, ValueError):
+        k = MATCH_DEFAULT_K
+    return max(1, min(k, MATCH_MAX_K))
+
+
+def rank_candidates(job_text, k=MATCH_DEFAULT_K):
+    """
+    Top-k stored resumes for a job description, with candidate details;
+    None while the index is still being built.
+    """
+    matcher = get_matcher()
+    if matcher is None:
+        return None
+    hits = matcher.search(job_text, k=k)
+    if not hits:
+        return []
+
+    rows = {
+        row.id: row
+        for row in db.session.query(
+            Resume.id, Resume.candidate_name, Resume.file_name,
+            Resume.predicted_role, Resume.resume_score, User.email.label('email'),
+        )
+        .outerjoin(User, User.id == Resume.user_id)
+        .filter(Resume.id.in_([hit['key'] for hit in hits]))
+    }
+
+    results = []
+    for hit in hits:
+        row = rows.get(hit['key'])
+        if row is None:
+            continue   # deleted by another worker since the index was built
+        results.append({
+            'resume_id': row.id,
+            'candidate_name': row.candidate_name,
+            'email': row.email,
+            'file_name': row.file_name,
+            'predicted_role': row.predicted_role,
+            'resume_score': row.resume_score,
+            'match_score': hit['score'],
+            'strengths': hit['strengths'],
+            'gaps': hit['gaps'],
+        })
+    return results
+
+
+@app.route('/admin/match', methods=['GET', 'POST'])
+def admin_match():
+    if 'user_id' not in session or session.get('role') != 'admin':
+        flash("Please login as Admin to access this page.", "warning")
         return redirect(url_for('login'))
 
-    resumes = Resume.query.order_by(Resume.id.desc()).all()
+    job_text = request.form.get('job_description', '').strip()
+    k = _match_k(request.form.get('k'))
+    results, took_ms, indexing = None, None, False
+    if job_text:
+        started = time.perf_counter()
+        results = rank_candidates(job_text, k)
+        took_ms = round((time.perf_counter() - started) * 1000, 1)
+        indexing = results is None
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "All Users"
-    ws.append(["ID", "User Name", "Email", "Role", "Resume File", "Predicted Role", "Uploaded On"])
+    return render_template('admin_match.html', job_text=job_text, k=k, results=results,
+                           took_ms=took_ms, indexing=indexing)
 
-    for r in resumes:
-        user = User.query.get(r.user_id) if r.user_id else None
-        uploaded_ts = None
-        for attr in ('created_at', 'uploaded_at', 'timestamp'):
-            if hasattr(r, attr):
-                uploaded_ts = getattr(r, attr)
-                break
-        uploaded_str = uploaded_ts.strftime("%Y-%m-%d %H:%M:%S") if isinstance(uploaded_ts, datetime) else (str(uploaded_ts) if uploaded_ts else "-")
 
-        ws.append([
-            r.id,
-            user.name if user else "-",
-            user.email if user else "-",
-            user.role if user else "-",
-            getattr(r, 'file_name', '-') or '-',
-            getattr(r, 'predicted_role', None) or "Not Analyzed",
-            uploaded_str
-        ])
-
-    output = BytesIO()
+@app.route('/admin/api/match', methods=['POST'])
+def admin_api_match():
+    """JSON: {"job_description": "...", "k": 20} -> ranked resumes with strengths and gaps."""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    data = request.get_json(silent=True) or request.form
+    job_text = (data.get('job_description') or '').strip()
+    if not job_text:
+        return jsonify({'error': 'job_description is required'}), 400
+
+    started = time.perf_counter()
+    results = rank_candidates(job_text, _match_k(data.get('k')))
+    if results is None:
+        return jsonify({'error': 'The resume index is still being built; try again shortly.'}), 503
+    return jsonify({
+        'results': results,
+        'took_ms': round((time.perf_counter() - started) * 1000, 1),
+    })
+
+
+# ---------------- BATCH PDF REPORTS ---------------- #
+# Reports for every resume matching the admin filters, rendered on the
+# analysis process pool in a background thread and written into a ZIP.
+REPORT_BATCHES = ReportBatchStore(
+    os.environ.get("REPORT_BATCH_DIR", os.path.join(os.getcwd(), 'report_batches')),
+    ttl=int(os.environ.get("REPORT_BATCH_TTL", 24 * 3600)),
+    stale_after=ANALYSIS_STALE_SECONDS,
+)
+REPORT_BATCH_MAX = int(os.environ.get("REPORT_BATCH_MAX", 5000))
+REPORT_BATCH_CHUNK = 100
+REPORT_BATCH_FILTERS = ('role', 'min_score', 'max_score', 'date_from', 'date_to', 'email')
+# One batch renders at a time per web process; later ones wait as "queued"
+_report_batch_slot = threading.Semaphore(1)
+
+
+def _batch_query(filters):
+    query = db.session.query(Resume.id).outerjoin(User, Resume.user_id == User.id)
+    return filter_resumes(query, filters)
+
+
+def _batch_chunks(filters):
+    """Yield lists of (resume_id, report fields), REPORT_BATCH_CHUNK at a time, by id."""
+    ids = _batch_query(filters).subquery()
+    last_id = 0
+    while True:
+        chunk = (
+            Resume.query
+            .join(ids, Resume.id == ids.c.id)
+            .filter(Resume.id > last_id)
+            .order_by(Resume.id)
+            .options(db.load_only(*(getattr(Resume, name) for name in REPORT_FIELDS)))
+            .limit(REPORT_BATCH_CHUNK)
+            .all()
+        )
+        if not chunk:
+            return
+        last_id = chunk[-1].id
+        yield [(resume.id, report_fields(resume)) for resume in chunk]
+        db.session.expunge_all()
+
+
+def run_report_batch(state):
+    """Background job: render (or reuse cached) reports for a batch into its ZIP."""
+    with _job_slot(_report_batch_slot, REPORT_BATCHES, state), app.app_context():
+        REPORT_BATCHES.update(state, status='running')
+        part = REPORT_BATCHES.zip_path(state['id'], partial=True)
+        try:
+            with zipfile.ZipFile(part, 'w', zipfile.ZIP_STORED) as zf:
+                for chunk in _batch_chunks(state['filters']):
+                    pending = []
+                    for resume_id, fields in chunk:
+                        name = f"{resume_id}_{report_filename(fields)}"
+                        fingerprint = report_fingerprint(fields)
+                        cached = REPORT_CACHE.open(resume_id, fingerprint)
+                        if cached is not None:
+                            with cached:
+                                zf.writestr(name, cached.read())
+                            state['done'] += 1
+                        else:
+                            pending.append((resume_id, name, fingerprint, fields))
+
+                    # PDFs are already compressed, so entries are stored as-is
+                    rendered = ANALYSIS_QUEUE.map_cpu(build_report_pdf, [(p[3],) for p in pending])
+                    for (resume_id, name, fingerprint, _), (pdf, error) in zip(pending, rendered):
+                        if error is not None:
+                            state['failed'] += 1
+                            if len(state['errors']) < 50:
+                                state['errors'].append({'resume_id': resume_id, 'error': str(error)})
+                            continue
+                        zf.writestr(name, pdf)
+                        REPORT_CACHE.put(resume_id, fingerprint, pdf)
+                        state['done'] += 1
+                    REPORT_BATCHES.save(state)
+            os.replace(part, REPORT_BATCHES.zip_path(state['id']))
+            REPORT_BATCHES.update(state, status='done', finished_at=time.time())
+        except Exception as e:
+            traceback.print_exc()
+            if os.path.exists(part):
+                os.remove(part)
+            REPORT_BATCHES.update(state, status='failed', finished_at=time.time(),
+                                  errors=state['errors'] + [{'error': str(e)}])
+        finally:
+            db.session.remove()
+
+
+def _batch_status(state):
+    body = {key: state[key] for key in ('id', 'status', 'total', 'done', 'failed', 'errors', 'filters')}
+    body['progress'] = round(100 * (state['done'] + state['failed']) / state['total'], 1) if state['total'] else 100
+    body['status_url'] = url_for('admin_api_report_batch', job_id=state['id'])
+    if state['status'] == 'done':
+        body['download_url'] = url_for('download_report_batch', job_id=state['id'])
+    return body
+
+
+@app.route('/admin/api/report_batches', methods=['POST'])
+def admin_api_create_report_batch():
+    """Start a batch report job for the resumes matching the posted filters."""
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+
+    data = request.get_json(silent=True) or request.form
+    filters = {key: str(data[key]).strip() for key in REPORT_BATCH_FILTERS if data.get(key)}
+    total = _batch_query(filters).count()
+    if total == 0:
+        return jsonify({'error': 'No resumes match these filters.'}), 400
+    if total > REPORT_BATCH_MAX:
+        return jsonify({'error': f'{total} resumes match; narrow the filters to at most {REPORT_BATCH_MAX}.'}), 400
+
+    REPORT_BATCHES.cleanup()
+    state = REPORT_BATCHES.create(filters, total, owner_id=session['user_id'])
+    threading.Thread(target=run_report_batch, args=(state,), name="report-batch", daemon=True).start()
+    return jsonify(_batch_status(state)), 202
+
+
+@app.route('/admin/api/report_batches/<job_id>')
+def admin_api_report_batch(job_id):
+    if 'user_id' not in session or session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    state = REPORT_BATCHES.get(job_id)
+    if state is None:
+        return jsonify({'error': 'Unknown batch.'}), 404
+    return jsonify(_batch_status(state))
+
+
+@app.route('/admin/report_batches/<job_id>.zip')
+def download_report_batch(job_id):
+    if 'user_id' not in session or session.get('role') != 'admin':
+        flash("Please login as Admin to access this page.", "warning")
+        return redirect(url_for('login'))
+    state = REPORT_BATCHES.get(job_id)
+    if state is None or state['status'] != 'done':
+        flash("That report batch is not available.", "warning")
+        return redirect(url_for('admin_dashboard'))
+    return send_file(
+        REPORT_BATCHES.zip_path(job_id),
+        mimetype="application/zip",
+        as_attachment=True,
+        download_name=f"resume_reports_{job_id[:8]}.zip",
+        conditional=True,
+    )
+
+
+# ---------------- EXPORT HELPERS ---------------- #
+EXPORT_CHUNK_ROWS = 1000
+XLSX_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def _csv_chunks(header, rows):
+    """Yield CSV text in blocks of EXPORT_CHUNK_ROWS rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for i, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if i % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+def export_response(header, rows, filename, sheet_title):
+    """
+    Send `rows` (a lazy iterable) as a download without holding them in memory.
+    ?format=csv streams chunks as they are read from the cursor; the default
+    .xlsx uses a write-only workbook spooled to a temp file.
+    """
+    if request.args.get('format') == 'csv':
+        return Response(
+            stream_with_context(_csv_chunks(header, rows)),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename={secure_filename(filename)}.csv'}
+        )
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+
+    output = tempfile.TemporaryFile()
     wb.save(output)
     output.seek(0)
 
     return send_file(
         output,
         as_attachment=True,
-        download_name='all_users_report.xlsx',
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        download_name=f"{filename}.xlsx",
+        mimetype=XLSX_MIME
+    )
+
+
+# ---------------- EXPORT ALL USERS ---------------- #
+@app.route('/export_excel')
+def export_excel():
+    if 'user_id' not in session or session.get('role') != 'admin':
+        flash("Unauthorized access!", "danger")
+        return redirect(url_for('login'))
+
+    # yield_per -> server-side cursor on PostgreSQL, rows fetched in chunks
+    rows = (
+        [
+            row.id,
+            row.user_name or "-",
+            row.email or "-",
+            row.user_role or "-",
+            row.file_name or '-',
+            row.predicted_role or "Not Analyzed",
+            format_timestamp(row.uploaded_at)
+        ]
+        for row in resume_listing_query().yield_per(EXPORT_CHUNK_ROWS)
+    )
+
+    return export_response(
+        ["ID", "User Name", "Email", "Role", "Resume File", "Predicted Role", "Uploaded On"],
+        rows,
+        'all_users_report',
+        "All Users"
     )
 
 # ---------------- EXPORT USER REPORT ---------------- #
@@ -1843,42 +1959,31 @@ def export_user_excel(email):
         flash("No user found with that email.", "warning")
         return redirect(url_for('admin_dashboard'))
 
-    resumes = Resume.query.filter_by(user_id=user.id).order_by(Resume.id.desc()).all()
+    resumes = (
+        db.session.query(Resume.id, Resume.file_name, Resume.predicted_role, Resume.uploaded_at)
+        .filter(Resume.user_id == user.id)
+        .order_by(Resume.id.desc())
+    )
 
-    if not resumes:
+    if resumes.first() is None:
         flash("No data found for this user.", "warning")
         return redirect(url_for('admin_dashboard'))
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "User Report"
-    ws.append(["Resume ID", "Resume File", "Predicted Role", "Uploaded On"])
-
-    for r in resumes:
-        uploaded_ts = None
-        for attr in ('created_at', 'uploaded_at', 'timestamp'):
-            if hasattr(r, attr):
-                uploaded_ts = getattr(r, attr)
-                break
-        uploaded_str = uploaded_ts.strftime("%Y-%m-%d %H:%M:%S") if isinstance(uploaded_ts, datetime) else (str(uploaded_ts) if uploaded_ts else "-")
-
-        ws.append([
+    rows = (
+        [
             r.id,
-            getattr(r, 'file_name', '-') or '-',
-            getattr(r, 'predicted_role', None) or "Not Analyzed",
-            uploaded_str
-        ])
-
-    output = BytesIO()
-    wb.save(output)
-    output.seek(0)
+            r.file_name or '-',
+            r.predicted_role or "Not Analyzed",
+            format_timestamp(r.uploaded_at)
+        ]
+        for r in resumes.yield_per(EXPORT_CHUNK_ROWS)
+    )
 
-    filename = f"{user.name or 'user'}_report.xlsx"
-    return send_file(
-        output,
-        as_attachment=True,
-        download_name=filename,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    return export_response(
+        ["Resume ID", "Resume File", "Predicted Role", "Uploaded On"],
+        rows,
+        f"{user.name or 'user'}_report",
+        "User Report"
     )
 
 # ---------------- FEEDBACK ---------------- #
@@ -1906,6 +2011,7 @@ def submit_feedback():
         )
         db.session.add(new_feedback)
         db.session.commit()
+        analytics.invalidate()
 
         flash("Thank you for your feedback!", "success")
     except Exception as e:
@@ -1916,31 +2022,8 @@ def submit_feedback():
 
 @app.route("/roadmaps")
 def show_roadmaps():
-    roadmaps = [
-        {"name": "Data Science", "image": "roadmaps/data_science_roadmap.png"},
-        {"name": "Web Development", "image": "roadmaps/web_development_roadmap.png"},
-        {"name": "Android Development", "image": "roadmaps/android_development_roadmap.png"},
-        {"name": "iOS Development", "image": "roadmaps/ios_development_roadmap.png"},
-        {"name": "UI/UX Design", "image": "roadmaps/ui_ux_design_roadmap.png"},
-        {"name": "Data Analyst", "image": "roadmaps/data_analyst_roadmap.png"},
-        {"name": "Cloud & DevOps", "image": "roadmaps/cloud___devops_roadmap.png"},
-        {"name": "Cybersecurity", "image": "roadmaps/cybersecurity_roadmap.png"},
-        {"name": "Quality Assurance", "image": "roadmaps/quality_assurance_roadmap.png"},
-        {"name": "Business Analyst", "image": "roadmaps/business_analyst_roadmap.png"},
-        {"name": "Database Administrator", "image": "roadmaps/database_administrator_roadmap.png"},
-        {"name": "AI / NLP Engineer", "image": "roadmaps/ai___nlp_engineer_roadmap.png"},
-        {"name": "Product Manager", "image": "roadmaps/product_manager_roadmap.png"},
-        {"name": "Python Developer", "image": "roadmaps/python_developer_roadmap.png"},
-        {"name": "Java Developer", "image": "roadmaps/java_developer_roadmap.png"},
-        {"name": "C/C++ Developer", "image": "roadmaps/c_c___developer_roadmap.png"},
-        {"name": ".NET Developer", "image": "roadmaps/_net_developer_roadmap.png"},
-        {"name": "JavaScript Developer", "image": "roadmaps/javascript_developer_roadmap.png"},
-        {"name": "Full Stack Developer", "image": "roadmaps/fullstack_developer_roadmap.png"},
-        {"name": "Backend Developer", "image": "roadmaps/backend_developer_roadmap.png"},
-        {"name": "Frontend Developer", "image": "roadmaps/frontend_developer_roadmap.png"}
-    ]
-
-    return render_template("roadmap.html", roadmaps=roadmaps)
+    # Every catalog role whose roadmap image exists on disk
+    return render_template("roadmap.html", roadmaps=AVAILABLE_ROADMAPS)
 
 @app.route('/logout')
 def logout():
@@ -0,0 +1,72 @@
+"""
+Benchmark: ranking N resumes against one job description with
+MatcherIndex (one fit, one sparse mat-vec per query) vs. calling
+match_resume_job once per resume (a TF-IDF fit per pair).
+
+    python benchmarks/bench_matcher.py [num_resumes]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.matcher import MatcherIndex, match_resume_job  # noqa: E402
+from modules.parser import SKILL_BANK  # noqa: E402
+
+FILLER = (
+    "worked team project delivered built designed implemented managed "
+    "university college degree bachelor internship responsible developed "
+    "tested deployed improved customers stakeholders reporting"
+).split()
+
+JOB = (
+    "We are hiring a backend engineer with strong python, django and sql "
+    "experience. Docker, kubernetes and aws are a plus; you will design "
+    "rest api services and work with the data team."
+)
+
+
+def synthetic_resume(rng, words=400):
+    return " ".join(rng.choice(SKILL_BANK) if rng.random() < 0.1 else rng.choice(FILLER) for _ in range(words))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(3)
+    corpus = [(i, synthetic_resume(rng)) for i in range(n)]
+
+    t0 = time.perf_counter()
+    index = MatcherIndex().fit(corpus)
+    fit = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    top = index.search(JOB, k=10)
+    query = time.perf_counter() - t0
+
+    # The per-pair path is too slow for the whole corpus: time a sample and extrapolate
+    sample = corpus[:min(n, 200)]
+    t0 = time.perf_counter()
+    for _, text in sample:
+        match_resume_job(text, JOB)
+    pairwise = (time.perf_counter() - t0) / len(sample) * n
+
+    t0 = time.perf_counter()
+    for i in range(100):
+        index.add(n + i, synthetic_resume(rng))
+    index.remove(0)
+    index.search(JOB, k=10)
+    incremental = time.perf_counter() - t0
+
+    print(f"resumes:                    {n}")
+    print(f"index fit (once):           {fit * 1000:9.1f} ms")
+    print(f"index query (top-10):       {query * 1000:9.1f} ms")
+    print(f"match_resume_job x {n:<7}  {pairwise * 1000:9.1f} ms (extrapolated from {len(sample)})")
+    print(f"100 adds + remove + query:  {incremental * 1000:9.1f} ms")
+    print(f"query speedup vs pairwise:  {pairwise / query:9.0f}x")
+    print("top-3:", [(r["key"], r["score"], r["strengths"][:3]) for r in top[:3]])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: per-engine PDF extraction time and text yield, and the sniffing
+strategy (extract_text_bytes) vs. the old pdfplumber-then-PyPDF2 sequence.
+
+    python benchmarks/bench_pdf_engines.py [pdf_dir]
+
+Without a directory a fixture corpus is generated with reportlab/Pillow:
+text resumes from a few producers, multi-page CVs, image-only scans and
+near-empty files.
+"""
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw  # noqa: E402
+from reportlab.lib.utils import ImageReader  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+from modules import parser  # noqa: E402
+
+WORDS = (
+    "python django flask sql docker kubernetes aws react experience project "
+    "team delivered built designed implemented managed university degree"
+).split()
+
+
+# ---------------- FIXTURE CORPUS ----------------
+def text_pdf(rng, pages=1, producer="ReportLab", lines=40):
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    c.setProducer(producer)
+    for _ in range(pages):
+        y = 800
+        for _ in range(lines):
+            c.drawString(50, y, " ".join(rng.choice(WORDS) for _ in range(10)))
+            y -= 18
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def scanned_pdf(rng, pages=1):
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    c.setProducer("Canon iR-ADV Scan")
+    for _ in range(pages):
+        img = Image.new("L", (850, 1100), 255)
+        draw = ImageDraw.Draw(img)
+        for row in range(40):
+            draw.text((40, 30 + row * 25), " ".join(rng.choice(WORDS) for _ in range(8)), fill=0)
+        c.drawImage(ImageReader(img), 0, 0, width=595, height=842)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def fixture_corpus():
+    rng = random.Random(11)
+    corpus = []
+    for producer in ("ReportLab", "Microsoft Word 2016", "pdfTeX-1.40.21", "pdfTeX-1.40.25"):
+        corpus += [(f"text/{producer}", text_pdf(rng, producer=producer)) for _ in range(3)]
+    corpus += [("text/4-pages", text_pdf(rng, pages=4)) for _ in range(2)]
+    corpus += [("scan/1-page", scanned_pdf(rng)) for _ in range(3)]
+    corpus += [("scan/3-pages", scanned_pdf(rng, pages=3)) for _ in range(2)]
+    corpus += [("tiny", text_pdf(rng, lines=1)) for _ in range(2)]
+    return corpus
+
+
+def directory_corpus(path):
+    corpus = []
+    for name in sorted(os.listdir(path)):
+        if name.lower().endswith(".pdf"):
+            with open(os.path.join(path, name), "rb") as f:
+                corpus.append((name, f.read()))
+    return corpus
+
+
+# ---------------- STRATEGIES ----------------
+def legacy_extract(data):
+    """The sequence extract_text_bytes used before engine selection."""
+    text = "\n".join(parser._pdf_page_texts("pdfplumber", data)).strip()
+    if len(text) > parser.MIN_TEXT_CHARS:
+        return parser._clean_text(text)
+    return parser._clean_text(parser._extract_pdf_bytes_pypdf2(data))
+
+
+def engine_only(engine):
+    return lambda data: parser._run_engine(engine, data)[0]
+
+
+def strategy(data):
+    return parser.extract_text_bytes(data, "application/pdf")
+
+
+def measure(fn, corpus, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chars = usable = 0
+        for _, data in corpus:
+            text = fn(data)
+            chars += len(text)
+            usable += len(text) > parser.MIN_TEXT_CHARS
+        best = min(best, time.perf_counter() - started)
+    return best, chars, usable
+
+
+def main():
+    corpus = directory_corpus(sys.argv[1]) if len(sys.argv) > 1 else fixture_corpus()
+    print(f"documents: {len(corpus)}")
+
+    rows = [
+        ("pdfplumber only", engine_only("pdfplumber")),
+        ("pypdf2 only", engine_only("pypdf2")),
+        ("legacy sequence", legacy_extract),
+        ("sniff + select", strategy),
+    ]
+    print(f"{'strategy':<16} {'total ms':>9} {'ms/doc':>8} {'chars':>8} {'usable':>7}")
+    for label, fn in rows:
+        seconds, chars, usable = measure(fn, corpus)
+        print(f"{label:<16} {seconds * 1000:>9.1f} {seconds / len(corpus) * 1000:>8.1f} {chars:>8} {usable:>7}")
+
+    mismatches = sum(1 for _, data in corpus if strategy(data) != legacy_extract(data))
+    print(f"documents whose text differs from the legacy sequence: {mismatches}")
+
+    print("\nper-engine counters (this process):")
+    for name, stats in parser.engine_stats().items():
+        print(f"  {name:<11} runs={stats['runs']:<4} avg={stats['avg_ms']:.1f} ms  usable={stats['usable']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: page-parallel vs. serial PDF text extraction by page count.
+
+    python benchmarks/bench_pdf_pages.py [workers]
+
+Needs reportlab (already a dependency) to generate the test PDFs.
+"""
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reportlab.lib.pagesizes import A4  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+from modules import parser  # noqa: E402
+
+PAGE_COUNTS = [1, 4, 8, 16, 32, 64]
+WORDS = (
+    "python django flask sql docker kubernetes aws react experience project "
+    "team delivered built designed implemented managed university degree"
+).split()
+
+
+def synthetic_pdf(pages, rng):
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
+    for p in range(pages):
+        y = 800
+        c.drawString(50, y, f"Page {p + 1}")
+        for _ in range(50):
+            y -= 15
+            c.drawString(50, y, " ".join(rng.choice(WORDS) for _ in range(12)))
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(2, parser.PARALLEL_WORKERS)
+    rng = random.Random(7)
+
+    print(f"workers: {workers}")
+    print(f"{'engine':<11} {'pages':>5} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+    for engine in ("pdfplumber", "pypdf2"):
+        for pages in PAGE_COUNTS:
+            data = synthetic_pdf(pages, rng)
+            serial, expected = best_of(lambda: parser._pdf_page_texts(engine, data, min_pages=0, max_pages=0))
+            parallel, got = best_of(
+                lambda: parser._pdf_page_texts(engine, data, min_pages=1, workers=workers, max_pages=0)
+            )
+            if got != expected:
+                print(f"WARNING: {engine} output differs at {pages} pages")
+            print(f"{engine:<11} {pages:>5} {serial * 1000:>10.1f} {parallel * 1000:>12.1f} "
+                  f"{serial / parallel:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Micro-benchmark: single-pass skill matcher vs. the old per-skill regex loop.
+
+    python benchmarks/bench_skill_matcher.py [num_resumes]
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.parser import SKILL_BANK, find_skills  # noqa: E402
+
+FILLER = (
+    "worked team project delivered built designed implemented managed "
+    "university college degree bachelor internship responsible for the "
+    "and with using in of to a on developed tested deployed improved"
+).split()
+
+
+def legacy_find_skills(text):
+    """The loop analyze_resume used before the compiled matcher."""
+    lowered = (text or "").lower()
+    found = []
+    for skill in SKILL_BANK:
+        sl = skill.lower()
+        if re.search(rf"\b{re.escape(sl)}\b", lowered):
+            found.append(sl)
+    return sorted(set(found))
+
+
+def synthetic_resume(rng, words=600):
+    tokens = []
+    for _ in range(words):
+        if rng.random() < 0.08:
+            tokens.append(rng.choice(SKILL_BANK).upper() if rng.random() < 0.2 else rng.choice(SKILL_BANK))
+        else:
+            tokens.append(rng.choice(FILLER))
+        if rng.random() < 0.05:
+            tokens.append(rng.choice([",", "/", "(", ")", "-", "\n•", "+", "#", "."]))
+    return " ".join(tokens)
+
+
+def bench(fn, corpus, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for doc in corpus:
+            fn(doc)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(42)
+    corpus = [synthetic_resume(rng) for _ in range(n)]
+
+    mismatches = sum(1 for doc in corpus if find_skills(doc) != legacy_find_skills(doc))
+    if mismatches:
+        print(f"WARNING: {mismatches} resumes matched differently")
+
+    legacy = bench(legacy_find_skills, corpus)
+    compiled = bench(find_skills, corpus)
+
+    print(f"resumes:           {n}")
+    print(f"per-skill loop:    {legacy * 1000:8.1f} ms  ({legacy / n * 1e6:7.1f} us/resume)")
+    print(f"single-pass regex: {compiled * 1000:8.1f} ms  ({compiled / n * 1e6:7.1f} us/resume)")
+    print(f"speedup:           {legacy / compiled:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
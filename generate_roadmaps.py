@@ -1,184 +1,98 @@
+"""
+Build step: render the roadmap images in static/roadmaps/ from the
+roadmap steps in data/role_catalog.json (modules.catalog.ROADMAPS).
+
+Each role's image is keyed by a hash of its steps plus the render
+parameters, recorded in a manifest next to the images; only roles whose
+key changed (or whose files are missing) are re-rendered, in parallel
+across a process pool. Every roadmap is written as an optimized PNG and a
+WebP variant.
+
+    python generate_roadmaps.py [--force] [--workers N] [--output-dir DIR]
+"""
+import argparse
+import hashlib
+import json
 import os
-from PIL import Image, ImageDraw, ImageFont
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
-# ---------- DEFINE ALL ROADMAPS ----------
-ROADMAPS = {
-    'Data Science': [
-        'Learn Python, Statistics, and Probability',
-        'Master Pandas, NumPy, and Data Visualization',
-        'Understand Machine Learning Algorithms',
-        'Work on Kaggle and Real ML Projects',
-        'Build and Deploy End-to-End ML Pipelines'
-    ],
-    'Web Development': [
-        'Learn HTML, CSS, and JavaScript',
-        'Master Frontend Frameworks (React/Angular)',
-        'Learn Backend (Node.js, Django, Laravel)',
-        'Work with Databases like MySQL, MongoDB',
-        'Deploy Full Stack Apps to Cloud'
-    ],
-    'Android Development': [
-        'Learn Java/Kotlin and Android Studio',
-        'Understand XML Layouts and Jetpack Components',
-        'Use APIs, SQLite, and Firebase',
-        'Build Responsive Android UI/UX',
-        'Publish Apps to Google Play Store'
-    ],
-    'iOS Development': [
-        'Learn Swift and Xcode',
-        'Master UIKit and SwiftUI',
-        'Understand API Integration and Core Data',
-        'Build Production-Level iOS Apps',
-        'Publish App on Apple App Store'
-    ],
-    'UI/UX Design': [
-        'Learn Design Thinking Process',
-        'Practice Wireframing and Prototyping',
-        'Master Figma and Adobe XD Tools',
-        'Conduct Usability Testing',
-        'Build and Publish Your UI/UX Portfolio'
-    ],
-    'Data Analyst': [
-        'Master Excel, SQL, and Power BI/Tableau',
-        'Understand Data Cleaning and Preparation',
-        'Learn Data Visualization Techniques',
-        'Perform Statistical and Business Analysis',
-        'Create Dashboards and Real Reports'
-    ],
-    'Cloud & DevOps': [
-        'Learn Linux and Cloud Fundamentals',
-        'Master AWS, Azure, or Google Cloud',
-        'Work with Docker and Kubernetes',
-        'Build CI/CD Pipelines with Jenkins',
-        'Implement Infrastructure as Code (Terraform)'
-    ],
-    'Cybersecurity': [
-        'Learn Networking, OS, and Protocols',
-        'Master Tools (Nmap, Burp Suite, Wireshark)',
-        'Understand Firewalls, SIEM, IDS/IPS',
-        'Perform Vulnerability Assessment & PenTesting',
-        'Prepare for CEH/Security+ Certification'
-    ],
-    'Quality Assurance': [
-        'Learn Software Testing Fundamentals',
-        'Master Manual & Automation Testing',
-        'Work with Selenium, Cypress, and Postman',
-        'Write Test Cases & Bug Reports (JIRA)',
-        'Integrate QA with CI/CD Pipelines'
-    ],
-    'Business Analyst': [
-        'Learn Business Analysis Fundamentals',
-        'Understand Requirement Gathering & SDLC',
-        'Master Excel, SQL, and Documentation',
-        'Use Tools like JIRA, Power BI',
-        'Work with Stakeholders & Agile Teams'
-    ],
-    'Database Administrator': [
-        'Learn SQL & Database Fundamentals',
-        'Master Database Architecture & Normalization',
-        'Work with Oracle, PostgreSQL, MySQL',
-        'Handle Backups, Recovery, and Security',
-        'Optimize Performance & Indexing'
-    ],
-    'AI / NLP Engineer': [
-        'Learn NLP Basics and Text Processing',
-        'Master ML & Deep Learning Concepts',
-        'Work with BERT, GPT, Transformers',
-        'Use HuggingFace, SpaCy, NLTK',
-        'Deploy NLP Models at Scale'
-    ],
-    'Product Manager': [
-        'Understand Product Lifecycle',
-        'Learn Market Research & Strategy',
-        'Master Agile, Scrum & Roadmapping',
-        'Use Tools like JIRA, Notion, Trello',
-        'Deliver Real Product Launches'
-    ],
-    'Python Developer': [
-        'Learn Core Python and OOP',
-        'Master Django or Flask Frameworks',
-        'Work with REST APIs and Databases',
-        'Learn Testing, Debugging, Deployment',
-        'Build Real-World Python Applications'
-    ],
-    'Java Developer': [
-        'Master Core Java & OOP',
-        'Learn Spring & Spring Boot',
-        'Work with Hibernate & Microservices',
-        'Build Secure REST APIs',
-        'Deploy Java Apps to Cloud'
-    ],
-    'C/C++ Developer': [
-        'Learn C/C++ Fundamentals',
-        'Master Memory Management & Pointers',
-        'Work with STL and OOP Concepts',
-        'Practice OS & Linux Programming',
-        'Build High-Performance Applications'
-    ],
-    '.NET Developer': [
-        'Learn C# Programming',
-        'Master ASP.NET Core & MVC',
-        'Work with Entity Framework & LINQ',
-        'Build REST APIs using .NET',
-        'Deploy .NET Projects to Cloud'
-    ],
-    'JavaScript Developer': [
-        'Master Core JavaScript & DOM',
-        'Understand Async JS, Promises, Event Loop',
-        'Learn TypeScript and Modern ES6+',
-        'Build Real Projects with Vanilla JS',
-        'Deploy JS Apps to Production'
-    ],
-    'Full Stack Developer': [
-        'Learn Frontend (HTML, CSS, JS, React)',
-        'Master Backend (Node/Django/PHP)',
-        'Work with Databases (SQL/NoSQL)',
-        'Learn Git, API Design, and Testing',
-        'Deploy Full Stack Projects'
-    ],
-    'Backend Developer': [
-        'Learn Server-Side Languages',
-        'Master REST API Development',
-        'Work with Redis, Authentication, JWT',
-        'Use SQL + NoSQL Databases',
-        'Implement Caching & Deployments'
-    ],
-    'Frontend Developer': [
-        'Master HTML, CSS, and JavaScript',
-        'Learn Frameworks (React, Vue)',
-        'Build Responsive UI with Tailwind/Bootstrap',
-        'Learn Web Accessibility & Performance',
-        'Deploy Frontend Apps to Cloud'
-    ]
-}
+from PIL import Image, ImageDraw, ImageFont
 
+from modules.catalog import ROADMAPS
 
 # ---------- OUTPUT FOLDER ----------
-output_dir = os.path.join('static', 'roadmaps')
-os.makedirs(output_dir, exist_ok=True)
-
-# ---------- FONT ----------
-try:
-    font = ImageFont.truetype("arial.ttf", 22)
-except:
-    font = ImageFont.load_default()
-
-# ---------- GENERATE ROADMAP IMAGES ----------
-for role, steps in ROADMAPS.items():
-    width, height = 1100, 120 + len(steps) * 100
-    img = Image.new('RGB', (width, height), color=(240, 248, 255))
+OUTPUT_DIR = os.path.join('static', 'roadmaps')
+MANIFEST_NAME = '.roadmaps_manifest.json'
+
+# ---------- RENDER PARAMETERS ----------
+# Everything that changes the pixels; part of each roadmap's hash
+FONT_FILE = "arial.ttf"
+RENDER = {
+    "version": 1,
+    "width": 1100,
+    "header": 120,
+    "row": 100,
+    "font_size": 22,
+    "background": (240, 248, 255),
+    "title_color": (0, 51, 102),
+    "box_color": (25, 118, 210),
+    "text_color": (255, 255, 255),
+    "connector_color": (33, 150, 243),
+}
+
+
+def load_font():
+    """(font, name of the font actually used); the fallback renders differently."""
+    try:
+        return ImageFont.truetype(FONT_FILE, RENDER["font_size"]), FONT_FILE
+    except OSError:
+        return ImageFont.load_default(), "default"
+
+
+def roadmap_basename(role, roadmap=None):
+    """File name (no extension) of the catalog image path, else derived from the role."""
+    if roadmap and roadmap.get("image"):
+        return os.path.splitext(os.path.basename(roadmap["image"]))[0]
+    return re.sub(r'[^a-zA-Z0-9_]', '_', role.lower()) + "_roadmap"
+
+
+def roadmap_key(role, steps, font_name):
+    payload = json.dumps([role, list(steps), RENDER, font_name], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _save_atomic(img, path, **params):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    os.close(fd)
+    try:
+        img.save(tmp_path, **params)
+        os.chmod(tmp_path, 0o644)   # mkstemp creates 0600; these are served as static files
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ---------- GENERATE ONE ROADMAP IMAGE ----------
+def render_roadmap(role, steps, output_dir, name=None):
+    """Draw one roadmap and write <name>.png and <name>.webp; returns the file names."""
+    font, _ = load_font()
+    width, height = RENDER["width"], RENDER["header"] + len(steps) * RENDER["row"]
+    img = Image.new('RGB', (width, height), color=RENDER["background"])
     draw = ImageDraw.Draw(img)
 
     # Title
     title = f"{role} Roadmap"
     text_width = draw.textlength(title, font=font)
-    draw.text(((width - text_width) / 2, 30), title, fill=(0, 51, 102), font=font)
+    draw.text(((width - text_width) / 2, 30), title, fill=RENDER["title_color"], font=font)
 
-    y = 120
-    box_color = (25, 118, 210)
-    text_color = (255, 255, 255)
-    connector_color = (33, 150, 243)
+    y = RENDER["header"]
+    box_color = RENDER["box_color"]
+    text_color = RENDER["text_color"]
+    connector_color = RENDER["connector_color"]
 
     for i, step in enumerate(steps):
         x1, y1, x2, y2 = 100, y, width - 100, y + 60
@@ -194,12 +108,98 @@ for role, steps in ROADMAPS.items():
                 (mid_x + 10, y2 + 35),
                 (mid_x, y2 + 50)
             ], fill=connector_color)
-        y += 100
+        y += RENDER["row"]
+
+    # Save image: few flat colours, so a palette PNG is much smaller and looks the same
+    name = name or roadmap_basename(role)
+    png = img.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+    _save_atomic(png, os.path.join(output_dir, name + ".png"), format="PNG", optimize=True)
+    _save_atomic(png, os.path.join(output_dir, name + ".webp"), format="WEBP",
+                 lossless=True, method=6)
+    return [name + ".png", name + ".webp"]
+
+
+def _render_task(args):
+    return render_roadmap(*args)
+
+
+# ---------- MANIFEST ----------
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix=".tmp-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, path)
+
+
+def outdated_roles(roadmaps, manifest, output_dir, font_name, force=False):
+    """{role: key} for roadmaps whose hash changed or whose files are missing."""
+    outdated = {}
+    for role, roadmap in roadmaps.items():
+        key = roadmap_key(role, roadmap["steps"], font_name)
+        entry = manifest.get(role, {})
+        files = entry.get("files", [])
+        current = (
+            entry.get("key") == key
+            and files
+            and all(os.path.exists(os.path.join(output_dir, f)) for f in files)
+        )
+        if force or not current:
+            outdated[role] = key
+    return outdated
+
+
+# ---------- BUILD ----------
+def build(roadmaps=ROADMAPS, output_dir=OUTPUT_DIR, workers=None, force=False):
+    """
+    Render the changed roadmaps of `roadmaps` ({role: {"steps", "image"}},
+    the catalog by default); returns (rendered roles, unchanged count).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    _, font_name = load_font()
+    manifest = load_manifest(output_dir)
+    outdated = outdated_roles(roadmaps, manifest, output_dir, font_name, force)
+
+    tasks = [
+        (role, list(roadmaps[role]["steps"]), output_dir, roadmap_basename(role, roadmaps[role]))
+        for role in outdated
+    ]
+    workers = workers or os.cpu_count() or 1
+    if len(tasks) > 1 and workers > 1:
+        with ProcessPoolExecutor(min(workers, len(tasks))) as pool:
+            results = list(pool.map(_render_task, tasks))
+    else:
+        results = [_render_task(t) for t in tasks]
+
+    for (role, *_), files in zip(tasks, results):
+        manifest[role] = {"key": outdated[role], "files": files}
+        print(f"✅ Generated: {os.path.join(output_dir, files[0])} (+ .webp)")
+    # Forget roles that were removed from the catalog
+    for role in set(manifest) - set(roadmaps):
+        del manifest[role]
+    save_manifest(output_dir, manifest)
+    return list(outdated), len(roadmaps) - len(outdated)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render roadmap images (only the changed ones).")
+    parser.add_argument("--force", action="store_true", help="re-render every roadmap")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    rendered, unchanged = build(output_dir=args.output_dir, workers=args.workers, force=args.force)
+    print(f"\n🎉 {len(rendered)} roadmap image(s) rendered, {unchanged} unchanged, in {args.output_dir}/")
 
-    # Save image
-    filename = re.sub(r'[^a-zA-Z0-9_]', '_', role.lower()) + "_roadmap.png"
-    filepath = os.path.join(output_dir, filename)
-    img.save(filepath)
-    print(f"✅ Generated: {filepath}")
 
-print("\n🎉 All roadmap images created successfully in static/roadmaps/")
+if __name__ == "__main__":
+    main()
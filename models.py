@@ -25,21 +25,22 @@ class Resume(db.Model):
     __table_args__ = {'extend_existing': True}
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     file_name = db.Column(db.String(200), nullable=False)
 
     # ⭐ REQUIRED FIELDS (add these)
-    file_data = db.Column(db.LargeBinary)         # store PDF/DOCX bytes
+    # Deferred: list views never need the bytes; they're loaded on first access
+    file_data = db.deferred(db.Column(db.LargeBinary))   # store PDF/DOCX bytes
     file_mime = db.Column(db.String(100))         # pdf/docx mime type
 
     parsed_text = db.Column(db.Text)
     skills = db.Column(db.Text)
     experience = db.Column(db.String(100))
     suggested_roles = db.Column(db.String(255))
-    uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
-    predicted_role = db.Column(db.String(100))
+    uploaded_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    predicted_role = db.Column(db.String(100), index=True)
     recommended_skills = db.Column(db.Text)
-    resume_score = db.Column(db.Float)
+    resume_score = db.Column(db.Float, index=True)
     tips = db.Column(db.Text)
 
     courses = db.Column(db.Text)
@@ -47,10 +48,58 @@ class Resume(db.Model):
     candidate_name = db.Column(db.String(255))
     candidate_level = db.Column(db.String(50), nullable=True)
 
+    # sha256 of the uploaded bytes: the shared ResumeBlob (new uploads leave
+    # file_data empty) and, with analyzer_version, the stored analysis these
+    # columns were copied from
+    content_hash = db.Column(db.String(64), index=True)
+    analyzer_version = db.Column(db.String(20))
+
+    # Background analysis: pending / processing / done / failed (NULL = legacy row)
+    status = db.Column(db.String(20), index=True)
+    analysis_error = db.Column(db.Text)
+    status_changed_at = db.Column(db.DateTime, index=True)   # matcher sync reads recent ones
+
     def __repr__(self):
         return f"<Resume {self.file_name} for User ID {self.user_id}>"
 
 
+# ------------------- RESUME BLOB MODEL ------------------- #
+class ResumeBlob(db.Model):
+    """Uploaded file stored once per sha256 (bytes in the blob store), shared by every Resume that uploaded it."""
+    __tablename__ = 'resume_blob'
+    __table_args__ = {'extend_existing': True}
+
+    content_hash = db.Column(db.String(64), primary_key=True)   # sha256 of data
+    data = db.deferred(db.Column(db.LargeBinary))   # legacy: bytes now live in the blob store
+    mime = db.Column(db.String(100))
+    size = db.Column(db.Integer)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ResumeBlob {self.content_hash[:12]} refs={self.ref_count}>"
+
+
+# ------------------- RESUME ANALYSIS MODEL ------------------- #
+class ResumeAnalysis(db.Model):
+    """Extracted text + analysis results, keyed by file hash and analyzer version."""
+    __tablename__ = 'resume_analysis'
+    __table_args__ = (
+        db.UniqueConstraint('content_hash', 'analyzer_version', name='uq_analysis_hash_version'),
+        {'extend_existing': True},
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    content_hash = db.Column(db.String(64), nullable=False)      # sha256 of file bytes
+    analyzer_version = db.Column(db.String(20), nullable=False)
+    full_text = db.Column(db.Text)                                 # full extracted text
+    results = db.Column(db.Text)                                   # JSON analysis results
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ResumeAnalysis {self.content_hash[:12]} v{self.analyzer_version}>"
+
+
 # ------------------- FEEDBACK MODEL ------------------- #
 class Feedback(db.Model):
     __tablename__ = 'feedback'
@@ -58,15 +107,18 @@ class Feedback(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
     name = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(120), nullable=False)
-    rating = db.Column(db.String(50), nullable=False)  # ✅ changed from Integer to String
+    email = db.Column(db.String(120), nullable=False, index=True)
+    rating = db.Column(db.String(50), nullable=False, index=True)  # ✅ changed from Integer to String
     comments = db.Column(db.Text)
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 # ------------------- COURSE MODEL ------------------- #
 class Course(db.Model):
     __tablename__ = 'courses'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        db.UniqueConstraint('category', 'name', name='uq_course_category_name'),
+        {'extend_existing': True},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     category = db.Column(db.String(100), nullable=False)  # e.g. Data Science, Web Development, etc.
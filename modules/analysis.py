@@ -0,0 +1,188 @@
+"""
+Resume analysis pipeline: text extraction, skills, role prediction,
+recommendations and section score.
+
+Everything here is pure (no Flask / DB access) so it can run inside a
+worker process; app.py persists the results.
+"""
+import hashlib
+import re
+import time
+
+from modules.catalog import ROLE_CATALOG
+from modules.parser import analyze_resume, extract_experience, extract_text_with_info, find_skills
+from modules.storage import mapped_file
+
+# Bump whenever SKILL_BANK, JOB_KEYWORDS, data/role_catalog.json or the
+# scoring rules change, so stored analyses are recomputed on the next view.
+ANALYZER_VERSION = "5"
+
+
+# Resume sections: (words that show the section is present, score points)
+SECTIONS = {
+    "objective": (['objective', 'summary'], 6),
+    "education": (['education', 'degree', 'college'], 12),
+    "experience": (['experience', 'internship'], 16),
+    "skills": (['skills'], 7),
+    "projects": (['project'], 19),
+    "certifications": (['certificate'], 12),
+    "achievements": (['achievement'], 13),
+    "hobbies": (['hobbies'], 4),
+    "interests": (['interests'], 5),
+}
+
+# Early stop: contact details and every scored section seen, and this many
+# pages in a row with no new skill or experience figure
+STABLE_PAGES = 2
+
+_CONTACT_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+|\+?\d[\d ().-]{7,}\d")
+
+
+def content_hash(file_bytes):
+    return hashlib.sha256(file_bytes or b"").hexdigest()
+
+
+class ResumeScan:
+    """
+    Consumes resume pages as they are extracted and reports when reading
+    further cannot change the score and is unlikely to change the rest of
+    the analysis: the name comes from the first lines, the section score
+    is settled once every section in SECTIONS has been seen (a later page
+    can only add sections), and once STABLE_PAGES pages added no skill and
+    no higher experience figure, later pages are attachments/portfolio.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.skills = set()
+        self.experience = 0
+        self.sections = set()
+        self.has_contact = False
+        self.stable_pages = 0
+
+    def feed(self, page_text):
+        """Add one page; returns True once the scan has converged."""
+        self.text = f"{self.text}\n{page_text}" if self.text else page_text
+
+        # Rescanning the whole prefix keeps skills spanning a page break; it
+        # is microseconds next to extracting the page
+        skills = set(find_skills(self.text))
+        experience = extract_experience(self.text)
+        changed = bool(skills - self.skills) or experience != self.experience
+        self.stable_pages = 0 if changed else self.stable_pages + 1
+        self.skills = skills
+        self.experience = experience
+
+        lowered = self.text.lower()
+        self.sections = {
+            key for key, (words, _) in SECTIONS.items() if any(w in lowered for w in words)
+        }
+        self.has_contact = self.has_contact or bool(_CONTACT_RE.search(page_text))
+        return (
+            self.has_contact
+            and len(self.sections) == len(SECTIONS)
+            and self.stable_pages >= STABLE_PAGES
+        )
+
+
+def build_analysis(text, scorer, timings=None):
+    """
+    Run the full analysis on extracted resume text.
+    `scorer` is a modules.roles.RoleScorer built from the role keywords.
+    Returns a JSON-serializable dict (stored in ResumeAnalysis.results).
+    When a `timings` dict is given, the analyze and role_scoring stage
+    durations (seconds) are written into it.
+    """
+    started = time.perf_counter()
+    analysis = analyze_resume(text)
+
+    # ---------- Skills ----------
+    skills_cleaned = [s.lower().strip() for s in analysis.get("skills_found", [])]
+
+    # ---------- Role Prediction ----------
+    scored = time.perf_counter()
+    role_ranking = [[role, score] for role, score in scorer.rank(skills_cleaned) if score > 0]
+    if timings is not None:
+        timings["analyze"] = round(scored - started, 6)
+        timings["role_scoring"] = round(time.perf_counter() - scored, 6)
+    return _assemble_results(text, analysis, skills_cleaned, role_ranking)
+
+
+def build_analyses(texts, scorer):
+    """
+    build_analysis for many texts at once (same results), scoring roles
+    for all of them with one sparse matrix product (RoleScorer.rank_many).
+    """
+    analyses = [analyze_resume(text) for text in texts]
+    skill_lists = [[s.lower().strip() for s in a.get("skills_found", [])] for a in analyses]
+    rankings = scorer.rank_many(skill_lists)
+    return [
+        _assemble_results(text, analysis, skills, [[role, score] for role, score in ranking])
+        for text, analysis, skills, ranking in zip(texts, analyses, skill_lists, rankings)
+    ]
+
+
+def _assemble_results(text, analysis, skills_cleaned, role_ranking):
+    """Recommendations, section score and tips around the skills / role ranking."""
+    rt_lower = text.lower()
+    predicted_role = role_ranking[0][0] if role_ranking else None
+
+    # ---------- BUILD RECOMMENDATIONS ----------
+    recommended_skills = []
+    courses = []
+
+    if predicted_role and predicted_role in ROLE_CATALOG:
+        recommended_skills = ROLE_CATALOG[predicted_role]["skills"]
+        courses = [{"name": n, "link": l} for n, l in ROLE_CATALOG[predicted_role]["courses"]]
+
+    # ---------- Resume Score ----------
+    resume_score = 0
+    tips = []
+
+    for key, (words, points) in SECTIONS.items():
+        if any(w in rt_lower for w in words):
+            resume_score += points
+            tips.append(f"[+] Great! You included your {key} section.")
+        else:
+            tips.append(f"[-] Please add your {key} section to improve your resume.")
+
+    resume_score = min(resume_score, 100)
+
+    return {
+        "candidate_name": analysis.get("candidate_name"),
+        "summary": analysis.get("summary", ""),
+        "experience": analysis.get("experience", 0),
+        "skills": skills_cleaned,
+        "predicted_role": predicted_role,
+        "role_ranking": role_ranking,
+        "recommended_skills": list(recommended_skills),
+        "courses": courses,
+        "resume_score": resume_score,
+        "tips": tips,
+    }
+
+
+def _new_scan():
+    """Fresh early-stop feed for each engine run."""
+    return ResumeScan().feed
+
+
+def extract_and_analyze(source, mime_type, scorer):
+    """
+    Extract text from a file and analyze it. Returns (text, results);
+    results["extraction"] records the engine used and its timings, and
+    results["timings"] the analyze / role_scoring stage durations.
+    `source` is the file bytes or a path; paths are memory-mapped rather
+    than read into memory. PDF pages are fed to a ResumeScan as they are
+    extracted, so long documents stop once the analysis has converged.
+    """
+    if isinstance(source, str):
+        with mapped_file(source) as data:
+            text, extraction = extract_text_with_info(data, mime_type, _new_scan)
+    else:
+        text, extraction = extract_text_with_info(source, mime_type, _new_scan)
+    timings = {}
+    results = build_analysis(text, scorer, timings)
+    results["extraction"] = extraction
+    results["timings"] = timings
+    return text, results
@@ -0,0 +1,85 @@
+"""
+Admin dashboard analytics: user total, feedback rating histogram,
+per-role resume counts and score buckets.
+
+Numbers come from four aggregate queries (score bucketing is a single
+SQL CASE / GROUP BY) and are kept in an in-process TTL cache. Writers
+call invalidate() after committing uploads, analyses and feedback so
+the dashboard is fresh without recomputing on every page load.
+"""
+import threading
+import time
+
+from sqlalchemy import case, func
+
+from models import db, Feedback, Resume, User
+
+CACHE_TTL_SECONDS = 60
+
+SCORE_BUCKET_LABELS = ['0-40', '41-60', '61-80', '81-100']
+
+_lock = threading.Lock()
+_cache = {'stats': None, 'expires': 0.0}
+
+
+def compute_dashboard_stats():
+    total_users = db.session.query(func.count(User.id)).scalar() or 0
+
+    # Ratings chart
+    rating_rows = db.session.query(Feedback.rating, func.count(Feedback.id)).group_by(Feedback.rating).all()
+    rating_labels = [str(rating or "No Rating") for rating, _ in rating_rows]
+    rating_counts = [cnt for _, cnt in rating_rows]
+    if not rating_labels:
+        rating_labels, rating_counts = ['No Rating'], [0]
+
+    # Predicted roles chart
+    predicted_rows = db.session.query(Resume.predicted_role, func.count(Resume.id)).group_by(Resume.predicted_role).all()
+    predicted_labels = [role or 'Not Analyzed' for role, _ in predicted_rows]
+    predicted_counts = [cnt for _, cnt in predicted_rows]
+    if not predicted_labels:
+        predicted_labels, predicted_counts = ['Not Analyzed'], [0]
+
+    # Score distribution, bucketed in SQL
+    bucket = case(
+        (Resume.resume_score <= 40, '0-40'),
+        (Resume.resume_score <= 60, '41-60'),
+        (Resume.resume_score <= 80, '61-80'),
+        else_='81-100'
+    )
+    score_rows = (
+        db.session.query(bucket, func.count(Resume.id))
+        .filter(Resume.resume_score.isnot(None))
+        .group_by(bucket)
+        .all()
+    )
+    score_buckets = dict.fromkeys(SCORE_BUCKET_LABELS, 0)
+    score_buckets.update(dict(score_rows))
+
+    return {
+        'total_users': total_users,
+        'rating_labels': rating_labels,
+        'rating_counts': rating_counts,
+        'predicted_labels': predicted_labels,
+        'predicted_counts': predicted_counts,
+        'score_labels': list(score_buckets.keys()),
+        'score_counts': list(score_buckets.values()),
+    }
+
+
+def get_dashboard_stats(ttl=CACHE_TTL_SECONDS):
+    """Cached stats; recomputed at most once per `ttl` seconds or after invalidate()."""
+    now = time.monotonic()
+    with _lock:
+        if _cache['stats'] is not None and now < _cache['expires']:
+            return _cache['stats']
+
+    stats = compute_dashboard_stats()
+    with _lock:
+        _cache['stats'] = stats
+        _cache['expires'] = now + ttl
+    return stats
+
+
+def invalidate():
+    with _lock:
+        _cache['stats'] = None
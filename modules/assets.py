@@ -0,0 +1,118 @@
+"""
+Roadmap image registry shared by the roadmap pages and the PDF report.
+
+Every catalog roadmap path is checked once at import; roles whose image is
+missing are listed in MISSING and left out of AVAILABLE_ROADMAPS. For the
+PDF, each image is decoded and downscaled to the report's print size once
+per process (preload() at startup) and kept in memory as JPEG bytes; each
+report wraps them in a fresh ImageReader, which ReportLab embeds as-is (no
+per-report file read, PNG decode or re-compression).
+"""
+import io
+import os
+import threading
+from types import MappingProxyType
+
+from PIL import Image
+from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+
+from modules.catalog import CATALOG_PATH, ROADMAPS
+
+# Paths in the catalog are relative to the project root
+ROOT = os.path.dirname(os.path.dirname(CATALOG_PATH))
+
+REPORT_IMAGE_WIDTH = 5.6 * inch
+REPORT_IMAGE_DPI = 150
+REPORT_JPEG_QUALITY = 90
+
+
+def image_path(roadmap):
+    return os.path.join(ROOT, roadmap["image"])
+
+
+MISSING = tuple(role for role, roadmap in ROADMAPS.items()
+                if not os.path.isfile(image_path(roadmap)))
+
+# Roles with a roadmap whose image is on disk, in catalog order
+AVAILABLE_ROADMAPS = MappingProxyType({
+    role: roadmap for role, roadmap in ROADMAPS.items() if role not in MISSING
+})
+
+
+class _ImageFlowable(Flowable):
+    def __init__(self, reader, width, height):
+        super().__init__()
+        self.reader = reader
+        self.width = width
+        self.height = height
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.width, self.height)
+
+
+class ReportImage:
+    """A roadmap image pre-scaled for the report: shared JPEG data + draw size in points."""
+    __slots__ = ("jpeg", "width", "height")
+
+    def __init__(self, jpeg, width, height):
+        self.jpeg = jpeg
+        self.width = width
+        self.height = height
+
+    def flowable(self):
+        """
+        New flowable for one document (flowables keep layout state while
+        drawn); its own reader, as ImageReader keeps a file position.
+        """
+        return _ImageFlowable(ImageReader(io.BytesIO(self.jpeg)), self.width, self.height)
+
+
+def prescale(path, max_width=REPORT_IMAGE_WIDTH, dpi=REPORT_IMAGE_DPI):
+    """Decode the image once and fit it to max_width points at dpi."""
+    with Image.open(path) as im:
+        # Same sizing rule as before: 1 px = 1 pt, shrunk to max_width if wider
+        width, height = float(im.width), float(im.height)
+        if width > max_width:
+            height *= max_width / width
+            width = max_width
+        pixels = (max(1, round(width / 72 * dpi)), max(1, round(height / 72 * dpi)))
+        rgb = im.convert("RGB")
+        if pixels[0] < rgb.width:
+            rgb = rgb.resize(pixels, Image.LANCZOS)
+        buf = io.BytesIO()
+        rgb.save(buf, "JPEG", quality=REPORT_JPEG_QUALITY, optimize=True)
+    return ReportImage(buf.getvalue(), width, height)
+
+
+_report_images = {}
+_lock = threading.Lock()
+
+
+def report_image(role):
+    """Pre-scaled ReportImage for a role's roadmap, or None when it has no usable image."""
+    try:
+        return _report_images[role]
+    except KeyError:
+        pass
+    roadmap = AVAILABLE_ROADMAPS.get(role)
+    if roadmap is None:
+        return None
+    with _lock:
+        if role not in _report_images:
+            try:
+                _report_images[role] = prescale(image_path(roadmap))
+            except OSError:
+                _report_images[role] = None
+        return _report_images[role]
+
+
+def preload():
+    """Prepare every report image up front (app startup, analysis pool workers)."""
+    for role in AVAILABLE_ROADMAPS:
+        report_image(role)
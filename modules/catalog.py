@@ -0,0 +1,54 @@
+"""
+Role catalog: recommended skills, courses and roadmap for every role.
+
+Loaded once at import from data/role_catalog.json (the single source for
+view_resume, the PDF report and course seeding) and exposed as read-only
+structures shared across requests.
+"""
+import json
+import os
+from types import MappingProxyType
+
+CATALOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "role_catalog.json"
+)
+
+
+def load_catalog(path=CATALOG_PATH):
+    """
+    Read the catalog JSON into frozen structures:
+    {role: {"skills": (str, ...),
+            "courses": ((name, url), ...),
+            "roadmap": {"title", "steps", "image"} or None}}
+    """
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    roles = {}
+    for role, entry in raw.items():
+        roadmap = entry.get("roadmap")
+        roles[role] = MappingProxyType({
+            "skills": tuple(entry.get("skills", [])),
+            "courses": tuple((c["name"], c["url"]) for c in entry.get("courses", [])),
+            "roadmap": MappingProxyType({
+                "title": roadmap["title"],
+                "steps": tuple(roadmap["steps"]),
+                "image": roadmap["image"],
+            }) if roadmap else None,
+        })
+    return MappingProxyType(roles)
+
+
+ROLE_CATALOG = load_catalog()
+
+# Roles that have a roadmap, in catalog order
+ROADMAPS = MappingProxyType({
+    role: entry["roadmap"] for role, entry in ROLE_CATALOG.items() if entry["roadmap"]
+})
+
+
+def iter_courses():
+    """Yield (category, name, url) for every course in the catalog."""
+    for role, entry in ROLE_CATALOG.items():
+        for name, url in entry["courses"]:
+            yield role, name, url
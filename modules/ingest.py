@@ -0,0 +1,110 @@
+"""
+Bulk resume ingestion: entry sources and the per-file report.
+
+Sources yield (name, bytes) one entry at a time, so a large ZIP or
+directory is never held in memory at once. app.ingest_resumes does the
+parsing and database work.
+"""
+import os
+import time
+import zipfile
+
+MIME_BY_EXTENSION = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+}
+
+# Entries above this are reported instead of being read (data is None)
+MAX_ENTRY_BYTES = 10 * 1024 * 1024
+
+
+def mime_for(name):
+    return MIME_BY_EXTENSION.get(os.path.splitext(name)[1].lower())
+
+
+def _skipped(name):
+    """Directories, dotfiles and macOS resource forks."""
+    base = os.path.basename(name.rstrip("/"))
+    return not base or base.startswith(".") or name.startswith("__MACOSX/")
+
+
+# ---------------- SOURCES ----------------
+def iter_zip(fileobj):
+    """Entries of a ZIP archive (path or seekable file), read one at a time."""
+    with zipfile.ZipFile(fileobj) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or _skipped(info.filename):
+                continue
+            if info.file_size > MAX_ENTRY_BYTES:
+                yield info.filename, None
+                continue
+            yield info.filename, archive.read(info)
+
+
+def count_zip_entries(fileobj):
+    """Number of entries iter_zip yields, from the archive's directory alone."""
+    with zipfile.ZipFile(fileobj) as archive:
+        return sum(1 for info in archive.infolist() if not info.is_dir() and not _skipped(info.filename))
+
+
+def iter_directory(path):
+    """Files under a directory (recursively, sorted), read one at a time."""
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            rel = os.path.relpath(full, path)
+            if _skipped(rel):
+                continue
+            if os.path.getsize(full) > MAX_ENTRY_BYTES:
+                yield rel, None
+                continue
+            with open(full, "rb") as f:
+                yield rel, f.read()
+
+
+def iter_source(path):
+    """A .zip file or a directory."""
+    if os.path.isdir(path):
+        return iter_directory(path)
+    return iter_zip(path)
+
+
+# ---------------- REPORT ----------------
+class IngestReport:
+    def __init__(self):
+        self.results = []
+        self.elapsed = 0.0
+        self._started = time.perf_counter()
+
+    def add(self, name, resume_id=None, error=None):
+        self.results.append({"file": name, "ok": error is None, "resume_id": resume_id, "error": error})
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self._started
+
+    @property
+    def succeeded(self):
+        return sum(1 for r in self.results if r["ok"])
+
+    @property
+    def failed(self):
+        return len(self.results) - self.succeeded
+
+    @property
+    def docs_per_sec(self):
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return (f"{self.succeeded} imported, {self.failed} failed in "
+                f"{self.elapsed:.1f}s ({self.docs_per_sec:.1f} docs/sec)")
+
+    def as_dict(self):
+        return {
+            "files": self.results,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "seconds": round(self.elapsed, 3),
+            "docs_per_sec": round(self.docs_per_sec, 2),
+        }
@@ -0,0 +1,112 @@
+"""
+Background resume analysis.
+
+AnalysisQueue hands resume ids to a small thread pool; each job runs the
+app's handler inside an app context. The CPU-bound extract/analyze step
+is sent to a process pool (run_cpu) so a slow PDF never blocks a request
+worker or the GIL. Both pools are created lazily on first use.
+"""
+import multiprocessing
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class AnalysisQueue:
+    def __init__(self, threads=2, processes=2, initializer=None):
+        """
+        threads: concurrent jobs (DB work + waiting on the process pool).
+        processes: size of the parsing process pool; 0 parses in-thread.
+        initializer: called once in each pool process as it starts.
+        """
+        self.threads = threads
+        self.processes = processes
+        self.initializer = initializer
+        self._app = None
+        self._handler = None
+        self._thread_pool = None
+        self._process_pool = None
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def init_app(self, app, handler):
+        """handler(resume_id) is called inside app.app_context() for each job."""
+        self._app = app
+        self._handler = handler
+
+    # ---------------- POOLS ----------------
+    def _threads(self):
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.threads, thread_name_prefix="resume-analysis"
+                )
+            return self._thread_pool
+
+    def _processes(self):
+        with self._lock:
+            if self._process_pool is None:
+                # spawn: forking a threaded web worker is unsafe
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self.initializer,
+                )
+            return self._process_pool
+
+    def run_cpu(self, fn, *args):
+        """Run fn(*args) in the process pool (or inline if disabled) and return its result."""
+        if not self.processes:
+            return fn(*args)
+        return self._processes().submit(fn, *args).result()
+
+    def map_cpu(self, fn, arg_tuples):
+        """
+        Run fn(*args) for every args tuple across the process pool (inline if
+        disabled). Yields (result, exception) in input order, so one bad
+        input doesn't stop the rest.
+        """
+        if not self.processes:
+            for args in arg_tuples:
+                try:
+                    yield fn(*args), None
+                except Exception as e:
+                    yield None, e
+            return
+
+        pool = self._processes()
+        futures = [pool.submit(fn, *args) for args in arg_tuples]
+        for future in futures:
+            try:
+                yield future.result(), None
+            except Exception as e:
+                yield None, e
+
+    # ---------------- JOBS ----------------
+    def is_queued(self, resume_id):
+        with self._lock:
+            return resume_id in self._in_flight
+
+    def submit(self, resume_id):
+        """Queue analysis for a resume. Returns False if it is already queued here."""
+        with self._lock:
+            if resume_id in self._in_flight:
+                return False
+            self._in_flight.add(resume_id)
+        self._threads().submit(self._run, resume_id)
+        return True
+
+    def _run(self, resume_id):
+        try:
+            with self._app.app_context():
+                self._handler(resume_id)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            with self._lock:
+                self._in_flight.discard(resume_id)
+
+    def shutdown(self, wait=True):
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait)
@@ -1,6 +1,9 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+import scipy.sparse as sp
 import re
+import threading
 
 def clean_text(text):
     """
@@ -48,3 +51,161 @@ def match_resume_job(resume_text, job_text):
         'weaknesses': weaknesses
     }
     return result
+
+
+# ---------------- MATCHER INDEX ----------------
+class MatcherIndex:
+    """
+    TF-IDF index over the stored resume corpus.
+
+    The vocabulary and IDF are fitted once over every resume (fit), and
+    each resume is kept as an L2-normalised row of one sparse matrix, so a
+    job description is scored against all of them with a single sparse
+    matrix-vector product. Resumes uploaded or deleted later are added
+    and removed incrementally against the fitted vocabulary; `stale`
+    says when enough has changed that the IDF should be refitted.
+    Thread-safe.
+    """
+
+    def __init__(self, max_features=50000, refit_ratio=0.5):
+        self.max_features = max_features
+        self.refit_ratio = refit_ratio
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self.vectorizer = None
+        self._terms = None
+        self._matrix = None          # csr: one row per indexed resume
+        self._pending = []           # rows added since the last search
+        self._keys = []              # row -> key
+        self._rows = {}              # key -> row (live rows only)
+        self._alive = np.zeros(0, dtype=bool)
+        self._fitted_docs = 0
+        self._changes = 0
+
+    # ---------------- BUILD ----------------
+    def fit(self, docs):
+        """Learn vocabulary + IDF from (key, text) pairs and index all of them."""
+        keys, texts = [], []
+        for key, text in docs:
+            keys.append(key)
+            texts.append(text or "")
+
+        vectorizer = TfidfVectorizer(
+            preprocessor=clean_text,
+            stop_words="english",
+            sublinear_tf=True,
+            max_features=self.max_features,
+            dtype=np.float32,
+        )
+        try:
+            matrix = vectorizer.fit_transform(texts).tocsr()
+        except ValueError:
+            # No documents, or nothing but stop words
+            vectorizer, matrix = None, None
+
+        with self._lock:
+            self._reset()
+            if vectorizer is None:
+                return self
+            self.vectorizer = vectorizer
+            self._terms = vectorizer.get_feature_names_out()
+            self._matrix = matrix
+            self._keys = keys
+            self._rows = {key: row for row, key in enumerate(keys)}
+            self._alive = np.ones(len(keys), dtype=bool)
+            self._fitted_docs = len(keys)
+        return self
+
+    @property
+    def fitted(self):
+        return self.vectorizer is not None
+
+    @property
+    def stale(self):
+        """True once adds/removes since fit exceed refit_ratio of the fitted corpus."""
+        return self._changes > self.refit_ratio * max(self._fitted_docs, 1)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    # ---------------- INCREMENTAL ----------------
+    def add(self, key, text):
+        """Index (or re-index) one resume. Returns False if the index isn't fitted yet."""
+        with self._lock:
+            if self.vectorizer is None:
+                return False
+            self.remove(key)
+            self._pending.append(self.vectorizer.transform([text or ""]))
+            self._rows[key] = len(self._keys)
+            self._keys.append(key)
+            self._alive = np.append(self._alive, True)
+            self._changes += 1
+            return True
+
+    def remove(self, key):
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is None:
+                return False
+            self._alive[row] = False
+            self._changes += 1
+            return True
+
+    def _flush(self):
+        """Stack pending rows into the matrix; drop dead rows once they are a quarter of it."""
+        if self._pending:
+            self._matrix = sp.vstack([self._matrix, *self._pending], format="csr")
+            self._pending = []
+        dead = len(self._keys) - len(self._rows)
+        if dead and dead * 4 >= len(self._keys):
+            live = np.flatnonzero(self._alive)
+            self._matrix = self._matrix[live]
+            self._keys = [self._keys[row] for row in live]
+            self._rows = {key: row for row, key in enumerate(self._keys)}
+            self._alive = np.ones(len(self._keys), dtype=bool)
+
+    # ---------------- QUERY ----------------
+    def search(self, job_text, k=10, explain_terms=10):
+        """
+        Top-k resumes for a job description, best first:
+        [{"key", "score" (0-100), "strengths", "gaps"}]. Strengths are job
+        terms the resume has and gaps the ones it lacks, by job weight.
+        """
+        with self._lock:
+            if self.vectorizer is None or not self._rows:
+                return []
+            self._flush()
+
+            query = self.vectorizer.transform([job_text or ""])
+            scores = (self._matrix @ query.T).toarray().ravel()
+            scores[~self._alive] = -1.0
+            k = min(k, len(self._rows))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            # Job terms by weight, plus job words the corpus has never seen
+            job_terms = query.indices[np.argsort(-query.data, kind="stable")]
+            vocabulary = self.vectorizer.vocabulary_
+            unseen = list(dict.fromkeys(
+                t for t in self.vectorizer.build_analyzer()(job_text or "") if t not in vocabulary
+            ))
+
+            results = []
+            for row in top:
+                if scores[row] <= 0:
+                    break
+                row_terms = set(self._matrix.indices[self._matrix.indptr[row]:self._matrix.indptr[row + 1]])
+                strengths = [self._terms[t] for t in job_terms if t in row_terms]
+                gaps = [self._terms[t] for t in job_terms if t not in row_terms] + unseen
+                results.append({
+                    "key": self._keys[row],
+                    "score": round(float(scores[row]) * 100, 2),
+                    "strengths": strengths[:explain_terms],
+                    "gaps": gaps[:explain_terms],
+                })
+            return results
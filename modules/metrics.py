@@ -0,0 +1,218 @@
+"""
+In-process request and pipeline metrics, exposed as Prometheus text.
+
+Histograms and counters are plain dicts behind one lock; an observation
+is a bisect plus a few additions, so this stays on in production.
+init_app() times every request per route, counts the SQL statements each
+request runs (SQLAlchemy cursor event) and times session commits; the
+pipeline stages (extraction per engine, analysis, role scoring, PDF build)
+are recorded by the call sites through stage() / observe_analysis().
+
+Values are per process: with several gunicorn workers each one reports
+its own numbers, so scrape every worker or aggregate on the Prometheus side.
+"""
+import bisect
+import hmac
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import Response, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+_lock = threading.Lock()
+_registry = []
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    body = ",".join(
+        '%s="%s"' % (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        _registry.append(self)
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with _lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}   # label values -> [per-bucket counts (+Inf last), sum, count]
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(n, "") for n in self.labelnames)
+        i = bisect.bisect_left(self.buckets, value)
+        with _lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with _lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + ("+Inf",), counts):
+                cumulative += n
+                le = bound if bound == "+Inf" else _format_value(bound)
+                labels = _format_labels(self.labelnames, key, [("le", le)])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(float(total))}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+# ---------------- METRICS ----------------
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "Request latency by route.",
+    ("method", "route", "status"),
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.",
+    ("route",), buckets=QUERY_BUCKETS,
+)
+BACKGROUND_QUERIES = Counter(
+    "db_queries_background_total", "SQL statements executed outside a request (jobs, CLI).",
+)
+STAGE_SECONDS = Histogram(
+    "resume_stage_duration_seconds", "Time per pipeline stage (analyze, role_scoring, db_commit, pdf_build).",
+    ("stage",),
+)
+EXTRACT_SECONDS = Histogram(
+    "resume_extract_duration_seconds", "Text extraction time per engine.",
+    ("engine",),
+)
+
+
+def stage(name):
+    """Context manager timing one pipeline stage."""
+    return STAGE_SECONDS.time(stage=name)
+
+
+def observe_analysis(results):
+    """Record the timings extract_and_analyze stored in an analysis result (run in a worker)."""
+    extraction = results.get("extraction") or {}
+    for engine, seconds in (extraction.get("seconds") or {}).items():
+        EXTRACT_SECONDS.observe(seconds, engine=engine)
+    for name, seconds in (results.get("timings") or {}).items():
+        STAGE_SECONDS.observe(seconds, stage=name)
+
+
+def render():
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ---------------- FLASK / SQLALCHEMY HOOKS ----------------
+def _before_request():
+    g._metrics_started = time.perf_counter()
+    g._metrics_queries = 0
+
+
+def _after_request(response):
+    started = g.pop("_metrics_started", None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method, route=route, status=response.status_code,
+        )
+        REQUEST_QUERIES.observe(g.pop("_metrics_queries", 0), route=route)
+    return response
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context() and "_metrics_queries" in g:
+        g._metrics_queries += 1
+    else:
+        BACKGROUND_QUERIES.inc()
+
+
+def _commit_started(session):
+    session.info["_metrics_commit"] = time.perf_counter()
+
+
+def _commit_finished(session):
+    started = session.info.pop("_metrics_commit", None)
+    if started is not None:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="db_commit")
+
+
+def _commit_failed(session):
+    session.info.pop("_metrics_commit", None)
+
+
+_hooks_installed = False
+
+
+def init_app(app, token=None):
+    """
+    Time requests, count queries and commits, and serve GET /metrics.
+    With a token, /metrics requires "Authorization: Bearer <token>".
+    """
+    global _hooks_installed
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    if not _hooks_installed:
+        event.listen(Engine, "before_cursor_execute", _count_query)
+        event.listen(Session, "before_commit", _commit_started)
+        event.listen(Session, "after_commit", _commit_finished)
+        event.listen(Session, "after_rollback", _commit_failed)
+        _hooks_installed = True
+
+    @app.route("/metrics")
+    def metrics():
+        if token and not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+            return Response("Unauthorized\n", status=401, mimetype="text/plain")
+        return Response(render(), mimetype="text/plain; version=0.0.4")
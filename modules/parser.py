@@ -1,5 +1,14 @@
+import bisect
 import re
 import io
+import mmap
+import os
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 import docx2txt
 import PyPDF2
 import difflib
@@ -70,6 +79,62 @@ SKILL_BANK = [
 NORMALIZED_SKILLS = {_normalize_token(s): s for s in SKILL_BANK}
 
 
+# ---------------- SKILL MATCHER ----------------
+def _trie_regex(words):
+    """
+    Build one alternation from a character trie of `words`.
+    Shared prefixes are matched once and, at any position, longer
+    words are tried before the shorter words they extend.
+    """
+    trie = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+_SKILLS_LOWER = sorted({s.lower() for s in SKILL_BANK})
+
+# Zero-width lookahead so overlapping skills ("rest api" / "api development")
+# are all seen; each hit is the longest skill bounded by \b on both sides.
+_SKILL_RE = re.compile(rf"(?=\b({_trie_regex(_SKILLS_LOWER)})\b)")
+_BOUNDARY_RE = re.compile(r"\b")
+
+# Skills that are a prefix of a longer skill ("spring" -> "spring boot")
+# can match at the same position, so they are re-checked on each hit.
+_SKILL_PREFIXES = {
+    s: [p for p in _SKILLS_LOWER if p != s and s.startswith(p)]
+    for s in _SKILLS_LOWER
+}
+
+
+def find_skills(text):
+    """
+    Return the sorted SKILL_BANK entries found in `text` in a single scan.
+    Same result as running re.search(rf"\b{re.escape(skill)}\b") per skill.
+    """
+    lowered = (text or "").lower()
+    found = set()
+    for m in _SKILL_RE.finditer(lowered):
+        skill = m.group(1)
+        found.add(skill)
+        start = m.start(1)
+        for prefix in _SKILL_PREFIXES[skill]:
+            if _BOUNDARY_RE.match(lowered, start + len(prefix)):
+                found.add(prefix)
+    return sorted(found)
+
+
 # ---------------- CLEAN TEXT ----------------
 def _clean_text(text):
     if not text:
@@ -79,55 +144,459 @@ def _clean_text(text):
     return text.strip()
 
 
+def _as_stream(data):
+    """bytes → BytesIO; seekable file-likes (open files, mmap) are rewound and read in place."""
+    if isinstance(data, (bytes, bytearray)):
+        return io.BytesIO(data)
+    data.seek(0)
+    return data
+
+
+def _as_bytes(data):
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    data.seek(0)
+    return data.read()
+
+
+def _as_buffer(data):
+    """Something re can scan in place: bytes, an mmap, or the mmap behind a mapped file."""
+    if isinstance(data, (bytes, bytearray, mmap.mmap)):
+        return data
+    buffer = getattr(data, "buffer", None)
+    return buffer if isinstance(buffer, mmap.mmap) else _as_bytes(data)
+
+
+# ---------------- EXTRACTION BUDGET ----------------
+# Oversized uploads are cut off after this many pages / characters (0 = no
+# limit): a resume's name, skills and sections are never on page 20.
+# Read from the environment so spawned analysis workers see the same values.
+MAX_PAGES = int(os.environ.get("PDF_MAX_PAGES", 12))
+MAX_CHARS = int(os.environ.get("PDF_MAX_CHARS", 60000))
+
+
+# ---------------- PAGE-PARALLEL PDF EXTRACTION ----------------
+# PDFs with at least this many pages (after the page budget) are split into
+# contiguous page ranges across a process pool; shorter ones (almost every
+# CV) stay in-process. PDF_PARALLEL_MIN_PAGES=0 turns the parallel mode off.
+PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", 6))
+PARALLEL_WORKERS = int(os.environ.get("PDF_PARALLEL_WORKERS", min(os.cpu_count() or 1, 4)))
+# Pages per pool task; at most one task per worker is in flight, so an early
+# stop leaves little submitted work behind
+PARALLEL_RANGE_PAGES = int(os.environ.get("PDF_PARALLEL_RANGE_PAGES", 2))
+
+_page_pool = None
+
+
+def _get_page_pool():
+    global _page_pool
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(
+            max_workers=PARALLEL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _page_pool
+
+
+@contextmanager
+def _page_executor(workers):
+    """
+    Single-threaded processes (analysis workers, the CLI) fork a short-lived
+    pool per document: a few ms, and nothing is left running when the
+    worker exits. Threaded processes (the web server) can't fork safely and
+    share one lazily spawned pool instead.
+    """
+    if threading.active_count() == 1 and "fork" in multiprocessing.get_all_start_methods():
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+        try:
+            yield pool
+        finally:
+            # Waits for the ranges already running, not for queued ones
+            pool.shutdown(wait=True, cancel_futures=True)
+    else:
+        yield _get_page_pool()
+
+
+@contextmanager
+def _open_pdf_pages(engine, stream):
+    """Page sequence of a PDF opened with "pdfplumber" or "pypdf2"."""
+    if engine == "pdfplumber":
+        with pdfplumber.open(stream) as pdf:
+            yield pdf.pages
+    else:
+        yield PyPDF2.PdfReader(stream).pages
+
+
+def _page_range_texts(engine, data, start, stop):
+    """Text of pages [start, stop). Runs in the page pool, so it reopens the PDF."""
+    with _open_pdf_pages(engine, io.BytesIO(data)) as pages:
+        return [pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def iter_pdf_pages(engine, file_bytes, max_pages=None, min_pages=None, workers=None):
+    """
+    Lazily yield the text of each page, in page order, stopping after
+    `max_pages` (0 = all). Documents with at least `min_pages` pages are
+    extracted page-parallel in small page ranges, submitted one per worker
+    ahead of the reader; closing the generator early cancels ranges that
+    haven't started. The pages are the same either way.
+    """
+    max_pages = MAX_PAGES if max_pages is None else max_pages
+    min_pages = PARALLEL_MIN_PAGES if min_pages is None else min_pages
+    workers = PARALLEL_WORKERS if workers is None else workers
+
+    with _open_pdf_pages(engine, _as_stream(file_bytes)) as pages:
+        count = min(len(pages), max_pages) if max_pages else len(pages)
+        if not min_pages or count < min_pages or workers < 2:
+            for i in range(count):
+                yield pages[i].extract_text() or ""
+            return
+
+    data = _as_bytes(file_bytes)
+    step = max(1, PARALLEL_RANGE_PAGES)
+    starts = iter(range(0, count, step))
+    pending = deque()
+    with _page_executor(workers) as pool:
+        def submit_next():
+            start = next(starts, None)
+            if start is not None:
+                pending.append(pool.submit(_page_range_texts, engine, data, start, min(start + step, count)))
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while pending:
+                texts = pending.popleft().result()
+                submit_next()
+                yield from texts
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _pdf_page_texts(engine, file_bytes, min_pages=None, workers=None, max_pages=None):
+    """All page texts (within the page budget) as a list."""
+    return list(iter_pdf_pages(engine, file_bytes, max_pages, min_pages, workers))
+
+
 # ---------------- OLD (RELIABLE) BYTE PDF EXTRACTOR ----------------
 def _extract_pdf_bytes_pypdf2(file_bytes):
     """Stable extraction method that always worked for you."""
     try:
-        reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
-        pages = []
-        for page in reader.pages:
-            pages.append(page.extract_text() or "")
-        return "\n".join(pages)
+        return "\n".join(_pdf_page_texts("pypdf2", file_bytes))
     except:
         return ""
 
 
-# ---------------- COMBINED PDF EXTRACTOR ----------------
-def extract_text_bytes(file_bytes, mime):
+# ---------------- PDF ENGINE SELECTION ----------------
+# Extracted text longer than this counts as a usable result
+MIN_TEXT_CHARS = 40
+
+PdfSniff = namedtuple("PdfSniff", "pages producer has_text")
+
+# Per-process: producer family -> engine that last produced usable text
+_PRODUCER_ENGINE = OrderedDict()
+_PRODUCER_MEMORY = 512
+_engine_lock = threading.Lock()
+
+# Per-process timing and yield per engine (see engine_stats())
+ENGINE_STATS = {
+    name: {"runs": 0, "seconds": 0.0, "chars": 0, "usable": 0}
+    for name in ("pdfplumber", "pypdf2")
+}
+
+
+def _producer_key(producer):
+    """"pdfTeX-1.40.21" and "pdfTeX-1.40.25" behave alike: drop version numbers."""
+    return re.sub(r"[\d.]+", " ", producer or "").strip().lower()
+
+
+def _page_has_text(page):
+    """A page can only carry a text layer if it references fonts (or a form XObject that might)."""
+    resources = page.get("/Resources")
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if resources.get("/Font"):
+        return True
+    xobjects = resources.get("/XObject")
+    if xobjects:
+        for xobject in xobjects.get_object().values():
+            if xobject.get_object().get("/Subtype") == "/Form":
+                return True
+    return False
+
+
+_PRODUCER_RE = re.compile(rb"/Producer\s*\(((?:[^()\\]|\\.){0,200})\)")
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+_OBJ_RE = re.compile(rb"(\d+)\s+\d+\s+obj\b")
+_REF_RE = re.compile(rb"\s*(\d+)\s+\d+\s+R\b")
+_NAME_RE = re.compile(rb"/[^\s/<>\[\]()]+")
+_FORM_RE = re.compile(rb"/Subtype\s*/Form(?![a-zA-Z])")
+
+
+class _RawObjects:
+    """Object dictionaries of an uncompressed PDF, located by byte offset (streams are never read)."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.starts = []
+        self.offsets = {}
+        for match in _OBJ_RE.finditer(raw):
+            self.starts.append(match.end())
+            self.offsets[int(match.group(1))] = match.end()   # incremental updates: last one wins
+
+    def _dict_at(self, start):
+        end = self.raw.find(b"endobj", start)
+        if end == -1:
+            end = len(self.raw)
+        stream = self.raw.find(b"stream", start, end)
+        return self.raw[start:end if stream == -1 else stream]
+
+    def get(self, num):
+        start = self.offsets.get(num)
+        return b"" if start is None else self._dict_at(start)
+
+    def enclosing(self, pos):
+        """Dictionary of the object that contains byte offset pos."""
+        i = bisect.bisect_right(self.starts, pos) - 1
+        return self._dict_at(self.starts[i]) if i >= 0 else b""
+
+    def resolve(self, value):
+        return self.get(value) if isinstance(value, int) else value or b""
+
+
+def _raw_value(body, key):
+    """Value of /key in a dict: an inline <<...>> (bytes), an object number (int), or None."""
+    match = re.search(rb"/" + key + rb"(?![a-zA-Z0-9])", body)
+    if match is None:
+        return None
+    ref = _REF_RE.match(body, match.end())
+    if ref:
+        return int(ref.group(1))
+    start = len(body) - len(body[match.end():].lstrip())
+    if not body.startswith(b"<<", start):
+        return None
+    depth, i = 0, start
+    while True:
+        opening = body.find(b"<<", i)
+        closing = body.find(b">>", i)
+        if closing == -1:
+            return None
+        if opening != -1 and opening < closing:
+            depth, i = depth + 1, opening + 2
+        else:
+            depth, i = depth - 1, closing + 2
+            if depth == 0:
+                return body[start:i]
+
+
+def _raw_page_has_text(objects, page):
+    """_page_has_text for a page dictionary found by the byte scan."""
+    for _ in range(32):
+        resources = _raw_value(page, b"Resources")
+        if resources is not None:
+            break
+        parent = _raw_value(page, b"Parent")   # inherited from the page tree
+        if not isinstance(parent, int):
+            return False
+        page = objects.get(parent)
+    else:
+        return False
+    resources = objects.resolve(resources)
+    if _NAME_RE.search(objects.resolve(_raw_value(resources, b"Font"))):
+        return True
+    xobjects = objects.resolve(_raw_value(resources, b"XObject"))
+    return any(
+        _FORM_RE.search(objects.get(int(ref.group(1))))
+        for ref in _REF_RE.finditer(xobjects)
+    )
+
+
+def _decode_pdf_string(raw):
+    raw = re.sub(rb"\\([()\\])", rb"\1", raw)
+    if raw.startswith(b"\xfe\xff"):
+        return raw[2:].decode("utf-16-be", "ignore")
+    return raw.decode("latin-1")
+
+
+def sniff_pdf(file_bytes):
     """
-    Best hybrid approach:
-    1. pdfplumber → if text is usable
-    2. PyPDF2 (OLD version) → always worked reliably
+    Cheap look at a PDF without decoding any content streams: page count,
+    producer, and whether any page has a text layer (scans don't).
+
+    Text can only be drawn with a /Font resource, so each page's
+    /Resources (inline, referenced or inherited) is checked with a byte
+    scan for most files; PDFs that keep their objects in compressed object
+    streams are opened with PyPDF2 instead.
     """
+    raw = _as_buffer(file_bytes)
+
+    if raw.find(b"/ObjStm") == -1:
+        match = _PRODUCER_RE.search(raw[-65536:]) or _PRODUCER_RE.search(raw[:65536])
+        producer = _decode_pdf_string(match.group(1)) if match else ""
+        objects = _RawObjects(raw)
+        page_offsets = [m.start() for m in _PAGE_RE.finditer(raw)]
+        has_text = any(_raw_page_has_text(objects, objects.enclosing(pos)) for pos in page_offsets)
+        return PdfSniff(len(page_offsets), producer, has_text)
+
+    reader = PyPDF2.PdfReader(_as_stream(file_bytes))
+    if reader.is_encrypted:
+        reader.decrypt("")
+    try:
+        producer = str((reader.metadata or {}).get("/Producer") or "")
+    except Exception:
+        producer = ""
+    pages = reader.pages
+    has_text = any(_page_has_text(page) for page in pages)
+    return PdfSniff(len(pages), producer, has_text)
+
+
+def _engine_order(producer):
+    if not _HAS_PDFPLUMBER:
+        return ["pypdf2"]
+    key = _producer_key(producer)
+    if not key:
+        return ["pdfplumber", "pypdf2"]
+    with _engine_lock:
+        learned = _PRODUCER_ENGINE.get(key)
+    if learned == "pypdf2":
+        return ["pypdf2", "pdfplumber"]
+    return ["pdfplumber", "pypdf2"]
+
 
+def _remember_engine(producer, engine):
+    key = _producer_key(producer)
+    if not key:
+        return   # no producer: nothing ties this file to any other
+    with _engine_lock:
+        _PRODUCER_ENGINE[key] = engine
+        _PRODUCER_ENGINE.move_to_end(key)
+        while len(_PRODUCER_ENGINE) > _PRODUCER_MEMORY:
+            _PRODUCER_ENGINE.popitem(last=False)
+
+
+def _run_engine(engine, file_bytes, early_stop=None, info=None):
+    """
+    Document text with one engine, within MAX_PAGES / MAX_CHARS; returns
+    (text, seconds). `early_stop` is a fresh feed(page_text) -> bool; a
+    True return means later pages won't change the analysis, so reading
+    stops there. `info`, if given, gets "pages_read" and "stopped".
+    """
+    started = time.perf_counter()
+    pages, chars, stopped = [], 0, None
+    try:
+        page_iter = iter_pdf_pages(engine, file_bytes)
+        try:
+            for page_text in page_iter:
+                pages.append(page_text)
+                chars += len(page_text)
+                if MAX_CHARS and chars >= MAX_CHARS:
+                    stopped = "char_budget"
+                    break
+                if early_stop is not None and early_stop(page_text):
+                    stopped = "converged"
+                    break
+        finally:
+            page_iter.close()
+        text = "\n".join(pages).strip()
+    except Exception:
+        text = ""
+    seconds = time.perf_counter() - started
+    if info is not None:
+        info.update(pages_read=len(pages), stopped=stopped)
+
+    with _engine_lock:
+        stats = ENGINE_STATS[engine]
+        stats["runs"] += 1
+        stats["seconds"] += seconds
+        stats["chars"] += len(text)
+        stats["usable"] += len(text) > MIN_TEXT_CHARS
+    return text, seconds
+
+
+def engine_stats():
+    """Copy of this process's per-engine counters, with average ms per run."""
+    with _engine_lock:
+        return {
+            name: dict(stats, avg_ms=round(stats["seconds"] / stats["runs"] * 1000, 2) if stats["runs"] else 0.0)
+            for name, stats in ENGINE_STATS.items()
+        }
+
+
+def _extract_pdf(file_bytes, early_stop=None):
+    """
+    Sniff the PDF, then run one engine: pdfplumber by default, PyPDF2 first
+    for producers where pdfplumber previously came back empty. The other
+    engine only runs if the first yields no usable text. PDFs with no text
+    layer at all (scans) skip both parses.
+    `early_stop` is a factory for a per-engine-run feed (see _run_engine).
+    """
+    info = {"engine": None, "producer": None, "pages": None, "seconds": {}, "pages_read": 0, "stopped": None}
+    try:
+        sniff = sniff_pdf(file_bytes)
+    except Exception:
+        sniff = None
+    if sniff is not None:
+        info.update(producer=sniff.producer, pages=sniff.pages)
+        if not sniff.has_text:
+            return "", info
+
+    producer = sniff.producer if sniff else ""
+    best = ""
+    for engine in _engine_order(producer):
+        text, seconds = _run_engine(engine, file_bytes, early_stop() if early_stop else None, info)
+        info["seconds"][engine] = round(seconds, 4)
+        if len(text) > MIN_TEXT_CHARS:
+            info["engine"] = engine
+            if sniff is not None:
+                _remember_engine(producer, engine)
+            return _clean_text(text), info
+        if len(text) > len(best):
+            best = text
+    return _clean_text(best), info
+
+
+# ---------------- COMBINED EXTRACTOR ----------------
+def extract_text_with_info(file_bytes, mime, early_stop=None):
+    """
+    Like extract_text_bytes, also returning how the text was obtained:
+    {"engine", "producer", "pages", "seconds": {engine: s}, "pages_read",
+    "stopped": None | "char_budget" | "converged"}.
+
+    For PDFs, `early_stop` is a zero-argument factory returning a
+    feed(page_text) -> bool (e.g. analysis.ResumeScan().feed) that
+    consumes pages as they are extracted and can end extraction early.
+    """
     if mime == "application/pdf":
-        # 1. Try pdfplumber (but only keep if text is valid)
-        if _HAS_PDFPLUMBER:
-            try:
-                with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-                    pages = [p.extract_text() or "" for p in pdf.pages]
-                    text = "\n".join(pages).strip()
-                    # pdfplumber sometimes returns garbage text, so verify:
-                    if len(text) > 40:  # valid text
-                        return _clean_text(text)
-            except:
-                pass
-
-        # 2. Your old reliable method
-        text = _extract_pdf_bytes_pypdf2(file_bytes)
-        return _clean_text(text)
+        return _extract_pdf(file_bytes, early_stop)
 
     # ------------ DOCX -------------
     if mime in [
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         "application/msword"
     ]:
+        started = time.perf_counter()
         try:
-            return docx2txt.process(io.BytesIO(file_bytes)) or ""
+            text = docx2txt.process(_as_stream(file_bytes)) or ""
         except:
-            return ""
+            text = ""
+        seconds = round(time.perf_counter() - started, 4)
+        return text, {"engine": "docx2txt", "producer": None, "pages": None, "seconds": {"docx2txt": seconds}}
 
-    return ""
+    return "", {"engine": None, "producer": None, "pages": None, "seconds": {}}
+
+
+def extract_text_bytes(file_bytes, mime):
+    """
+    Text of an uploaded PDF or DOCX.
+
+    PDFs are sniffed first so usually only one engine parses them (see
+    _extract_pdf); long PDFs are extracted page-parallel (see
+    PARALLEL_MIN_PAGES) and cut off at MAX_PAGES / MAX_CHARS. file_bytes
+    may be raw bytes or a seekable binary file such as an mmap.
+    """
+    return extract_text_with_info(file_bytes, mime)[0]
 
 
 # ---------------- NAME EXTRACTION ----------------
@@ -151,15 +620,7 @@ def extract_experience(text):
 
 # ---------------- SKILL EXTRACTION ----------------
 def analyze_resume(text):
-    lowered = (text or "").lower()
-
-    found = []
-    for skill in SKILL_BANK:
-        sl = skill.lower()
-        if re.search(rf"\b{re.escape(sl)}\b", lowered):
-            found.append(sl)
-
-    found = sorted(list(set(found)))
+    found = find_skills(text)
     exp = extract_experience(text)
     name = extract_name(text)
 
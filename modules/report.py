@@ -0,0 +1,322 @@
+"""
+PDF analysis report: rendering and an on-disk cache of rendered reports.
+
+build_report_pdf takes a plain dict of the Resume fields the report reads
+(report_fields), so it can run anywhere, including a worker process.
+ReportCache keeps rendered PDFs on disk keyed by resume id + a fingerprint
+of those fields, evicting least-recently-served files past a size cap.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from reportlab import rl_config
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+from modules.assets import AVAILABLE_ROADMAPS, image_path, report_image
+from modules.catalog import ROADMAPS
+
+# Write image streams as binary: ASCII85-wrapping them is pure Python here and
+# cost more than the rest of the report put together
+rl_config.useA85 = 0
+
+# Bump when the report layout changes so cached PDFs are not served any more
+REPORT_VERSION = "2"
+
+REPORT_FIELDS = (
+    "candidate_name", "parsed_text", "skills", "predicted_role",
+    "recommended_skills", "courses", "course_links", "tips", "resume_score",
+)
+
+
+def report_fields(resume):
+    """The Resume columns the report reads, as a plain (picklable) dict."""
+    return {name: getattr(resume, name) for name in REPORT_FIELDS}
+
+
+def report_fingerprint(fields):
+    """Hash of everything that changes the rendered PDF (fields, layout, roadmap image)."""
+    h = hashlib.sha256(REPORT_VERSION.encode())
+    h.update(json.dumps(fields, sort_keys=True, default=str).encode("utf-8"))
+    roadmap = AVAILABLE_ROADMAPS.get(fields.get("predicted_role"))
+    if roadmap:
+        try:
+            h.update(f"{roadmap['image']}:{os.path.getmtime(image_path(roadmap))}".encode())
+        except OSError:
+            h.update(b"no-roadmap-image")
+    return h.hexdigest()[:32]
+
+
+# ---------------- RENDERING ----------------
+def build_report_pdf(fields):
+    """Render the analysis report for report_fields(...) and return the PDF bytes."""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=35,
+        leftMargin=35,
+        topMargin=40,
+        bottomMargin=40
+    )
+    styles = getSampleStyleSheet()
+    content = []
+
+    # ------------------- CANDIDATE NAME (Extracted or fallback) -------------------
+    candidate_name = fields.get("candidate_name") or "Unknown"
+
+    # ------------------- UPDATED TITLE -------------------
+    title_style = styles['Title']
+    title_style.alignment = TA_CENTER
+    content.append(Paragraph(f"{candidate_name} - Resume Analysis Report", title_style))
+    content.append(Spacer(1, 0.2 * inch))
+
+    # ------------------- ONLY SHOW CANDIDATE NAME -------------------
+    info_style = ParagraphStyle('info', parent=styles["Normal"], spaceAfter=3)
+    content.append(Paragraph(f"<b>Candidate Name:</b> {candidate_name}", info_style))
+    content.append(Spacer(1, 0.15 * inch))
+
+    # ------------------- ANALYSIS SUMMARY -------------------
+    content.append(Paragraph("<b>Analysis Summary:</b>", styles["Heading3"]))
+    summary_text = fields.get("parsed_text") or "No summary available."
+    content.append(Paragraph(summary_text, styles["Normal"]))
+    content.append(Spacer(1, 0.15 * inch))
+
+    # ------------------- CURRENT SKILLS -------------------
+    content.append(Paragraph("<b>Current Skills:</b>", styles["Heading3"]))
+    skills = fields.get("skills")
+    if skills:
+        if isinstance(skills, str):
+            skills_text = skills
+        else:
+            skills_text = ", ".join(json.loads(skills))
+        content.append(Paragraph(skills_text, styles["Normal"]))
+    else:
+        content.append(Paragraph("No skills found.", styles["Normal"]))
+    content.append(Spacer(1, 0.15 * inch))
+
+    # ------------------- PREDICTED ROLE -------------------
+    predicted_role = fields.get("predicted_role")
+    content.append(Paragraph("<b>Predicted Job Role:</b>", styles["Heading3"]))
+    content.append(Paragraph(predicted_role or "Not available.", styles["Normal"]))
+    content.append(Spacer(1, 0.15 * inch))
+
+    # ------------------- RECOMMENDED SKILLS -------------------
+    content.append(Paragraph("<b>Recommended Skills:</b>", styles["Heading3"]))
+    recommended = fields.get("recommended_skills")
+    if recommended:
+        if isinstance(recommended, str):
+            recommended_skills = [s.strip() for s in recommended.split(",")]
+        else:
+            recommended_skills = recommended
+        for skill in recommended_skills:
+            content.append(Paragraph(f"• {skill}", styles["Normal"]))
+    else:
+        content.append(Paragraph("No recommendations available.", styles["Normal"]))
+    content.append(Spacer(1, 0.15 * inch))
+
+    # ------------------- COURSES -------------------
+    content.append(Paragraph("<b>Courses & Certifications:</b>", styles["Heading3"]))
+    courses = fields.get("courses")
+    if courses:
+        try:
+            course_names = json.loads(courses)
+            course_links = json.loads(fields.get("course_links") or "[]")
+            for name, link in zip(course_names, course_links):
+                content.append(Paragraph(f"• <a href='{link}'>{name}</a>", styles["Normal"]))
+        except:
+            content.append(Paragraph(courses, styles["Normal"]))
+    else:
+        content.append(Paragraph("No course recommendations available.", styles["Normal"]))
+    content.append(Spacer(1, 0.2 * inch))
+
+    # ------------------- ROADMAP IMAGE (IF AVAILABLE) -------------------
+    if predicted_role and predicted_role in ROADMAPS:
+        roadmap_title = ROADMAPS[predicted_role].get('title', '')
+        image = report_image(predicted_role)
+
+        if image is not None:
+            roadmap_title_style = ParagraphStyle(
+                'roadmap_title',
+                parent=styles["Heading3"],
+                alignment=TA_CENTER,
+                spaceAfter=6,
+                fontSize=12,
+                textColor=colors.HexColor('#0d47a1')
+            )
+            content.append(Paragraph(roadmap_title, roadmap_title_style))
+            content.append(Spacer(1, 0.1 * inch))
+            content.append(image.flowable())
+            content.append(Spacer(1, 0.15 * inch))
+        else:
+            content.append(Paragraph("Roadmap image not found.", styles["Normal"]))
+    else:
+        content.append(Paragraph("No roadmap available for this role.", styles["Normal"]))
+
+    content.append(Spacer(1, 0.15 * inch))
+
+    # ------------------- TIPS -------------------
+    content.append(Paragraph("<b>Resume Tips:</b>", styles["Heading3"]))
+    tips = fields.get("tips")
+    if tips:
+        tips_list = [t.strip() for t in tips.split("\n")]
+        for tip in tips_list:
+            color = "green" if tip.startswith("[+]") else "red"
+            content.append(Paragraph(f'<font color="{color}">{tip}</font>', styles["Normal"]))
+    else:
+        content.append(Paragraph("No tips available.", styles["Normal"]))
+    content.append(Spacer(1, 0.15 * inch))
+
+    # ------------------- SCORE -------------------
+    content.append(Paragraph("<b>Overall Resume Score:</b>", styles["Heading3"]))
+    content.append(Paragraph(f"<b>{fields.get('resume_score') or 'N/A'} / 100</b>", styles["Normal"]))
+
+    # ------------------- FOOTER -------------------
+    footer_style = ParagraphStyle(
+        'footer',
+        parent=styles["Normal"],
+        alignment=TA_CENTER,
+        textColor=colors.grey,
+        fontSize=8,
+        spaceBefore=15
+    )
+
+    content.append(Spacer(1, 0.1 * inch))
+    content.append(Paragraph("Generated by AI Resume Analyzer", footer_style))
+
+    doc.build(content)
+    return buffer.getvalue()
+
+
+def report_filename(fields):
+    return f"{(fields.get('candidate_name') or 'Unknown').replace(' ', '_')}_Resume_Analysis.pdf"
+
+
+# ---------------- DISK CACHE ----------------
+class ReportCache:
+    """
+    Rendered reports as <root>/<resume_id>-<fingerprint>.pdf.
+
+    A new fingerprint for a resume replaces its older files (the analysis
+    changed), hits mark the file recently used, and puts evict the least
+    recently used files once the directory grows past max_bytes.
+
+    The directory is scanned once at startup; after that the file sizes,
+    their total and the LRU order are kept in memory, so a put costs no
+    directory listing. Each process tracks the files it wrote or served
+    (plus the startup scan), so with several workers the cap is per
+    worker's view; discard() still scans the directory so a deleted
+    resume loses every cached report, whoever wrote it.
+    """
+
+    def __init__(self, root, max_bytes=256 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes = OrderedDict()   # path -> size, least recently used first
+        self._by_resume = {}          # resume_id -> set of paths
+        self._total = 0
+        os.makedirs(root, exist_ok=True)
+        self._scan()
+
+    def _path(self, resume_id, fingerprint):
+        return os.path.join(self.root, f"{resume_id}-{fingerprint}.pdf")
+
+    def _scan(self):
+        entries = []
+        for entry in os.scandir(self.root):
+            if entry.name.endswith(".pdf"):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, entry.name, st.st_size))
+        with self._lock:
+            for _, name, size in sorted(entries):
+                self._track(os.path.join(self.root, name), name.split("-", 1)[0], size)
+
+    def open(self, resume_id, fingerprint):
+        """Open cached report file, or None on a miss."""
+        path = self._path(resume_id, fingerprint)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            with self._lock:
+                self._untrack(path)   # evicted by another process
+            return None
+        with self._lock:
+            if path in self._sizes:
+                self._sizes.move_to_end(path)
+            else:
+                self._track(path, str(resume_id), os.fstat(f.fileno()).st_size)
+        try:
+            os.utime(path)   # LRU order for the next startup scan
+        except OSError:
+            pass
+        return f
+
+    def put(self, resume_id, fingerprint, data):
+        path = self._path(resume_id, fingerprint)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        with self._lock:
+            for old in self._by_resume.get(str(resume_id), set()) - {path}:
+                self._untrack(old)
+                _remove_quietly(old)
+            self._untrack(path)
+            self._track(path, str(resume_id), len(data))
+            while self._total > self.max_bytes and len(self._sizes) > 1:
+                oldest = next(iter(self._sizes))
+                self._untrack(oldest)
+                _remove_quietly(oldest)
+        return path
+
+    def discard(self, resume_id):
+        """Drop every cached report of a resume."""
+        prefix = f"{resume_id}-"
+        with self._lock:
+            for path in self._by_resume.get(str(resume_id), set()).copy():
+                self._untrack(path)
+            for entry in os.scandir(self.root):
+                if entry.name.startswith(prefix):
+                    _remove_quietly(entry.path)
+
+    def _track(self, path, resume_key, size):
+        self._sizes[path] = size
+        self._total += size
+        self._by_resume.setdefault(resume_key, set()).add(path)
+
+    def _untrack(self, path):
+        size = self._sizes.pop(path, None)
+        if size is None:
+            return
+        self._total -= size
+        resume_key = os.path.basename(path).split("-", 1)[0]
+        paths = self._by_resume.get(resume_key)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del self._by_resume[resume_key]
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
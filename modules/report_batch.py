@@ -0,0 +1,100 @@
+"""
+On-disk state for background admin jobs: batch PDF reports and bulk uploads.
+
+A job is <root>/<job_id>.json (status and progress, replaced atomically on
+every update so any web worker can answer a progress poll) plus a ZIP: for
+report batches the reports, written entry by entry to <job_id>.zip.part and
+renamed to <job_id>.zip once complete; for uploads the archive being
+imported. Jobs older than ttl seconds are removed.
+
+Every save stamps a heartbeat; the thread running a job saves at least
+once per chunk (and while waiting for its turn), so a queued or running
+job with no heartbeat for stale_after seconds lost its worker (restart,
+crash) and is reported as failed when read.
+"""
+import json
+import os
+import re
+import tempfile
+import time
+import uuid
+
+JOB_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ReportBatchStore:
+    def __init__(self, root, ttl=24 * 3600, stale_after=300):
+        self.root = root
+        self.ttl = ttl
+        self.stale_after = stale_after
+        os.makedirs(root, exist_ok=True)
+
+    def _state_path(self, job_id):
+        return os.path.join(self.root, f"{job_id}.json")
+
+    def zip_path(self, job_id, partial=False):
+        return os.path.join(self.root, f"{job_id}.zip" + (".part" if partial else ""))
+
+    def create(self, filters, total, owner_id=None):
+        """New queued job for `total` resumes matching `filters`; returns its state."""
+        state = {
+            "id": uuid.uuid4().hex,
+            "status": "queued",
+            "filters": filters,
+            "owner_id": owner_id,
+            "total": total,
+            "done": 0,
+            "failed": 0,
+            "errors": [],
+            "created_at": time.time(),
+            "finished_at": None,
+        }
+        self.save(state)
+        return state
+
+    def get(self, job_id):
+        """State dict for job_id, or None for unknown / malformed ids."""
+        if not JOB_ID_RE.match(job_id or ""):
+            return None
+        try:
+            with open(self._state_path(job_id), encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self.stalled(state):
+            state = self.update(
+                state, status="failed", finished_at=time.time(),
+                errors=state["errors"] + [{"error": "The job stopped responding (server restarted?)."}],
+            )
+        return state
+
+    def stalled(self, state):
+        """Queued or running, but no heartbeat for stale_after seconds."""
+        if state["status"] not in ("queued", "running"):
+            return False
+        return time.time() - state.get("heartbeat", state["created_at"]) > self.stale_after
+
+    def save(self, state):
+        state["heartbeat"] = time.time()
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self._state_path(state["id"]))
+
+    def update(self, state, **changes):
+        state.update(changes)
+        self.save(state)
+        return state
+
+    def cleanup(self):
+        """Remove jobs (state + ZIP) created more than ttl seconds ago."""
+        cutoff = time.time() - self.ttl
+        for entry in os.scandir(self.root):
+            job_id = entry.name.split(".", 1)[0]
+            if not JOB_ID_RE.match(job_id):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,91 @@
+"""
+Role prediction from extracted skills.
+
+RoleScorer builds an inverted index (skill -> roles) once from the role
+keyword sets, so scoring a resume costs O(skills found) instead of
+O(roles x keywords). For batches, rank_many scores every resume with one
+sparse (resumes x skills) @ (skills x roles) product.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+KEYWORD_WEIGHT = 5
+
+
+class RoleScorer:
+    def __init__(self, role_keywords, weight=KEYWORD_WEIGHT):
+        """
+        role_keywords: {role: iterable of keywords}. Declaration order is
+        kept and breaks ties, same as max() over the dict did.
+        """
+        self.roles = tuple(role_keywords)
+        self.weight = weight
+        self._rank = {role: i for i, role in enumerate(self.roles)}
+
+        index = {}
+        for role, keywords in role_keywords.items():
+            for kw in {k.lower().strip() for k in keywords}:
+                index.setdefault(kw, []).append(role)
+        self.index = {kw: tuple(roles) for kw, roles in index.items()}
+
+        # Same index as a sparse skills x roles weight matrix, for rank_many
+        self.skill_columns = {kw: i for i, kw in enumerate(self.index)}
+        rows, cols = [], []
+        for kw, roles in self.index.items():
+            for role in roles:
+                rows.append(self.skill_columns[kw])
+                cols.append(self._rank[role])
+        self.weights = sp.csr_matrix(
+            (np.full(len(rows), weight, dtype=np.int32), (rows, cols)),
+            shape=(len(self.index), len(self.roles)),
+        )
+
+    def score(self, skills):
+        """{role: score} for every role with at least one matching skill."""
+        scores = {}
+        for skill in {s.lower().strip() for s in skills}:
+            for role in self.index.get(skill, ()):
+                scores[role] = scores.get(role, 0) + self.weight
+        return scores
+
+    def rank(self, skills):
+        """All roles as [(role, score), ...], best first."""
+        scores = self.score(skills)
+        return sorted(
+            ((role, scores.get(role, 0)) for role in self.roles),
+            key=lambda item: (-item[1], self._rank[item[0]])
+        )
+
+    def skill_matrix(self, skill_lists):
+        """Sparse boolean resumes x skills matrix (only skills some role cares about)."""
+        indptr, indices = [0], []
+        for skills in skill_lists:
+            cols = {self.skill_columns.get(s.lower().strip()) for s in skills}
+            cols.discard(None)
+            indices.extend(sorted(cols))
+            indptr.append(len(indices))
+        return sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(skill_lists), len(self.skill_columns)),
+        )
+
+    def rank_many(self, skill_lists):
+        """
+        rank() for many resumes at once, keeping only roles that scored:
+        [[(role, score), ...] per resume], best first, ties in declaration order.
+        """
+        scores = (self.skill_matrix(skill_lists) @ self.weights).toarray()
+        order = np.argsort(-scores, axis=1, kind="stable")
+        scored = (scores > 0).sum(axis=1)
+        roles = self.roles
+        return [
+            [(roles[j], int(row[j])) for j in row_order[:n].tolist()]
+            for row, row_order, n in zip(scores.tolist(), order, scored.tolist())
+        ]
+
+    def predict(self, skills):
+        """Best role, or None when no keyword matched."""
+        scores = self.score(skills)
+        if not scores:
+            return None
+        return min(scores, key=lambda role: (-scores[role], self._rank[role]))
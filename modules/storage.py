@@ -0,0 +1,160 @@
+"""
+Blob storage for uploaded resume files, keyed by content hash.
+
+LocalBlobStore keeps files under sharded directories (ab/cd/<hash>) with
+atomic writes and exposes real paths, so downloads can go through
+send_file(path) / sendfile and parsers can mmap the file.
+S3BlobStore talks to anything implementing the S3 put/get/head/delete
+object calls (boto3, MinIO, or a local stand-in with the same methods).
+"""
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+class BlobStore:
+    def put(self, key, data):
+        """Store bytes under key. Content-addressed, so an existing key is left alone."""
+        raise NotImplementedError
+
+    def open(self, key):
+        """Binary, seekable file object for key."""
+        raise NotImplementedError
+
+    def exists(self, key):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def local_path(self, key):
+        """Filesystem path for key, or None when the backend isn't local."""
+        return None
+
+    def read(self, key):
+        with self.open(key) as f:
+            return f.read()
+
+
+# ---------------- LOCAL FILESYSTEM ----------------
+class LocalBlobStore(BlobStore):
+    def __init__(self, root, levels=2, width=2):
+        self.root = root
+        self.levels = levels
+        self.width = width
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, key):
+        shards = [key[i * self.width:(i + 1) * self.width] for i in range(self.levels)]
+        return os.path.join(self.root, *shards, key)
+
+    def local_path(self, key):
+        path = self._path(key)
+        return path if os.path.exists(path) else None
+
+    def exists(self, key):
+        return os.path.exists(self._path(key))
+
+    def put(self, key, data):
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Write next to the target, then rename: readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def open(self, key):
+        return open(self._path(key), "rb")
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class _MappedFile:
+    """mmap with the seekable() that zipfile (docx) expects; mmap only has it from 3.13."""
+
+    def __init__(self, mm):
+        self._mm = mm
+
+    @property
+    def buffer(self):
+        """The mmap itself, for code that needs the buffer protocol (re, memoryview)."""
+        return self._mm
+
+    def seekable(self):
+        return True
+
+    def __len__(self):
+        return len(self._mm)
+
+    def __getitem__(self, key):
+        return self._mm[key]
+
+    def __getattr__(self, name):
+        return getattr(self._mm, name)
+
+
+@contextmanager
+def mapped_file(path):
+    """Read-only mmap of a file as a seekable file-like; empty files yield b""."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield _MappedFile(mm)
+
+
+# ---------------- S3-COMPATIBLE ----------------
+class S3BlobStore(BlobStore):
+    def __init__(self, client, bucket, prefix="resumes/"):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def _key(self, key):
+        return f"{self.prefix}{key}"
+
+    def exists(self, key):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+            return True
+        except Exception:
+            return False
+
+    def put(self, key, data):
+        if not self.exists(key):
+            self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=data)
+
+    def open(self, key):
+        body = self.client.get_object(Bucket=self.bucket, Key=self._key(key))["Body"]
+        return io.BytesIO(body.read())
+
+    def delete(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+
+def create_blob_store(backend="local", root=None, bucket=None, endpoint_url=None, prefix="resumes/"):
+    """Build the configured store. The s3 backend needs boto3 installed."""
+    if backend == "s3":
+        import boto3
+        client = boto3.client("s3", endpoint_url=endpoint_url)
+        return S3BlobStore(client, bucket, prefix)
+    return LocalBlobStore(root)
@@ -0,0 +1,111 @@
+"""
+The admin dashboard and the Excel export must not issue per-row queries:
+the number of SQL statements stays the same for 1 and for 50 resumes.
+Email filters match fragments literally.
+"""
+import os
+
+import pytest
+from sqlalchemy import event
+
+
+@pytest.fixture(scope="module")
+def app_module(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp("app")
+    cwd = os.getcwd()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", "sqlite://")   # in-memory, one shared connection
+        mp.setenv("ANALYSIS_ASYNC", "0")
+        mp.setenv("MATCHER_PREBUILD", "0")   # no background index build competing for queries
+        mp.setenv("REPORT_CACHE_DIR", str(workdir / "report_cache"))
+        mp.setenv("REPORT_BATCH_DIR", str(workdir / "report_batches"))
+        os.chdir(workdir)   # uploads/ is created under the working directory
+        try:
+            import app as app_module
+            app_module.app.config.update(TESTING=True, SESSION_COOKIE_SECURE=False)
+            with app_module.app.app_context():
+                app_module.db.create_all()
+            yield app_module
+        finally:
+            os.chdir(cwd)
+
+
+@pytest.fixture
+def admin_client(app_module):
+    from models import Feedback, Resume, User
+
+    with app_module.app.app_context():
+        admin = User(name="Admin", email="admin@example.com", password="x", role="admin")
+        app_module.db.session.add(admin)
+        app_module.db.session.commit()
+        admin_id = admin.id
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = admin_id
+        sess["role"] = "admin"
+    yield client
+
+    with app_module.app.app_context():
+        for model in (Resume, Feedback, User):
+            model.query.delete()
+        app_module.db.session.commit()
+
+
+def add_resumes(app_module, count):
+    """count resumes, each from its own candidate (a per-row User lookup would show up)."""
+    from models import Feedback, Resume, User
+
+    with app_module.app.app_context():
+        session = app_module.db.session
+        start = User.query.filter_by(role="candidate").count()
+        for i in range(start, start + count):
+            user = User(name=f"Candidate {i}", email=f"c{i}@example.com", password="x", role="candidate")
+            session.add(user)
+            session.flush()
+            session.add(Resume(
+                user_id=user.id, file_name=f"resume{i}.pdf", predicted_role="Data Scientist",
+                resume_score=50 + i % 50, candidate_name=f"Candidate {i}", status="done",
+            ))
+            session.add(Feedback(user_id=user.id, name=user.name, email=user.email, rating="5", comments="ok"))
+        session.commit()
+
+
+def count_queries(app_module, client, path):
+    app_module.analytics.invalidate()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app_module.app.app_context():
+        engine = app_module.db.engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get(path)
+        assert response.status_code == 200
+        response.get_data()   # streamed bodies run their queries while being read
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+@pytest.mark.parametrize("path", ["/admin", "/export_excel"])
+def test_query_count_does_not_grow_with_resumes(app_module, admin_client, path):
+    add_resumes(app_module, 1)
+    count_queries(app_module, admin_client, path)   # warm-up: one-off work on first use
+    one = count_queries(app_module, admin_client, path)
+
+    add_resumes(app_module, 49)
+    fifty = count_queries(app_module, admin_client, path)
+
+    assert one == fifty
+
+
+@pytest.mark.parametrize("path, param", [("/admin/api/resumes", "email"), ("/admin/api/feedback", "fb_email")])
+def test_email_fragment_wildcards_match_literally(app_module, admin_client, path, param):
+    add_resumes(app_module, 2)   # c0@example.com, c1@example.com
+
+    assert len(admin_client.get(f"{path}?{param}=c0").get_json()["items"]) == 1
+    for fragment in ("c_", "c%25"):   # % must be URL-encoded
+        assert admin_client.get(f"{path}?{param}={fragment}").get_json()["items"] == []
@@ -0,0 +1,56 @@
+"""
+The early stop in extract_and_analyze must not change the score: a section
+that only appears on a later page still counts.
+"""
+import io
+
+from reportlab.pdfgen import canvas
+
+from modules import analysis
+from modules.parser import extract_text_with_info
+from modules.roles import RoleScorer
+
+SCORER = RoleScorer({"Python Developer": {"python", "flask", "django", "sql"}})
+
+PAGES = [
+    ["Jane Roe", "jane@example.com", "Objective: backend work", "Skills", "python, flask, django, sql",
+     "Experience: 3 years at Acme", "Education: B.Tech, XYZ College"],
+    ["Experience (continued)", "Built REST services and reporting jobs"],
+    ["Project: resume analyzer", "Certificate: cloud fundamentals", "Achievement: hackathon winner",
+     "Hobbies: chess", "Interests: open source", "Total 5 years of backend work"],
+]
+
+
+def _pdf(pages):
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    for lines in pages:
+        y = 800
+        for line in lines:
+            c.drawString(50, y, line)
+            y -= 15
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def test_sections_on_last_page_are_scored(monkeypatch):
+    # One stable page is enough for the old core-sections rule to stop after page 2
+    monkeypatch.setattr(analysis, "STABLE_PAGES", 1)
+    data = _pdf(PAGES)
+
+    full_text, _ = extract_text_with_info(data, "application/pdf")
+    full = analysis.build_analysis(full_text, SCORER)
+
+    text, results = analysis.extract_and_analyze(data, "application/pdf", SCORER)
+    assert results["extraction"]["pages_read"] == len(PAGES)
+    assert results["resume_score"] == full["resume_score"] == 94
+    assert results["experience"] == full["experience"] == 5
+    assert "Certificate" in text
+
+
+def test_scan_converges_once_every_section_is_settled():
+    scan = analysis.ResumeScan()
+    pages = ["\n".join(lines) for lines in PAGES] + ["Appendix: portfolio screenshots"] * 3
+    stops = [scan.feed(page) for page in pages]
+    assert stops.index(True) == len(PAGES) + analysis.STABLE_PAGES - 1
@@ -0,0 +1,56 @@
+"""
+PDF extraction on the production upload path: stored files are passed to
+the parsers as a read-only mmap (storage.mapped_file), not as bytes.
+"""
+import io
+
+from PIL import Image
+from reportlab.pdfgen import canvas
+
+from modules import parser
+from modules.storage import mapped_file
+
+
+def _text_pdf():
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    y = 800
+    for line in ["Jane Roe", "jane@example.com", "Skills", "python, flask, sql", "Education", "B.Tech"]:
+        c.drawString(50, y, line)
+        y -= 15
+    c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def _scan_pdf():
+    buf = io.BytesIO()
+    Image.new("RGB", (200, 280), "white").save(buf, "PDF")
+    return buf.getvalue()
+
+
+def _write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_mapped_text_pdf_is_sniffed(tmp_path):
+    path = _write(tmp_path, "text.pdf", _text_pdf())
+    with mapped_file(path) as source:
+        text, info = parser.extract_text_with_info(source, "application/pdf")
+    assert "Jane Roe" in text
+    assert info["producer"].startswith("ReportLab")
+    assert info["pages"] == 1
+    assert info["engine"] in info["seconds"]
+    assert len(info["seconds"]) == 1   # one engine, chosen from the sniff
+
+
+def test_mapped_scan_skips_both_engines(tmp_path):
+    path = _write(tmp_path, "scan.pdf", _scan_pdf())
+    with mapped_file(path) as source:
+        text, info = parser.extract_text_with_info(source, "application/pdf")
+    assert text == ""
+    assert info["producer"] is not None
+    assert info["pages"] == 1
+    assert info["seconds"] == {}   # no text layer: neither engine ran
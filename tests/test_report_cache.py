@@ -0,0 +1,43 @@
+"""
+ReportCache keeps its size accounting in memory: puts never list the
+cache directory, and the cap and LRU order survive a restart.
+"""
+import os
+
+from modules import report
+from modules.report import ReportCache
+
+
+def _files(root):
+    return sorted(name for name in os.listdir(root) if name.endswith(".pdf"))
+
+
+def test_put_evicts_lru_without_listing_the_directory(tmp_path, monkeypatch):
+    cache = ReportCache(str(tmp_path), max_bytes=350)
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(report.os, "scandir", lambda *a: scans.append(a) or real_scandir(*a))
+
+    for resume_id in range(1, 4):
+        cache.put(resume_id, "a", b"x" * 100)
+    cache.open(1, "a").close()          # 1 is now the most recently used
+    cache.put(4, "a", b"x" * 100)
+
+    assert scans == []
+    assert _files(tmp_path) == ["1-a.pdf", "3-a.pdf", "4-a.pdf"]
+
+
+def test_new_fingerprint_replaces_old_file_and_restart_keeps_total(tmp_path):
+    cache = ReportCache(str(tmp_path), max_bytes=1000)
+    cache.put(7, "old", b"x" * 300)
+    cache.put(7, "new", b"x" * 300)
+    cache.put(8, "a", b"x" * 300)
+    assert _files(tmp_path) == ["7-new.pdf", "8-a.pdf"]
+
+    restarted = ReportCache(str(tmp_path), max_bytes=1000)
+    restarted.put(9, "a", b"x" * 500)
+    assert _files(tmp_path) == ["8-a.pdf", "9-a.pdf"]
+
+    restarted.discard(8)
+    assert _files(tmp_path) == ["9-a.pdf"]
+    assert restarted.open(8, "a") is None